@@ -11,7 +11,7 @@ from alembic import context
 
 # Import app config and models
 from app.config import settings
-from app.models.appointments import metadata
+from app.models import metadata
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
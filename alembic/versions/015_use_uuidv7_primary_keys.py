@@ -0,0 +1,45 @@
+"""Use time-ordered UUIDv7 primary keys
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-02-20
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+from app.models._base import UUID_GENERATE_V7_SQL
+
+# revision identifiers, used by Alembic.
+revision = "015"
+down_revision = "014"
+branch_labels = None
+depends_on = None
+
+# Tables whose insert-heavy primary keys switch to UUIDv7
+UUIDV7_TABLES = (
+    "users",
+    "pharmacies",
+    "pharmacy_locations",
+    "pharmacy_hours",
+    "pharmacy_staff",
+    "push_tokens",
+)
+
+
+def upgrade() -> None:
+    """Create uuid_generate_v7() and use it as the default for primary keys."""
+    op.execute(UUID_GENERATE_V7_SQL)
+
+    for table in UUIDV7_TABLES:
+        op.alter_column(table, "id", server_default=sa.text("uuid_generate_v7()"))
+
+
+def downgrade() -> None:
+    """Restore gen_random_uuid() defaults and drop uuid_generate_v7()."""
+    # Note: rows created while on v7 keep their IDs; v4 and v7 values coexist safely
+    for table in UUIDV7_TABLES:
+        op.alter_column(table, "id", server_default=sa.text("gen_random_uuid()"))
+
+    op.execute("DROP FUNCTION IF EXISTS uuid_generate_v7()")
@@ -0,0 +1,49 @@
+"""Add composite indexes for admin listings and active push tokens
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-02-20
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "016"
+down_revision = "015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create composite and partial indexes."""
+    # Admin user listing: equality filters followed by the sort column
+    op.create_index(
+        "ix_users_role_active_created",
+        "users",
+        ["role", "is_active", "created_at"],
+    )
+
+    # Admin pharmacy listing
+    op.create_index(
+        "ix_pharmacies_verified_active_created",
+        "pharmacies",
+        ["is_verified", "is_active", "created_at"],
+    )
+
+    # Active tokens for a user
+    op.create_index(
+        "ix_push_tokens_user_active",
+        "push_tokens",
+        ["user_id"],
+        postgresql_where=sa.text("is_active"),
+    )
+
+
+def downgrade() -> None:
+    """Drop composite and partial indexes."""
+    op.drop_index("ix_push_tokens_user_active", table_name="push_tokens")
+    op.drop_index("ix_pharmacies_verified_active_created", table_name="pharmacies")
+    op.drop_index("ix_users_role_active_created", table_name="users")
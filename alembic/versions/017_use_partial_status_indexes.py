@@ -0,0 +1,64 @@
+"""Replace full boolean status indexes with partial indexes
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-02-20
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "017"
+down_revision = "016"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Swap is_active/is_verified B-tree indexes for partial ones."""
+    # Pharmacies: index only the active / verified rows
+    op.drop_index("idx_pharmacies_active", table_name="pharmacies")
+    op.drop_index("idx_pharmacies_verified", table_name="pharmacies")
+    op.create_index(
+        "ix_pharmacies_active_part",
+        "pharmacies",
+        ["id"],
+        postgresql_where=sa.text("is_active"),
+    )
+    op.create_index(
+        "ix_pharmacies_verified_part",
+        "pharmacies",
+        ["id"],
+        postgresql_where=sa.text("is_verified"),
+    )
+
+    # Push tokens: superseded by the partial ix_push_tokens_user_active index
+    op.drop_index("idx_push_tokens_is_active", table_name="push_tokens")
+
+    # Users: active accounts by role
+    op.create_index(
+        "ix_users_active_role",
+        "users",
+        ["role"],
+        postgresql_where=sa.text("is_active"),
+    )
+
+    # Refresh planner statistics for the new indexes
+    op.execute("ANALYZE pharmacies")
+    op.execute("ANALYZE push_tokens")
+    op.execute("ANALYZE users")
+
+
+def downgrade() -> None:
+    """Restore full is_active/is_verified indexes."""
+    op.drop_index("ix_users_active_role", table_name="users")
+
+    op.create_index("idx_push_tokens_is_active", "push_tokens", ["is_active"])
+
+    op.drop_index("ix_pharmacies_verified_part", table_name="pharmacies")
+    op.drop_index("ix_pharmacies_active_part", table_name="pharmacies")
+    op.create_index("idx_pharmacies_verified", "pharmacies", ["is_verified"])
+    op.create_index("idx_pharmacies_active", "pharmacies", ["is_active"])
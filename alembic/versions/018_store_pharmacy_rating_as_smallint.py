@@ -0,0 +1,51 @@
+"""Store pharmacy rating as fixed-point smallint
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-02-20
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "018"
+down_revision = "017"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace numeric rating with rating_x10 (tenths of a star)."""
+    op.add_column(
+        "pharmacies",
+        sa.Column("rating_x10", sa.SmallInteger(), nullable=False, server_default=sa.text("0")),
+    )
+
+    # Migrate existing ratings
+    op.execute("UPDATE pharmacies SET rating_x10 = COALESCE(round(rating * 10), 0)")
+
+    op.create_check_constraint(
+        "pharmacies_rating_x10_check", "pharmacies", "rating_x10 BETWEEN 0 AND 100"
+    )
+    op.drop_column("pharmacies", "rating")
+
+
+def downgrade() -> None:
+    """Restore numeric rating column."""
+    op.add_column(
+        "pharmacies",
+        sa.Column(
+            "rating",
+            sa.Numeric(precision=2, scale=1),
+            nullable=True,
+            server_default=sa.text("0.0"),
+        ),
+    )
+
+    op.execute("UPDATE pharmacies SET rating = rating_x10 / 10.0")
+
+    op.drop_constraint("pharmacies_rating_x10_check", "pharmacies", type_="check")
+    op.drop_column("pharmacies", "rating_x10")
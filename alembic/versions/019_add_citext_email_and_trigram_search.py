@@ -0,0 +1,47 @@
+"""Use CITEXT for user email and add trigram search indexes
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-02-20
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "019"
+down_revision = "018"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Convert users.email to CITEXT and create GIN trigram indexes."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS "citext"')
+    op.execute('CREATE EXTENSION IF NOT EXISTS "pg_trgm"')
+
+    # Case-insensitive email without LOWER() wrappers
+    op.execute("ALTER TABLE users ALTER COLUMN email TYPE CITEXT")
+
+    # Substring (ILIKE '%term%') search indexes
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_users_email_trgm "
+        "ON users USING gin ((email::text) gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_users_full_name_trgm "
+        "ON users USING gin (full_name gin_trgm_ops)"
+    )
+    # Declared on the clinics table but never created by a migration
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_clinics_name_trgm ON clinics USING gin (name gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Drop trigram indexes and restore TEXT email."""
+    op.execute("DROP INDEX IF EXISTS idx_clinics_name_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_users_full_name_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_users_email_trgm")
+
+    op.execute("ALTER TABLE users ALTER COLUMN email TYPE TEXT")
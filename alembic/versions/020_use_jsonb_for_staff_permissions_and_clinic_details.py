@@ -0,0 +1,63 @@
+"""Use JSONB for pharmacy staff permissions and clinic details
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-02-20
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "020"
+down_revision = "019"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Convert JSON columns to JSONB and index staff permissions."""
+    op.alter_column(
+        "pharmacy_staff",
+        "permissions",
+        type_=postgresql.JSONB(),
+        postgresql_using="permissions::jsonb",
+        server_default=sa.text("'{}'::jsonb"),
+    )
+    op.create_index(
+        "ix_pharmacy_staff_permissions_gin",
+        "pharmacy_staff",
+        ["permissions"],
+        postgresql_using="gin",
+    )
+
+    for column in ("contacts", "opening_hours"):
+        op.alter_column(
+            "clinics",
+            column,
+            type_=postgresql.JSONB(),
+            postgresql_using=f"{column}::jsonb",
+        )
+
+
+def downgrade() -> None:
+    """Restore JSON columns."""
+    for column in ("contacts", "opening_hours"):
+        op.alter_column(
+            "clinics",
+            column,
+            type_=postgresql.JSON(),
+            postgresql_using=f"{column}::json",
+        )
+
+    op.drop_index("ix_pharmacy_staff_permissions_gin", table_name="pharmacy_staff")
+    op.alter_column(
+        "pharmacy_staff",
+        "permissions",
+        type_=postgresql.JSON(),
+        postgresql_using="permissions::json",
+        server_default=None,
+    )
@@ -0,0 +1,64 @@
+"""Use native enum types for appointment status and source
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-02-20
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "021"
+down_revision = "020"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Convert appointments.status/source from TEXT to ENUM types."""
+    op.execute(
+        "CREATE TYPE appointment_status AS ENUM "
+        "('scheduled', 'confirmed', 'rescheduled', 'cancelled', 'completed', 'no_show')"
+    )
+    op.execute(
+        "CREATE TYPE appointment_source AS ENUM ('patient_app', 'doctor_app', 'admin_panel', 'api')"
+    )
+
+    # The enum type enforces the allowed values
+    op.drop_constraint("appointments_status_check", "appointments", type_="check")
+
+    # Defaults must be dropped before the type change and restored afterwards
+    op.execute("ALTER TABLE appointments ALTER COLUMN status DROP DEFAULT")
+    op.execute(
+        "ALTER TABLE appointments ALTER COLUMN status TYPE appointment_status "
+        "USING status::appointment_status"
+    )
+    op.execute("ALTER TABLE appointments ALTER COLUMN status SET DEFAULT 'scheduled'")
+
+    op.execute("ALTER TABLE appointments ALTER COLUMN source DROP DEFAULT")
+    op.execute(
+        "ALTER TABLE appointments ALTER COLUMN source TYPE appointment_source "
+        "USING source::appointment_source"
+    )
+    op.execute("ALTER TABLE appointments ALTER COLUMN source SET DEFAULT 'patient_app'")
+
+
+def downgrade() -> None:
+    """Restore TEXT columns with the status CHECK constraint."""
+    op.execute("ALTER TABLE appointments ALTER COLUMN source DROP DEFAULT")
+    op.execute("ALTER TABLE appointments ALTER COLUMN source TYPE TEXT USING source::text")
+    op.execute("ALTER TABLE appointments ALTER COLUMN source SET DEFAULT 'patient_app'")
+
+    op.execute("ALTER TABLE appointments ALTER COLUMN status DROP DEFAULT")
+    op.execute("ALTER TABLE appointments ALTER COLUMN status TYPE TEXT USING status::text")
+    op.execute("ALTER TABLE appointments ALTER COLUMN status SET DEFAULT 'scheduled'")
+
+    op.create_check_constraint(
+        "appointments_status_check",
+        "appointments",
+        "status IN ('scheduled', 'confirmed', 'rescheduled', 'cancelled', 'completed', 'no_show')",
+    )
+
+    op.execute("DROP TYPE appointment_source")
+    op.execute("DROP TYPE appointment_status")
@@ -0,0 +1,29 @@
+"""Add admin_metrics materialized view
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-02-20
+
+"""
+
+from alembic import op
+from app.models.admin_metrics import ADMIN_METRICS_VIEW_SQL
+
+# revision identifiers, used by Alembic.
+revision = "022"
+down_revision = "021"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the single-row admin dashboard counters view."""
+    op.execute(f"CREATE MATERIALIZED VIEW admin_metrics AS {ADMIN_METRICS_VIEW_SQL}")
+
+    # Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute("CREATE UNIQUE INDEX idx_admin_metrics_id ON admin_metrics (id)")
+
+
+def downgrade() -> None:
+    """Drop the admin dashboard counters view."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS admin_metrics")
@@ -0,0 +1,37 @@
+"""Generate pharmacy_locations.geo from latitude/longitude
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-02-20
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "023"
+down_revision = "022"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace the application-maintained geo column with a generated one."""
+    # Dropping the column also drops idx_pharmacy_geo
+    op.execute("ALTER TABLE pharmacy_locations DROP COLUMN geo")
+    op.execute(
+        """
+        ALTER TABLE pharmacy_locations
+        ADD COLUMN geo GEOGRAPHY(Point, 4326)
+        GENERATED ALWAYS AS (ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)::geography) STORED
+        """
+    )
+    op.execute("CREATE INDEX idx_pharmacy_geo ON pharmacy_locations USING GIST (geo)")
+
+
+def downgrade() -> None:
+    """Restore the plain geo column populated from latitude/longitude."""
+    op.execute("ALTER TABLE pharmacy_locations DROP COLUMN geo")
+    op.execute("ALTER TABLE pharmacy_locations ADD COLUMN geo GEOGRAPHY(Point, 4326)")
+    op.execute("UPDATE pharmacy_locations SET geo = ST_MakePoint(longitude, latitude)")
+    op.execute("CREATE INDEX idx_pharmacy_geo ON pharmacy_locations USING GIST (geo)")
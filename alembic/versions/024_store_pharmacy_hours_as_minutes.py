@@ -0,0 +1,84 @@
+"""Store pharmacy opening hours as minute-of-day
+
+Revision ID: 024
+Revises: 023
+Create Date: 2026-02-20
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "024"
+down_revision = "023"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace TIME open/close columns with SMALLINT minutes since midnight."""
+    op.add_column("pharmacy_hours", sa.Column("open_min", sa.SmallInteger(), nullable=True))
+    op.add_column("pharmacy_hours", sa.Column("close_min", sa.SmallInteger(), nullable=True))
+    op.execute(
+        """
+        UPDATE pharmacy_hours
+        SET open_min = EXTRACT(HOUR FROM open_time) * 60 + EXTRACT(MINUTE FROM open_time),
+            close_min = EXTRACT(HOUR FROM close_time) * 60 + EXTRACT(MINUTE FROM close_time)
+        """
+    )
+    op.alter_column("pharmacy_hours", "open_min", nullable=False)
+    op.alter_column("pharmacy_hours", "close_min", nullable=False)
+    op.drop_column("pharmacy_hours", "open_time")
+    op.drop_column("pharmacy_hours", "close_time")
+
+    op.create_check_constraint(
+        "pharmacy_hours_open_min_check", "pharmacy_hours", "open_min BETWEEN 0 AND 1439"
+    )
+    op.create_check_constraint(
+        "pharmacy_hours_close_min_check", "pharmacy_hours", "close_min BETWEEN 0 AND 1439"
+    )
+    op.create_index(
+        "ix_pharmacy_hours_open_lookup",
+        "pharmacy_hours",
+        ["pharmacy_id", "day_of_week", "open_min", "close_min"],
+        postgresql_where=sa.text("NOT is_closed"),
+    )
+
+    # Read-only TIME view for consumers that query the table directly
+    op.execute(
+        """
+        CREATE VIEW pharmacy_hours_time AS
+        SELECT
+            id,
+            pharmacy_id,
+            day_of_week,
+            make_time(open_min / 60, open_min % 60, 0) AS open_time,
+            make_time(close_min / 60, close_min % 60, 0) AS close_time,
+            is_closed
+        FROM pharmacy_hours
+        """
+    )
+
+
+def downgrade() -> None:
+    """Restore TIME open/close columns."""
+    op.execute("DROP VIEW IF EXISTS pharmacy_hours_time")
+    op.drop_index("ix_pharmacy_hours_open_lookup", table_name="pharmacy_hours")
+    op.drop_constraint("pharmacy_hours_close_min_check", "pharmacy_hours", type_="check")
+    op.drop_constraint("pharmacy_hours_open_min_check", "pharmacy_hours", type_="check")
+
+    op.add_column("pharmacy_hours", sa.Column("open_time", sa.Time(), nullable=True))
+    op.add_column("pharmacy_hours", sa.Column("close_time", sa.Time(), nullable=True))
+    op.execute(
+        """
+        UPDATE pharmacy_hours
+        SET open_time = make_time(open_min / 60, open_min % 60, 0),
+            close_time = make_time(close_min / 60, close_min % 60, 0)
+        """
+    )
+    op.alter_column("pharmacy_hours", "open_time", nullable=False)
+    op.alter_column("pharmacy_hours", "close_time", nullable=False)
+    op.drop_column("pharmacy_hours", "open_min")
+    op.drop_column("pharmacy_hours", "close_min")
@@ -0,0 +1,32 @@
+"""Add generated clinics.location geography with GiST index
+
+Revision ID: 025
+Revises: 024
+Create Date: 2026-02-20
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "025"
+down_revision = "024"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add clinics.location generated from latitude/longitude and index it."""
+    op.execute(
+        """
+        ALTER TABLE clinics
+        ADD COLUMN location GEOGRAPHY(Point, 4326)
+        GENERATED ALWAYS AS (ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)::geography) STORED
+        """
+    )
+    op.execute("CREATE INDEX idx_clinics_location ON clinics USING GIST (location)")
+
+
+def downgrade() -> None:
+    """Drop clinics.location (and with it idx_clinics_location)."""
+    op.execute("ALTER TABLE clinics DROP COLUMN location")
@@ -0,0 +1,53 @@
+"""Add partial indexes for live clinics and current doctor-clinic associations
+
+Revision ID: 026
+Revises: 025
+Create Date: 2026-02-20
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "026"
+down_revision = "025"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index the rows clinic reads actually touch."""
+    # Clinic listings skip soft-deleted rows and sort by name
+    op.create_index(
+        "ix_clinics_live_name",
+        "clinics",
+        ["name"],
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+
+    # Current associations by clinic / by doctor, primary first
+    op.create_index(
+        "ix_doctor_clinics_clinic_current",
+        "doctor_clinics",
+        ["clinic_id", sa.text("is_primary DESC")],
+        postgresql_where=sa.text("end_date IS NULL AND status = 'active'"),
+    )
+    op.create_index(
+        "ix_doctor_clinics_doctor_current",
+        "doctor_clinics",
+        ["doctor_id", sa.text("is_primary DESC")],
+        postgresql_where=sa.text("end_date IS NULL AND status = 'active'"),
+    )
+
+    # Refresh planner statistics for the new indexes
+    op.execute("ANALYZE clinics")
+    op.execute("ANALYZE doctor_clinics")
+
+
+def downgrade() -> None:
+    """Drop the partial read indexes."""
+    op.drop_index("ix_doctor_clinics_doctor_current", table_name="doctor_clinics")
+    op.drop_index("ix_doctor_clinics_clinic_current", table_name="doctor_clinics")
+    op.drop_index("ix_clinics_live_name", table_name="clinics")
@@ -0,0 +1,39 @@
+"""Extend the live clinic name index with id for keyset pagination
+
+Revision ID: 027
+Revises: 026
+Create Date: 2026-02-20
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "027"
+down_revision = "026"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace ix_clinics_live_name (name) with (name, id)."""
+    op.create_index(
+        "ix_clinics_live_name_id",
+        "clinics",
+        ["name", "id"],
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.drop_index("ix_clinics_live_name", table_name="clinics")
+
+
+def downgrade() -> None:
+    """Restore the name-only partial index."""
+    op.create_index(
+        "ix_clinics_live_name",
+        "clinics",
+        ["name"],
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.drop_index("ix_clinics_live_name_id", table_name="clinics")
@@ -0,0 +1,38 @@
+"""Store doctors.languages_spoken as JSONB with a GIN index
+
+Revision ID: 028
+Revises: 027
+Create Date: 2026-02-20
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "028"
+down_revision = "027"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Convert languages_spoken to JSONB and index it for ?| lookups."""
+    op.execute(
+        "ALTER TABLE doctors ALTER COLUMN languages_spoken TYPE JSONB "
+        "USING languages_spoken::jsonb"
+    )
+    op.create_index(
+        "ix_doctors_languages_spoken",
+        "doctors",
+        ["languages_spoken"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Restore the plain JSON column."""
+    op.drop_index("ix_doctors_languages_spoken", table_name="doctors")
+    op.execute(
+        "ALTER TABLE doctors ALTER COLUMN languages_spoken TYPE JSON "
+        "USING languages_spoken::json"
+    )
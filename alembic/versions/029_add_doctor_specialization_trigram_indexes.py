@@ -0,0 +1,35 @@
+"""Add trigram indexes for doctor specialization search
+
+Revision ID: 029
+Revises: 028
+Create Date: 2026-02-20
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "029"
+down_revision = "028"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create GIN trigram indexes for ILIKE '%term%' specialization filters."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS "pg_trgm"')
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_doctors_specialization_trgm "
+        "ON doctors USING gin (specialization gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_doctors_sub_specialization_trgm "
+        "ON doctors USING gin (sub_specialization gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Drop the trigram indexes."""
+    op.execute("DROP INDEX IF EXISTS ix_doctors_sub_specialization_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_doctors_specialization_trgm")
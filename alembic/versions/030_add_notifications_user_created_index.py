@@ -0,0 +1,25 @@
+"""Add (user_id, created_at) index on notifications
+
+Revision ID: 030
+Revises: 029
+Create Date: 2026-02-20
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "030"
+down_revision = "029"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index per-user notification windows used by stats and listing."""
+    op.create_index("idx_notifications_user_created_at", "notifications", ["user_id", "created_at"])
+
+
+def downgrade() -> None:
+    """Drop the per-user created_at index."""
+    op.drop_index("idx_notifications_user_created_at", table_name="notifications")
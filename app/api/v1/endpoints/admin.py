@@ -6,9 +6,16 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
-from sqlalchemy import func, select
-
-from app.dependencies import CacheManagerDep, DatabaseSession, get_current_user
+from sqlalchemy import Select, Text, cast, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.responses import ORJSONResponse
+from app.dependencies import (
+    AsyncCacheManagerDep,
+    CacheManagerDep,
+    DatabaseSession,
+    get_current_user,
+)
 from app.models.appointments import appointments
 from app.models.notifications import notifications as notification_table
 from app.models.pharmacies import pharmacies
@@ -21,6 +28,8 @@ from app.schemas.admin import (
     NotificationLogListResponse,
     PharmacyVerifyResponse,
 )
+from app.schemas.appointments import AppointmentStatus
+from app.services.admin_metrics_service import AdminMetricsService
 from app.services.notification_service import NotificationService
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
@@ -47,9 +56,41 @@ async def require_admin(current_user: dict = Depends(get_current_user)) -> dict:
     return current_user
 
 
+async def _fetch_page(
+    db: AsyncSession, query: Select, page: int, page_size: int
+) -> tuple[list[dict[str, Any]], int]:
+    """
+    Execute a paginated query, reading the total from a COUNT(*) OVER () column.
+
+    Args:
+        db: Database session
+        query: Filtered and ordered select statement
+        page: Page number
+        page_size: Items per page
+
+    Returns:
+        Tuple of (row dicts for the page, total matching rows)
+    """
+    offset = (page - 1) * page_size
+    paged = query.add_columns(func.count().over().label("_total")).offset(offset).limit(page_size)
+    rows = (await db.execute(paged)).mappings().all()
+
+    if rows:
+        total = rows[0]["_total"]
+    elif offset:
+        # Page past the end: no row carries the window count, fall back to COUNT
+        count_query = select(func.count()).select_from(query.order_by(None).subquery())
+        total = (await db.execute(count_query)).scalar_one()
+    else:
+        total = 0
+
+    return [{k: v for k, v in row.items() if k != "_total"} for row in rows], total
+
+
 @router.get(
     "/users",
-    response_model=AdminUserListResponse,
+    response_class=ORJSONResponse,
+    responses={200: {"model": AdminUserListResponse}},
     summary="List all users (admin only)",
 )
 async def list_all_users(
@@ -61,7 +102,7 @@ async def list_all_users(
     role: str | None = Query(None, description="Filter by role"),
     is_active: bool | None = Query(None, description="Filter by active status"),
     search: str | None = Query(None, description="Search by name or email"),
-) -> AdminUserListResponse:
+) -> ORJSONResponse:
     """
     Get paginated list of all users with filtering.
 
@@ -82,50 +123,41 @@ async def list_all_users(
     """
     # Build query
     query = select(users)
-    count_query = select(func.count()).select_from(users)
 
     # Apply filters
     if role:
         query = query.where(users.c.role == role)
-        count_query = count_query.where(users.c.role == role)
 
     if is_active is not None:
         query = query.where(users.c.is_active == is_active)
-        count_query = count_query.where(users.c.is_active == is_active)
 
     if search:
         search_pattern = f"%{search}%"
         query = query.where(
-            (users.c.full_name.ilike(search_pattern)) | (users.c.email.ilike(search_pattern))
+            (users.c.full_name.ilike(search_pattern))
+            | (cast(users.c.email, Text).ilike(search_pattern))
         )
-        count_query = count_query.where(
-            (users.c.full_name.ilike(search_pattern)) | (users.c.email.ilike(search_pattern))
-        )
-
-    # Get total count
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
 
-    # Apply pagination
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(users.c.created_at.desc())
+    # Execute paginated query (total comes back with the page rows)
+    user_list, total = await _fetch_page(
+        db, query.order_by(users.c.created_at.desc()), page, page_size
+    )
 
-    # Execute query
-    result = await db.execute(query)
-    user_list = [dict(row) for row in result.mappings().all()]
-
-    return AdminUserListResponse(
-        users=user_list,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=(total + page_size - 1) // page_size,
+    return ORJSONResponse(
+        {
+            "users": user_list,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": (total + page_size - 1) // page_size,
+        }
     )
 
 
 @router.get(
     "/appointments",
-    response_model=AdminAppointmentListResponse,
+    response_class=ORJSONResponse,
+    responses={200: {"model": AdminAppointmentListResponse}},
     summary="List all appointments (admin only)",
 )
 async def list_all_appointments(
@@ -133,12 +165,14 @@ async def list_all_appointments(
     admin_user: dict = Depends(require_admin),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    status_filter: str | None = Query(None, alias="status", description="Filter by status"),
+    status_filter: AppointmentStatus | None = Query(
+        None, alias="status", description="Filter by status"
+    ),
     patient_id: UUID | None = Query(None, description="Filter by patient ID"),
     doctor_id: UUID | None = Query(None, description="Filter by doctor ID"),
     from_date: str | None = Query(None, description="Filter from date (ISO format)"),
     to_date: str | None = Query(None, description="Filter to date (ISO format)"),
-) -> AdminAppointmentListResponse:
+) -> ORJSONResponse:
     """
     Get paginated list of all appointments across all users.
 
@@ -160,49 +194,38 @@ async def list_all_appointments(
     """
     # Build query
     query = select(appointments)
-    count_query = select(func.count()).select_from(appointments)
 
     # Apply filters
     if status_filter:
         query = query.where(appointments.c.status == status_filter)
-        count_query = count_query.where(appointments.c.status == status_filter)
 
     if patient_id:
         query = query.where(appointments.c.patient_id == patient_id)
-        count_query = count_query.where(appointments.c.patient_id == patient_id)
 
     if doctor_id:
         query = query.where(appointments.c.doctor_id == doctor_id)
-        count_query = count_query.where(appointments.c.doctor_id == doctor_id)
 
     if from_date:
         from_datetime = datetime.fromisoformat(from_date)
         query = query.where(appointments.c.appointment_at >= from_datetime)
-        count_query = count_query.where(appointments.c.appointment_at >= from_datetime)
 
     if to_date:
         to_datetime = datetime.fromisoformat(to_date)
         query = query.where(appointments.c.appointment_at <= to_datetime)
-        count_query = count_query.where(appointments.c.appointment_at <= to_datetime)
 
-    # Get total count
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
-
-    # Apply pagination
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(appointments.c.appointment_at.desc())
+    # Execute paginated query (total comes back with the page rows)
+    appointment_list, total = await _fetch_page(
+        db, query.order_by(appointments.c.appointment_at.desc()), page, page_size
+    )
 
-    # Execute query
-    result = await db.execute(query)
-    appointment_list = [dict(row) for row in result.mappings().all()]
-
-    return AdminAppointmentListResponse(
-        appointments=appointment_list,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=(total + page_size - 1) // page_size,
+    return ORJSONResponse(
+        {
+            "appointments": appointment_list,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": (total + page_size - 1) // page_size,
+        }
     )
 
 
@@ -389,73 +412,18 @@ async def get_admin_metrics(
         admin_user: Authenticated admin user
 
     Returns:
-        System metrics including user, appointment, pharmacy, and notification stats
+        System metrics including user, appointment, pharmacy, and notification stats,
+        at most ``ADMIN_METRICS_REFRESH_SECONDS`` old
     """
-    # User metrics
-    total_users_result = await db.execute(select(func.count()).select_from(users))
-    total_users = total_users_result.scalar_one()
-
-    active_users_result = await db.execute(
-        select(func.count()).select_from(users).where(users.c.is_active)
-    )
-    active_users = active_users_result.scalar_one()
-
-    # Appointment metrics
-    total_appointments_result = await db.execute(select(func.count()).select_from(appointments))
-    total_appointments = total_appointments_result.scalar_one()
-
-    pending_appointments_result = await db.execute(
-        select(func.count()).select_from(appointments).where(appointments.c.status == "pending")
-    )
-    pending_appointments = pending_appointments_result.scalar_one()
-
-    confirmed_appointments_result = await db.execute(
-        select(func.count()).select_from(appointments).where(appointments.c.status == "confirmed")
-    )
-    confirmed_appointments = confirmed_appointments_result.scalar_one()
-
-    # Pharmacy metrics
-    total_pharmacies_result = await db.execute(select(func.count()).select_from(pharmacies))
-    total_pharmacies = total_pharmacies_result.scalar_one()
-
-    verified_pharmacies_result = await db.execute(
-        select(func.count()).select_from(pharmacies).where(pharmacies.c.is_verified)
-    )
-    verified_pharmacies = verified_pharmacies_result.scalar_one()
-
-    active_pharmacies_result = await db.execute(
-        select(func.count()).select_from(pharmacies).where(pharmacies.c.is_active)
-    )
-    active_pharmacies = active_pharmacies_result.scalar_one()
-
-    # Notification metrics (last 24 hours)
-    yesterday = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
-    notifications_sent_today_result = await db.execute(
-        select(func.count())
-        .select_from(notification_table)
-        .where(notification_table.c.sent_at >= yesterday)
-    )
-    notifications_sent_today = notifications_sent_today_result.scalar_one()
-
-    return AdminMetricsResponse(
-        users={"total": total_users, "active": active_users},
-        appointments={
-            "total": total_appointments,
-            "pending": pending_appointments,
-            "confirmed": confirmed_appointments,
-        },
-        pharmacies={
-            "total": total_pharmacies,
-            "verified": verified_pharmacies,
-            "active": active_pharmacies,
-        },
-        notifications={"sent_today": notifications_sent_today},
-    )
+    # Counters come from the admin_metrics materialized view, refreshed in the
+    # background (see AdminMetricsService.run_refresh_loop)
+    return await AdminMetricsService(db).get_metrics()
 
 
 @router.get(
     "/notifications/logs",
-    response_model=NotificationLogListResponse,
+    response_class=ORJSONResponse,
+    responses={200: {"model": NotificationLogListResponse}},
     summary="Get notification audit logs (admin only)",
 )
 async def get_notification_logs(
@@ -466,7 +434,7 @@ async def get_notification_logs(
     user_id: UUID | None = Query(None, description="Filter by user ID"),
     from_date: str | None = Query(None, description="Filter from date (ISO format)"),
     to_date: str | None = Query(None, description="Filter to date (ISO format)"),
-) -> NotificationLogListResponse:
+) -> ORJSONResponse:
     """
     Get paginated notification history with audit information.
 
@@ -486,41 +454,32 @@ async def get_notification_logs(
     """
     # Build query
     query = select(notification_table)
-    count_query = select(func.count()).select_from(notification_table)
 
     # Apply filters
     if user_id:
         query = query.where(notification_table.c.user_id == user_id)
-        count_query = count_query.where(notification_table.c.user_id == user_id)
 
     if from_date:
         from_datetime = datetime.fromisoformat(from_date)
         query = query.where(notification_table.c.sent_at >= from_datetime)
-        count_query = count_query.where(notification_table.c.sent_at >= from_datetime)
 
     if to_date:
         to_datetime = datetime.fromisoformat(to_date)
         query = query.where(notification_table.c.sent_at <= to_datetime)
-        count_query = count_query.where(notification_table.c.sent_at <= to_datetime)
 
-    # Get total count
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
-
-    # Apply pagination
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(notification_table.c.sent_at.desc())
+    # Execute paginated query (total comes back with the page rows)
+    logs, total = await _fetch_page(
+        db, query.order_by(notification_table.c.sent_at.desc()), page, page_size
+    )
 
-    # Execute query
-    result = await db.execute(query)
-    logs = [dict(row) for row in result.mappings().all()]
-
-    return NotificationLogListResponse(
-        logs=logs,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=(total + page_size - 1) // page_size,
+    return ORJSONResponse(
+        {
+            "logs": logs,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": (total + page_size - 1) // page_size,
+        }
     )
 
 
@@ -625,6 +584,7 @@ class BroadcastNotificationResponse(BaseModel):
 async def broadcast_notification(
     request: BroadcastNotificationRequest,
     db: DatabaseSession,
+    cache_manager: AsyncCacheManagerDep,
     admin_user: dict = Depends(require_admin),
 ) -> BroadcastNotificationResponse:
     """
@@ -635,6 +595,7 @@ async def broadcast_notification(
     Args:
         request: Broadcast notification details
         db: Database session
+        cache_manager: Cache manager holding users' token lists
         admin_user: Authenticated admin user
 
     Returns:
@@ -651,29 +612,24 @@ async def broadcast_notification(
 
     # Get user IDs
     result = await db.execute(query)
-    user_ids = [str(row[0]) for row in result.all()]
+    user_ids = result.scalars().all()
 
     total_users = len(user_ids)
-    total_success = 0
-    total_failure = 0
-
-    # Send notification to each user
-    for user_id in user_ids:
-        try:
-            success, failure = await NotificationService.send_to_user(
-                db=db,
-                user_id=user_id,
-                title=request.title,
-                body=request.body,
-                data=request.data or {},
-                notification_type="system_announcement",
-                priority="normal",
-            )
-            total_success += success
-            total_failure += failure
-        except Exception:
-            total_failure += 1
-            continue
+
+    # One bulk send: tokens fetched in one query, FCM calls batched per 500 tokens
+    try:
+        total_success, total_failure = await NotificationService.send_bulk(
+            db=db,
+            user_ids=user_ids,
+            title=request.title,
+            body=request.body,
+            data=request.data or {},
+            notification_type="system_announcement",
+            priority="normal",
+            cache=cache_manager,
+        )
+    except Exception:
+        total_success, total_failure = 0, total_users
 
     return BroadcastNotificationResponse(
         success_count=total_success,
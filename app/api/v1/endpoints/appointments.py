@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Query, status
+from fastapi import APIRouter, Query, Response, status
 
 from app.dependencies import CurrentUser, DatabaseSession
 from app.schemas.appointments import (
@@ -48,7 +48,8 @@ async def create_appointment(
 
 @router.get(
     "/",
-    response_model=AppointmentListResponse,
+    response_class=Response,
+    responses={200: {"model": AppointmentListResponse}},
     status_code=status.HTTP_200_OK,
     tags=["Appointments"],
     summary="List appointments",
@@ -63,7 +64,7 @@ async def list_appointments(
     to_date: str | None = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-) -> AppointmentListResponse:
+) -> Response:
     """
     List appointments for the authenticated user with filtering.
 
@@ -94,7 +95,8 @@ async def list_appointments(
     )
 
     service = AppointmentService(db)
-    return await service.list_appointments(str(current_user["id"]), filters)
+    result = await service.list_appointments(str(current_user["id"]), filters)
+    return Response(content=result.model_dump_json(), media_type="application/json")
 
 
 @router.get(
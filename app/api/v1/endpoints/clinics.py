@@ -2,20 +2,22 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.redis_client import CacheManager
+from app.core.redis_client import AsyncCacheManager
 from app.database import get_db
-from app.dependencies import get_cache_manager
+from app.dependencies import get_async_cache_manager
 from app.schemas.clinics import (
+    CLINIC_LIST_ADAPTER,
     ClinicCreate,
     ClinicListResponse,
     ClinicResponse,
     ClinicUpdate,
 )
 from app.schemas.doctor_clinics import (
+    DOCTOR_AT_CLINIC_LIST_ADAPTER,
     ClinicForDoctorResponse,
     DoctorAtClinicResponse,
     DoctorClinicCreate,
@@ -28,11 +30,22 @@ from app.services.clinic_service import ClinicService
 router = APIRouter()
 
 
-def get_clinic_service(cache_manager: CacheManager = Depends(get_cache_manager)) -> ClinicService:
+def get_clinic_service(
+    cache_manager: AsyncCacheManager = Depends(get_async_cache_manager),
+) -> ClinicService:
     """Get clinic service instance."""
     return ClinicService(cache_manager=cache_manager)
 
 
+def _require_cursor_id(after_key: object, after_id: UUID | None) -> None:
+    """Reject a keyset cursor given only half (sort key without id or vice versa)."""
+    if (after_key is None) != (after_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor requires both the sort key and after_id",
+        )
+
+
 # ============================================================================
 # Clinic CRUD Endpoints
 # ============================================================================
@@ -75,7 +88,7 @@ async def create_clinic(
         ) from e
 
 
-@router.get("/", response_model=list[ClinicListResponse])
+@router.get("/", response_class=Response, responses={200: {"model": list[ClinicListResponse]}})
 async def list_clinics(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(20, ge=1, le=100, description="Number of records to return"),
@@ -85,6 +98,10 @@ async def list_clinics(
     ),
     name_search: str | None = Query(None, description="Search clinics by name"),
     min_rating: float | None = Query(None, ge=0, le=5, description="Minimum rating filter"),
+    after_name: str | None = Query(
+        None, description="Name of the last clinic of the previous page"
+    ),
+    after_id: UUID | None = Query(None, description="ID of the last clinic of the previous page"),
     db: AsyncSession = Depends(get_db),
     clinic_service: ClinicService = Depends(get_clinic_service),
 ):
@@ -97,7 +114,10 @@ async def list_clinics(
     - **status**: Filter by operational status
     - **name_search**: Search by clinic name
     - **min_rating**: Minimum rating threshold
+    - **after_name** / **after_id**: Keyset cursor (last clinic of the previous page);
+      use instead of skip for deep pages
     """
+    _require_cursor_id(after_name, after_id)
     clinics = await clinic_service.get_clinics(
         db=db,
         skip=skip,
@@ -106,12 +126,17 @@ async def list_clinics(
         status=status,
         name_search=name_search,
         min_rating=min_rating,
+        after_name=after_name,
+        after_id=after_id,
     )
 
-    return [ClinicListResponse.model_validate(c) for c in clinics]
+    payload = CLINIC_LIST_ADAPTER.dump_json(CLINIC_LIST_ADAPTER.validate_python(clinics))
+    return Response(content=payload, media_type="application/json")
 
 
-@router.get("/search", response_model=list[ClinicListResponse])
+@router.get(
+    "/search", response_class=Response, responses={200: {"model": list[ClinicListResponse]}}
+)
 async def search_clinics(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
@@ -119,6 +144,8 @@ async def search_clinics(
     status: str | None = Query(None),
     name_search: str | None = Query(None),
     min_rating: float | None = Query(None, ge=0, le=5),
+    after_name: str | None = Query(None),
+    after_id: UUID | None = Query(None),
     db: AsyncSession = Depends(get_db),
     clinic_service: ClinicService = Depends(get_clinic_service),
 ):
@@ -130,7 +157,10 @@ async def search_clinics(
     - Status
     - Minimum rating
     - Active status
+
+    Pass after_name/after_id from the last result to fetch the next page.
     """
+    _require_cursor_id(after_name, after_id)
     clinics = await clinic_service.get_clinics(
         db=db,
         skip=skip,
@@ -139,12 +169,17 @@ async def search_clinics(
         status=status,
         name_search=name_search,
         min_rating=min_rating,
+        after_name=after_name,
+        after_id=after_id,
     )
 
-    return [ClinicListResponse.model_validate(c) for c in clinics]
+    payload = CLINIC_LIST_ADAPTER.dump_json(CLINIC_LIST_ADAPTER.validate_python(clinics))
+    return Response(content=payload, media_type="application/json")
 
 
-@router.get("/nearby", response_model=list[ClinicListResponse])
+@router.get(
+    "/nearby", response_class=Response, responses={200: {"model": list[ClinicListResponse]}}
+)
 async def search_nearby_clinics(
     latitude: float = Query(..., ge=-90, le=90),
     longitude: float = Query(..., ge=-180, le=180),
@@ -153,6 +188,8 @@ async def search_nearby_clinics(
     limit: int = Query(20, ge=1, le=100),
     is_active: bool = Query(True),
     min_rating: float | None = Query(None, ge=0, le=5),
+    after_distance_km: float | None = Query(None, ge=0),
+    after_id: UUID | None = Query(None),
     db: AsyncSession = Depends(get_db),
     clinic_service: ClinicService = Depends(get_clinic_service),
 ):
@@ -164,9 +201,12 @@ async def search_nearby_clinics(
     - **radius_km**: Search radius in kilometers (default: 10km)
     - **is_active**: Filter active clinics only
     - **min_rating**: Minimum rating filter
+    - **after_distance_km** / **after_id**: Keyset cursor (last clinic of the previous
+      page); use instead of skip for deep pages
 
     Returns clinics sorted by distance from the specified location.
     """
+    _require_cursor_id(after_distance_km, after_id)
     clinics = await clinic_service.search_clinics_nearby(
         db=db,
         latitude=latitude,
@@ -176,9 +216,12 @@ async def search_nearby_clinics(
         limit=limit,
         is_active=is_active,
         min_rating=min_rating,
+        after_distance_km=after_distance_km,
+        after_id=after_id,
     )
 
-    return [ClinicListResponse.model_validate(c) for c in clinics]
+    payload = CLINIC_LIST_ADAPTER.dump_json(CLINIC_LIST_ADAPTER.validate_python(clinics))
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/{clinic_id}", response_model=ClinicResponse)
@@ -329,7 +372,11 @@ async def add_doctor_to_clinic(
         ) from e
 
 
-@router.get("/{clinic_id}/doctors", response_model=list[DoctorAtClinicResponse])
+@router.get(
+    "/{clinic_id}/doctors",
+    response_class=Response,
+    responses={200: {"model": list[DoctorAtClinicResponse]}},
+)
 async def get_clinic_doctors(
     clinic_id: UUID,
     active_only: bool = Query(True, description="Filter active doctors only"),
@@ -345,7 +392,10 @@ async def get_clinic_doctors(
     - **active_only**: If true, only returns currently active doctors
     """
     doctors = await clinic_service.get_clinic_doctors(db, clinic_id, active_only=active_only)
-    return doctors
+    payload = DOCTOR_AT_CLINIC_LIST_ADAPTER.dump_json(
+        DOCTOR_AT_CLINIC_LIST_ADAPTER.validate_python(doctors)
+    )
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/doctors/{doctor_id}/clinics", response_model=list[ClinicForDoctorResponse])
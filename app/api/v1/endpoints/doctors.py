@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -10,6 +10,7 @@ from app.core.redis_client import CacheManager
 from app.database import get_db
 from app.dependencies import get_cache_manager
 from app.schemas.doctors import (
+    DOCTOR_LIST_ADAPTER,
     DoctorCreate,
     DoctorDetailResponse,
     DoctorListResponse,
@@ -73,7 +74,7 @@ async def create_doctor(
         ) from e
 
 
-@router.get("/", response_model=list[DoctorListResponse])
+@router.get("/", response_class=Response, responses={200: {"model": list[DoctorListResponse]}})
 async def list_doctors(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(20, ge=1, le=100, description="Number of records to return"),
@@ -112,10 +113,13 @@ async def list_doctors(
         languages=languages,
     )
 
-    return [DoctorListResponse.model_validate(d) for d in doctors_list]
+    payload = DOCTOR_LIST_ADAPTER.dump_json(DOCTOR_LIST_ADAPTER.validate_python(doctors_list))
+    return Response(content=payload, media_type="application/json")
 
 
-@router.get("/search", response_model=list[DoctorListResponse])
+@router.get(
+    "/search", response_class=Response, responses={200: {"model": list[DoctorListResponse]}}
+)
 async def search_doctors(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
@@ -147,10 +151,13 @@ async def search_doctors(
         min_rating=min_rating,
     )
 
-    return [DoctorListResponse.model_validate(d) for d in doctors_list]
+    payload = DOCTOR_LIST_ADAPTER.dump_json(DOCTOR_LIST_ADAPTER.validate_python(doctors_list))
+    return Response(content=payload, media_type="application/json")
 
 
-@router.get("/nearby", response_model=list[DoctorListResponse])
+@router.get(
+    "/nearby", response_class=Response, responses={200: {"model": list[DoctorListResponse]}}
+)
 async def search_nearby_doctors(
     latitude: float = Query(..., ge=-90, le=90),
     longitude: float = Query(..., ge=-180, le=180),
@@ -187,7 +194,8 @@ async def search_nearby_doctors(
         min_rating=min_rating,
     )
 
-    return [DoctorListResponse.model_validate(d) for d in doctors_list]
+    payload = DOCTOR_LIST_ADAPTER.dump_json(DOCTOR_LIST_ADAPTER.validate_python(doctors_list))
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/{doctor_id}", response_model=DoctorDetailResponse)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Query, status
+from fastapi import APIRouter, Query, Response, status
 
 from app.dependencies import CacheManagerDep
 from app.schemas.environment import EnvironmentalConditionsResponse
@@ -9,7 +9,8 @@ router = APIRouter()
 
 @router.get(
     "/conditions",
-    response_model=EnvironmentalConditionsResponse,
+    response_class=Response,
+    responses={200: {"model": EnvironmentalConditionsResponse}},
     status_code=status.HTTP_200_OK,
     tags=["Environment"],
     summary="Get AQI and Weather by coordinates",
@@ -18,7 +19,7 @@ async def get_environmental_conditions(
     cache_manager: CacheManagerDep,
     lat: float = Query(..., ge=-90, le=90),
     lng: float = Query(..., ge=-180, le=180),
-) -> EnvironmentalConditionsResponse:
+) -> Response:
     """
     Fetch real-time Air Quality and Temperature for a specific location.
 
@@ -36,4 +37,5 @@ async def get_environmental_conditions(
         HTTPException: If environmental data is unavailable
     """
     service = EnvironmentService(cache_manager)
-    return await service.get_local_conditions(lat, lng)
+    conditions = await service.get_local_conditions(lat, lng)
+    return Response(content=conditions.model_dump_json(), media_type="application/json")
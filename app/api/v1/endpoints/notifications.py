@@ -2,12 +2,13 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
+from app.core.redis_client import AsyncCacheManager
 from app.database import get_db
-from app.dependencies import get_current_user
+from app.dependencies import get_async_cache_manager, get_current_user
 from app.schemas.notifications import (
     AdminNotificationRequest,
     NotificationDetailResponse,
@@ -33,6 +34,7 @@ async def register_fcm_token(
     token_data: PushTokenRegister,
     current_user: dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    cache_manager: AsyncCacheManager = Depends(get_async_cache_manager),
 ) -> PushTokenResponse:
     """
     Register or update FCM token for the authenticated user.
@@ -46,6 +48,7 @@ async def register_fcm_token(
         token_data: FCM token and platform information
         current_user: Authenticated user
         db: Database session
+        cache_manager: Cache manager holding users' token lists
 
     Returns:
         Registered token details
@@ -56,6 +59,7 @@ async def register_fcm_token(
             user_id=str(current_user["id"]),
             fcm_token=token_data.fcm_token,
             platform=token_data.platform,
+            cache=cache_manager,
         )
 
         return PushTokenResponse.model_validate(token)
@@ -76,6 +80,7 @@ async def deactivate_fcm_token(
     token_data: PushTokenRegister,
     current_user: dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    cache_manager: AsyncCacheManager = Depends(get_async_cache_manager),
 ) -> None:
     """
     Deactivate a specific FCM token.
@@ -89,11 +94,13 @@ async def deactivate_fcm_token(
         token_data: FCM token to deactivate
         current_user: Authenticated user
         db: Database session
+        cache_manager: Cache manager holding users' token lists
     """
     await NotificationService.deactivate_token(
         db=db,
         user_id=str(current_user["id"]),
         fcm_token=token_data.fcm_token,
+        cache=cache_manager,
     )
 
 
@@ -105,6 +112,7 @@ async def deactivate_fcm_token(
 async def deactivate_all_tokens(
     current_user: dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    cache_manager: AsyncCacheManager = Depends(get_async_cache_manager),
 ) -> None:
     """
     Deactivate all FCM tokens for the current user.
@@ -116,10 +124,12 @@ async def deactivate_all_tokens(
     Args:
         current_user: Authenticated user
         db: Database session
+        cache_manager: Cache manager holding users' token lists
     """
     await NotificationService.deactivate_all_user_tokens(
         db=db,
         user_id=str(current_user["id"]),
+        cache=cache_manager,
     )
 
 
@@ -133,6 +143,7 @@ async def send_notification(
     request: SendNotificationRequest,
     current_user: dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    cache_manager: AsyncCacheManager = Depends(get_async_cache_manager),
 ) -> NotificationResponse:
     """
     Send a push notification to a specific user.
@@ -143,6 +154,7 @@ async def send_notification(
         request: Notification details
         current_user: Authenticated user (must be admin)
         db: Database session
+        cache_manager: Cache manager holding users' token lists
 
     Returns:
         Number of successful and failed sends
@@ -165,6 +177,7 @@ async def send_notification(
         data=request.data,
         notification_type=request.notification_type,
         priority=request.priority,
+        cache=cache_manager,
     )
 
     return NotificationResponse(
@@ -183,6 +196,7 @@ async def send_notification(
 async def admin_send_notification(
     request: AdminNotificationRequest,
     db: AsyncSession = Depends(get_db),
+    cache_manager: AsyncCacheManager = Depends(get_async_cache_manager),
     x_admin_secret: str = Header(..., description="Admin secret key"),
 ) -> NotificationResponse:
     """
@@ -194,6 +208,7 @@ async def admin_send_notification(
     Args:
         request: Notification details including user_id
         db: Database session
+        cache_manager: Cache manager holding users' token lists
         x_admin_secret: Admin secret key (from X-Admin-Secret header)
 
     Returns:
@@ -217,6 +232,7 @@ async def admin_send_notification(
         data=request.data,
         notification_type=request.notification_type,
         priority=request.priority,
+        cache=cache_manager,
     )
 
     return NotificationResponse(
@@ -228,7 +244,8 @@ async def admin_send_notification(
 
 @router.get(
     "/history",
-    response_model=NotificationHistoryResponse,
+    response_class=Response,
+    responses={200: {"model": NotificationHistoryResponse}},
     summary="Get current user's notification history",
 )
 async def get_my_notification_history(
@@ -238,7 +255,7 @@ async def get_my_notification_history(
     notification_type: str | None = Query(None, description="Filter by type"),
     current_user: dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> NotificationHistoryResponse:
+) -> Response:
     """
     Get notification history for the authenticated user.
 
@@ -262,17 +279,19 @@ async def get_my_notification_history(
         notification_type_filter=notification_type,
     )
 
-    return NotificationHistoryResponse(
+    history = NotificationHistoryResponse(
         notifications=[NotificationRecord.model_validate(n) for n in result["notifications"]],
         total=result["total"],
         page=result["page"],
         page_size=result["page_size"],
     )
+    return Response(content=history.model_dump_json(), media_type="application/json")
 
 
 @router.get(
     "/history/{user_id}",
-    response_model=NotificationHistoryResponse,
+    response_class=Response,
+    responses={200: {"model": NotificationHistoryResponse}},
     summary="Get user notification history (admin only)",
 )
 async def get_user_notification_history(
@@ -283,7 +302,7 @@ async def get_user_notification_history(
     notification_type: str | None = Query(None, description="Filter by type"),
     current_user: dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> NotificationHistoryResponse:
+) -> Response:
     """
     Get notification history for a specific user (admin only).
 
@@ -317,12 +336,13 @@ async def get_user_notification_history(
         notification_type_filter=notification_type,
     )
 
-    return NotificationHistoryResponse(
+    history = NotificationHistoryResponse(
         notifications=[NotificationRecord.model_validate(n) for n in result["notifications"]],
         total=result["total"],
         page=result["page"],
         page_size=result["page_size"],
     )
+    return Response(content=history.model_dump_json(), media_type="application/json")
 
 
 @router.get(
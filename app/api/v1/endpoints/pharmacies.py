@@ -2,12 +2,14 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.dependencies import CacheManagerDep
 from app.schemas.pharmacies import (
+    PHARMACY_HOURS_LIST_ADAPTER,
+    PHARMACY_LIST_ADAPTER,
     PharmacyCreate,
     PharmacyHoursCreate,
     PharmacyHoursInDB,
@@ -39,7 +41,7 @@ async def create_pharmacy(
         )
 
 
-@router.get("", response_model=list[PharmacyListResponse])
+@router.get("", response_class=Response, responses={200: {"model": list[PharmacyListResponse]}})
 async def list_pharmacies(
     cache_manager: CacheManagerDep,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
@@ -88,10 +90,17 @@ async def list_pharmacies(
             supports_pickup=supports_pickup,
         )
 
-    return [PharmacyListResponse.model_validate(p) for p in pharmacies_list]
+    payload = PHARMACY_LIST_ADAPTER.dump_json(
+        PHARMACY_LIST_ADAPTER.validate_python(pharmacies_list)
+    )
+    return Response(content=payload, media_type="application/json")
 
 
-@router.get("/search/nearby", response_model=list[PharmacyListResponse])
+@router.get(
+    "/search/nearby",
+    response_class=Response,
+    responses={200: {"model": list[PharmacyListResponse]}},
+)
 async def search_pharmacies_nearby(
     cache_manager: CacheManagerDep,
     latitude: float = Query(..., ge=-90, le=90, description="Search latitude"),
@@ -120,7 +129,10 @@ async def search_pharmacies_nearby(
         supports_pickup=supports_pickup,
     )
 
-    return [PharmacyListResponse.model_validate(p) for p in pharmacies_list]
+    payload = PHARMACY_LIST_ADAPTER.dump_json(
+        PHARMACY_LIST_ADAPTER.validate_python(pharmacies_list)
+    )
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/{pharmacy_id}", response_model=PharmacyResponse)
@@ -229,7 +241,11 @@ async def add_pharmacy_hours(
     return PharmacyHoursInDB.model_validate(hours)
 
 
-@router.get("/{pharmacy_id}/hours", response_model=list[PharmacyHoursInDB])
+@router.get(
+    "/{pharmacy_id}/hours",
+    response_class=Response,
+    responses={200: {"model": list[PharmacyHoursInDB]}},
+)
 async def get_pharmacy_hours(
     pharmacy_id: UUID,
     cache_manager: CacheManagerDep,
@@ -246,7 +262,10 @@ async def get_pharmacy_hours(
         )
 
     hours = await pharmacy_service.get_pharmacy_hours(db, pharmacy_id)
-    return [PharmacyHoursInDB.model_validate(h) for h in hours]
+    payload = PHARMACY_HOURS_LIST_ADAPTER.dump_json(
+        PHARMACY_HOURS_LIST_ADAPTER.validate_python(hours)
+    )
+    return Response(content=payload, media_type="application/json")
 
 
 @router.delete("/{pharmacy_id}/hours/{day_of_week}", status_code=status.HTTP_204_NO_CONTENT)
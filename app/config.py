@@ -38,6 +38,8 @@ class Settings(BaseSettings):
     redis_username: str = Field(default="default", alias="REDIS_USERNAME")
     redis_password: str = Field(default="", alias="REDIS_PASSWORD")
     redis_decode_responses: bool = Field(default=True, alias="REDIS_DECODE_RESPONSES")
+    # Size of the asyncio client's connection pool
+    redis_max_connections: int = Field(default=50, alias="REDIS_MAX_CONNECTIONS")
 
     # JWT
     jwt_secret_key: str = Field(..., alias="JWT_SECRET_KEY")
@@ -89,6 +91,9 @@ class Settings(BaseSettings):
     # Rate Limiting
     rate_limit_per_minute: int = Field(default=60, alias="RATE_LIMIT_PER_MINUTE")
 
+    # Admin dashboard
+    admin_metrics_refresh_seconds: int = Field(default=60, alias="ADMIN_METRICS_REFRESH_SECONDS")
+
     # Logging
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
     log_format: str = Field(default="json", alias="LOG_FORMAT")
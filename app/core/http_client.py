@@ -0,0 +1,35 @@
+"""Shared outbound HTTP client."""
+
+import httpx
+
+# Global HTTP client: keeps TCP/TLS connections to upstream APIs alive between
+# requests, and HTTP/2 multiplexes concurrent calls to the same host
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get or create the shared HTTP client instance.
+
+    Returns:
+        HTTP client instance
+    """
+    global _http_client
+
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client."""
+    global _http_client
+
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
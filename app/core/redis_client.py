@@ -1,15 +1,24 @@
 """Redis client configuration and utilities."""
 
-import json
+from collections.abc import Iterable, Mapping, Sequence
 from typing import Any, cast
 
+import orjson
 import redis
+import redis.asyncio
 
 from app.config import settings
 
+# Cached values are orjson bytes; default=str covers Decimal, and non-str keys
+# are stringified like json.dumps would
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
 # Global Redis client instance
 _redis_client: redis.Redis | None = None
 
+# Global asyncio Redis client, backed by a shared connection pool
+_async_redis_client: redis.asyncio.Redis | None = None
+
 
 def get_redis_client() -> redis.Redis:
     """
@@ -59,6 +68,44 @@ def close_redis_connection() -> None:
         _redis_client = None
 
 
+def get_async_redis_client() -> redis.asyncio.Redis:
+    """
+    Get or create the asyncio Redis client instance.
+
+    Connections come from a blocking pool of ``redis_max_connections``: when all
+    are busy, callers wait for one to be released instead of opening more.
+
+    Returns:
+        Asyncio Redis client instance
+    """
+    global _async_redis_client
+
+    if _async_redis_client is None:
+        pool = redis.asyncio.BlockingConnectionPool(
+            host=settings.redis_host,
+            port=settings.redis_port,
+            username=settings.redis_username,
+            password=settings.redis_password,
+            decode_responses=settings.redis_decode_responses,
+            max_connections=settings.redis_max_connections,
+            socket_connect_timeout=5,
+            socket_keepalive=True,
+            health_check_interval=30,
+        )
+        _async_redis_client = redis.asyncio.Redis(connection_pool=pool)
+
+    return _async_redis_client
+
+
+async def close_async_redis_connection() -> None:
+    """Close the asyncio Redis client and its connection pool."""
+    global _async_redis_client
+
+    if _async_redis_client is not None:
+        await _async_redis_client.aclose(close_connection_pool=True)
+        _async_redis_client = None
+
+
 # Rate limiting helper
 class RateLimiter:
     """Redis-based rate limiter."""
@@ -172,13 +219,31 @@ class CacheManager:
             Deserialized object or None
         """
         try:
-            value = cast(str | None, self.redis.get(key))
+            value = self.redis.get(key)
             if value:
-                return json.loads(value)
+                return orjson.loads(value)
             return None
         except Exception:
             return None
 
+    def mget_json(self, keys: Sequence[str]) -> list[Any | None]:
+        """
+        Get several JSON values in one round-trip (MGET) and deserialize them.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Deserialized objects in key order, None for misses
+        """
+        if not keys:
+            return []
+        try:
+            values = self.redis.mget(keys)
+            return [orjson.loads(value) if value else None for value in values]
+        except Exception:
+            return [None] * len(keys)
+
     def set_json(
         self,
         key: str,
@@ -197,7 +262,7 @@ class CacheManager:
             True if successful, False otherwise
         """
         try:
-            json_value = json.dumps(value, default=str)
+            json_value = orjson.dumps(value, default=str, option=_JSON_OPTIONS)
             if ttl:
                 self.redis.setex(key, ttl, json_value)
             else:
@@ -206,6 +271,62 @@ class CacheManager:
         except Exception:
             return False
 
+    def get_generation(self, namespace: str) -> int:
+        """
+        Get the current generation counter of a key namespace.
+
+        Cache keys embed the generation, so bumping it orphans every key written
+        under the previous one (they expire through their TTL).
+
+        Args:
+            namespace: Key namespace (e.g., 'clinic:list')
+
+        Returns:
+            Current generation, 0 if never bumped or on error
+        """
+        try:
+            return int(cast(str | None, self.redis.get(f"{namespace}:gen")) or 0)
+        except Exception:
+            return 0
+
+    def bump_generation(self, namespace: str) -> bool:
+        """
+        Invalidate all keys of a namespace by incrementing its generation.
+
+        Args:
+            namespace: Key namespace (e.g., 'clinic:list')
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            self.redis.incr(f"{namespace}:gen")
+            return True
+        except Exception:
+            return False
+
+    def invalidate(self, keys: Iterable[str] = (), generations: Iterable[str] = ()) -> bool:
+        """
+        Delete keys and bump namespace generations in a single round-trip.
+
+        Args:
+            keys: Cache keys to delete
+            generations: Namespaces whose generation to bump (see bump_generation)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for key in keys:
+                pipe.delete(key)
+            for namespace in generations:
+                pipe.incr(f"{namespace}:gen")
+            pipe.execute()
+            return True
+        except Exception:
+            return False
+
     def delete_pattern(self, pattern: str) -> int:
         """
         Delete all keys matching a pattern.
@@ -223,3 +344,143 @@ class CacheManager:
             return 0
         except Exception:
             return 0
+
+
+class AsyncCacheManager:
+    """Redis-based cache manager for async callers (non-blocking I/O)."""
+
+    def __init__(self, redis_client: redis.asyncio.Redis):
+        """Initialize cache manager with an asyncio Redis client."""
+        self.redis = redis_client
+
+    async def delete(self, key: str) -> bool:
+        """Delete key from cache."""
+        try:
+            await self.redis.delete(key)
+            return True
+        except Exception:
+            return False
+
+    async def get_json(self, key: str, refresh_ttl: int | None = None) -> Any | None:
+        """
+        Get JSON value from cache and deserialize.
+
+        Args:
+            key: Cache key
+            refresh_ttl: If set, reset the key's TTL on read (sliding expiry, via GETEX)
+
+        Returns:
+            Deserialized object or None
+        """
+        try:
+            if refresh_ttl:
+                value = await self.redis.getex(key, ex=refresh_ttl)
+            else:
+                value = await self.redis.get(key)
+            if value:
+                return orjson.loads(value)
+            return None
+        except Exception:
+            return None
+
+    async def mget_json(self, keys: Sequence[str]) -> list[Any | None]:
+        """
+        Get several JSON values in one round-trip (MGET) and deserialize them.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Deserialized objects in key order, None for misses
+        """
+        if not keys:
+            return []
+        try:
+            values = await self.redis.mget(keys)
+            return [orjson.loads(value) if value else None for value in values]
+        except Exception:
+            return [None] * len(keys)
+
+    async def set_json(
+        self,
+        key: str,
+        value: Any,
+        ttl: int | None = None,
+    ) -> bool:
+        """
+        Serialize and set JSON value in cache.
+
+        Args:
+            key: Cache key
+            value: Value to serialize and cache
+            ttl: Time to live in seconds
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            json_value = orjson.dumps(value, default=str, option=_JSON_OPTIONS)
+            if ttl:
+                await self.redis.setex(key, ttl, json_value)
+            else:
+                await self.redis.set(key, json_value)
+            return True
+        except Exception:
+            return False
+
+    async def mset_json(self, values: Mapping[str, Any], ttl: int) -> bool:
+        """
+        Serialize and set several JSON values with a TTL in a single round-trip.
+
+        Args:
+            values: Values to cache by key
+            ttl: Time to live in seconds
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for key, value in values.items():
+                pipe.setex(key, ttl, orjson.dumps(value, default=str, option=_JSON_OPTIONS))
+            await pipe.execute()
+            return True
+        except Exception:
+            return False
+
+    async def get_generation(self, namespace: str) -> int:
+        """
+        Get the current generation counter of a key namespace.
+
+        Args:
+            namespace: Key namespace (e.g., 'clinic:list')
+
+        Returns:
+            Current generation, 0 if never bumped or on error
+        """
+        try:
+            return int(cast(str | None, await self.redis.get(f"{namespace}:gen")) or 0)
+        except Exception:
+            return 0
+
+    async def invalidate(self, keys: Iterable[str] = (), generations: Iterable[str] = ()) -> bool:
+        """
+        Delete keys and bump namespace generations in a single round-trip.
+
+        Args:
+            keys: Cache keys to delete
+            generations: Namespaces whose generation to bump
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for key in keys:
+                pipe.delete(key)
+            for namespace in generations:
+                pipe.incr(f"{namespace}:gen")
+            await pipe.execute()
+            return True
+        except Exception:
+            return False
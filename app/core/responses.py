@@ -0,0 +1,47 @@
+"""Custom response classes."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def _orjson_default(obj: Any) -> str:
+    """
+    Fallback serializer for types orjson does not handle natively (e.g. Decimal).
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        String representation of the object
+    """
+    return str(obj)
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered directly with orjson.
+
+    Skips FastAPI's ``jsonable_encoder`` pass: UUIDs and datetimes are serialized
+    natively, anything else (Decimal) falls back to ``str``. Use it for endpoints
+    returning plain DB rows; keep the Pydantic schema in ``responses=`` for docs.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """
+        Serialize content to JSON bytes.
+
+        Args:
+            content: Response payload
+
+        Returns:
+            Encoded JSON body
+        """
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_UUID,
+        )
@@ -1,5 +1,8 @@
 """Security utilities for JWT and password handling."""
 
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -11,6 +14,11 @@ from app.config import settings
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Decoded access tokens, keyed by SHA-256 of the token so raw bearer tokens are
+# not kept in memory. Bounded LRU; entries are dropped once the token expires.
+ACCESS_TOKEN_CACHE_SIZE = 4096
+_access_token_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash."""
@@ -102,6 +110,37 @@ def decode_access_token(token: str) -> dict[str, Any] | None:
     """
     Decode and validate a JWT access token.
 
+    Valid payloads are cached per process until the token's ``exp``, so repeat
+    requests with the same bearer token skip signature verification.
+
+    Args:
+        token: JWT token to decode
+
+    Returns:
+        Decoded payload or None if invalid
+    """
+    key = hashlib.sha256(token.encode()).hexdigest()
+    cached = _access_token_cache.get(key)
+    if cached is not None:
+        if cached["exp"] > time.time():
+            _access_token_cache.move_to_end(key)
+            return dict(cached)
+        _access_token_cache.pop(key, None)
+
+    payload = _decode_access_token(token)
+    if payload is not None and isinstance(payload.get("exp"), int | float):
+        _access_token_cache[key] = payload
+        if len(_access_token_cache) > ACCESS_TOKEN_CACHE_SIZE:
+            _access_token_cache.popitem(last=False)
+        return dict(payload)
+
+    return payload
+
+
+def _decode_access_token(token: str) -> dict[str, Any] | None:
+    """
+    Verify and decode a JWT access token without caching.
+
     Args:
         token: JWT token to decode
 
@@ -7,7 +7,12 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.redis_client import CacheManager, get_redis_client
+from app.core.redis_client import (
+    AsyncCacheManager,
+    CacheManager,
+    get_async_redis_client,
+    get_redis_client,
+)
 from app.core.security import decode_access_token
 from app.database import get_db
 from app.services.user_service import UserService
@@ -27,6 +32,16 @@ def get_cache_manager() -> CacheManager:
     return CacheManager(redis_client)
 
 
+def get_async_cache_manager() -> AsyncCacheManager:
+    """
+    Get AsyncCacheManager instance.
+
+    Returns:
+        AsyncCacheManager instance sharing the pooled asyncio Redis client
+    """
+    return AsyncCacheManager(get_async_redis_client())
+
+
 async def get_current_user_id(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
 ) -> UUID:
@@ -113,4 +128,5 @@ DatabaseSession = Annotated[AsyncSession, Depends(get_db)]
 CurrentUserId = Annotated[UUID, Depends(get_current_user_id)]
 CurrentUser = Annotated[dict, Depends(get_current_user)]
 CacheManagerDep = Annotated[CacheManager, Depends(get_cache_manager)]
+AsyncCacheManagerDep = Annotated[AsyncCacheManager, Depends(get_async_cache_manager)]
 RedisClient = Annotated[Any, Depends(get_redis_client)]
@@ -1,5 +1,7 @@
 """FastAPI application entry point."""
 
+import asyncio
+import contextlib
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
@@ -14,7 +16,12 @@ from app.api.v1.router import api_router
 from app.config import settings
 from app.core.exceptions import AppException
 from app.core.firebase import initialize_firebase
-from app.core.redis_client import close_redis_connection, get_redis_client
+from app.core.http_client import close_http_client
+from app.core.redis_client import (
+    close_async_redis_connection,
+    close_redis_connection,
+    get_redis_client,
+)
 from app.database import engine
 from app.middleware.error_handler import (
     app_exception_handler,
@@ -23,6 +30,8 @@ from app.middleware.error_handler import (
     validation_exception_handler,
 )
 from app.middleware.logging import LoggingMiddleware, configure_logging
+from app.services.admin_metrics_service import AdminMetricsService
+from app.services.appointment_service import drain_background_tasks
 
 # Configure logging
 configure_logging()
@@ -71,19 +80,35 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.error("redis_connection_failed", error=str(e))
 
+    # Keep the admin_metrics materialized view fresh
+    metrics_refresh_task = asyncio.create_task(
+        AdminMetricsService.run_refresh_loop(engine, settings.admin_metrics_refresh_seconds)
+    )
+
     yield
 
     # Shutdown
     logger.info("application_shutdown")
 
+    metrics_refresh_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await metrics_refresh_task
+
+    # Let in-flight notification sends finish while the engine is still open
+    await drain_background_tasks()
+
     # Close database connections
     await engine.dispose()
     logger.info("database_connections_closed")
 
-    # Close Redis connection
+    # Close Redis connections
     close_redis_connection()
+    await close_async_redis_connection()
     logger.info("redis_connection_closed")
 
+    # Close the shared outbound HTTP client
+    await close_http_client()
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -1,11 +1,14 @@
 """Logging middleware and configuration."""
 
+import base64
 import logging
+import os
 import sys
 import time
-import uuid
 from collections.abc import Callable
+from typing import Any
 
+import orjson
 import structlog
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -13,6 +16,56 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from app.config import settings
 
 
+def generate_request_id() -> str:
+    """
+    Generate a compact request ID.
+
+    128 random bits encoded as unpadded base64url: 22 characters instead of
+    the 36 of a canonical UUID string, and safe in headers and JSON.
+
+    Returns:
+        Request ID string
+    """
+    return base64.urlsafe_b64encode(os.urandom(16)).rstrip(b"=").decode()
+
+
+# Lean processor chain for the per-request access log: the middleware only
+# passes keyword arguments, so positional formatting, logger names, stack and
+# exception rendering are skipped.
+_HTTP_PROCESSORS: list[structlog.types.Processor] = [
+    structlog.contextvars.merge_contextvars,
+    structlog.processors.add_log_level,
+    structlog.processors.TimeStamper(fmt="iso", utc=True),
+    structlog.processors.JSONRenderer(serializer=orjson.dumps),
+]
+
+
+def _build_http_logger() -> Any:
+    """
+    Build the logger used by the HTTP logging middleware.
+
+    JSON output gets a dedicated orjson-backed logger writing bytes straight to
+    stdout; console output falls back to the shared structlog configuration.
+
+    Returns:
+        Structlog logger
+    """
+    if settings.log_format != "json":
+        return structlog.get_logger("http")
+
+    return structlog.wrap_logger(
+        structlog.BytesLogger(sys.stdout.buffer),
+        processors=_HTTP_PROCESSORS,
+        wrapper_class=structlog.make_filtering_bound_logger(
+            getattr(logging, settings.log_level.upper())
+        ),
+        cache_logger_on_first_use=True,
+    )
+
+
+http_logger = _build_http_logger()
+
+
 def configure_logging() -> None:
     """Configure structured logging."""
     shared_processors = [
@@ -69,10 +122,8 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         Returns:
             Response object
         """
-        logger = structlog.get_logger()
-
         # Generate unique request ID
-        request_id = str(uuid.uuid4())
+        request_id = generate_request_id()
         request.state.request_id = request_id
 
         # Start timer
@@ -84,7 +135,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             user_id = str(request.state.user.id)
 
         # Log request
-        logger.info(
+        http_logger.info(
             "request_started",
             request_id=request_id,
             method=request.method,
@@ -102,7 +153,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             duration = time.time() - start_time
 
             # Log error
-            logger.error(
+            http_logger.error(
                 "request_failed",
                 request_id=request_id,
                 method=request.method,
@@ -119,7 +170,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         duration = time.time() - start_time
 
         # Log response
-        logger.info(
+        http_logger.info(
             "request_completed",
             request_id=request_id,
             method=request.method,
@@ -130,8 +181,9 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             user_id=user_id,
         )
 
-        # Add headers for tracing
-        response.headers["X-Request-ID"] = request_id
-        response.headers["X-Process-Time"] = str(duration)
+        # Add headers for tracing (process time in milliseconds)
+        headers = response.headers
+        headers["x-request-id"] = request_id
+        headers["x-process-time"] = f"{duration * 1000:.3f}"
 
         return response
@@ -1,5 +1,7 @@
 """Database models."""
 
+from app.models._base import metadata
+from app.models.admin_metrics import admin_metrics
 from app.models.admins import admins
 from app.models.appointments import appointments
 from app.models.clinics import clinics
@@ -17,11 +19,13 @@ from app.models.push_tokens import push_tokens
 from app.models.users import users
 
 __all__ = [
+    "admin_metrics",
     "admins",
     "appointments",
     "clinics",
     "doctor_clinics",
     "doctors",
+    "metadata",
     "notification_deliveries",
     "notifications",
     "patients",
@@ -0,0 +1,36 @@
+"""Shared SQLAlchemy metadata and SQL for all table definitions."""
+
+from sqlalchemy import MetaData
+
+# Single registry for every table so foreign keys resolve across modules and
+# create_all/autogenerate see the full schema in dependency order
+metadata = MetaData()
+
+# Plain SQL uuid_generate_v7() (same name as the pg_uuidv7 extension function):
+# 48-bit unix ms timestamp followed by random bits, version 7, RFC 4122 variant.
+# Primary key defaults call it; migration 015 and the test schema both create it
+UUID_GENERATE_V7_SQL = """
+CREATE OR REPLACE FUNCTION uuid_generate_v7()
+RETURNS uuid
+LANGUAGE sql
+VOLATILE
+AS $$
+    SELECT encode(
+        set_bit(
+            set_bit(
+                overlay(
+                    uuid_send(gen_random_uuid())
+                    PLACING substring(
+                        int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                        FROM 3
+                    )
+                    FROM 1 FOR 6
+                ),
+                52, 1
+            ),
+            53, 1
+        ),
+        'hex'
+    )::uuid
+$$
+"""
@@ -0,0 +1,78 @@
+"""Admin metrics materialized view."""
+
+from sqlalchemy import DDL, BigInteger, Integer, column, event, table
+
+from app.models._base import metadata
+
+# Single-row snapshot of the admin dashboard counters. Each base table is scanned
+# once per refresh instead of once per counter per request. Migration 022 creates
+# the view from this same query.
+ADMIN_METRICS_VIEW_SQL = """
+SELECT
+    1 AS id,
+    u.users_total,
+    u.users_active,
+    a.appointments_total,
+    a.appointments_pending,
+    a.appointments_confirmed,
+    p.pharmacies_total,
+    p.pharmacies_verified,
+    p.pharmacies_active,
+    n.notifications_sent_today,
+    now() AS refreshed_at
+FROM
+    (
+        SELECT
+            count(*) AS users_total,
+            count(*) FILTER (WHERE is_active) AS users_active
+        FROM users
+    ) AS u
+    CROSS JOIN (
+        SELECT
+            count(*) AS appointments_total,
+            count(*) FILTER (WHERE status = 'scheduled') AS appointments_pending,
+            count(*) FILTER (WHERE status = 'confirmed') AS appointments_confirmed
+        FROM appointments
+    ) AS a
+    CROSS JOIN (
+        SELECT
+            count(*) AS pharmacies_total,
+            count(*) FILTER (WHERE is_verified) AS pharmacies_verified,
+            count(*) FILTER (WHERE is_active) AS pharmacies_active
+        FROM pharmacies
+    ) AS p
+    CROSS JOIN (
+        SELECT count(*) AS notifications_sent_today
+        FROM notifications
+        WHERE sent_at >= date_trunc('day', now() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'
+    ) AS n
+"""
+
+# Not a Table: create_all must not emit CREATE TABLE for it
+admin_metrics = table(
+    "admin_metrics",
+    column("id", Integer),
+    column("users_total", BigInteger),
+    column("users_active", BigInteger),
+    column("appointments_total", BigInteger),
+    column("appointments_pending", BigInteger),
+    column("appointments_confirmed", BigInteger),
+    column("pharmacies_total", BigInteger),
+    column("pharmacies_verified", BigInteger),
+    column("pharmacies_active", BigInteger),
+    column("notifications_sent_today", BigInteger),
+)
+
+# Keep metadata.create_all/drop_all (tests, init_db) in step with migration 022.
+# The unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY.
+event.listen(
+    metadata,
+    "after_create",
+    DDL(f"CREATE MATERIALIZED VIEW IF NOT EXISTS admin_metrics AS {ADMIN_METRICS_VIEW_SQL}"),
+)
+event.listen(
+    metadata,
+    "after_create",
+    DDL("CREATE UNIQUE INDEX IF NOT EXISTS idx_admin_metrics_id ON admin_metrics (id)"),
+)
+event.listen(metadata, "before_drop", DDL("DROP MATERIALIZED VIEW IF EXISTS admin_metrics"))
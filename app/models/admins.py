@@ -6,14 +6,13 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     Integer,
-    MetaData,
     String,
     Table,
     text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 
-metadata = MetaData()
+from app.models._base import metadata
 
 admins = Table(
     "admins",
@@ -1,18 +1,35 @@
 """Appointments table model using SQLAlchemy Core."""
 
 from sqlalchemy import (
-    CheckConstraint,
     Column,
     ForeignKey,
-    MetaData,
     Table,
     Text,
     text,
 )
-from sqlalchemy.dialects.postgresql import TIMESTAMP, UUID, VARCHAR
+from sqlalchemy.dialects.postgresql import ENUM, TIMESTAMP, UUID, VARCHAR
 
-# Metadata for all tables
-metadata = MetaData()
+from app.models._base import metadata
+
+# Native Postgres enums (4-byte values, replace the former TEXT + CHECK columns)
+appointment_status = ENUM(
+    "scheduled",
+    "confirmed",
+    "rescheduled",
+    "cancelled",
+    "completed",
+    "no_show",
+    name="appointment_status",
+    metadata=metadata,
+)
+appointment_source = ENUM(
+    "patient_app",
+    "doctor_app",
+    "admin_panel",
+    "api",
+    name="appointment_source",
+    metadata=metadata,
+)
 
 # Appointments table
 appointments = Table(
@@ -50,22 +67,17 @@ appointments = Table(
     # Status management
     Column(
         "status",
-        Text,
+        appointment_status,
         nullable=False,
         server_default="scheduled",
     ),
     # Metadata
     Column("notes", Text, nullable=True),
-    Column("source", Text, server_default="patient_app"),
+    Column("source", appointment_source, server_default="patient_app"),
     # Audit fields
     Column("created_at", TIMESTAMP(timezone=True), nullable=False, server_default=text("NOW()")),
     Column("updated_at", TIMESTAMP(timezone=True), nullable=False, server_default=text("NOW()")),
     Column("cancelled_at", TIMESTAMP(timezone=True), nullable=True),
     # Soft delete (healthcare compliance)
     Column("deleted_at", TIMESTAMP(timezone=True), nullable=True),
-    # Constraints
-    CheckConstraint(
-        "status IN ('scheduled', 'confirmed', 'rescheduled', 'cancelled', 'completed', 'no_show')",
-        name="appointments_status_check",
-    ),
 )
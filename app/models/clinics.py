@@ -1,23 +1,27 @@
 """Clinic model definition using SQLAlchemy Core."""
 
+from typing import Any
+
 from sqlalchemy import (
-    JSON,
+    DDL,
     Boolean,
     CheckConstraint,
     Column,
     DateTime,
     Index,
     Integer,
-    MetaData,
     Numeric,
     String,
     Table,
     Text,
+    event,
+    literal_column,
     text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.sql.elements import ColumnClause
 
-metadata = MetaData()
+from app.models._base import metadata
 
 clinics = Table(
     "clinics",
@@ -33,15 +37,16 @@ clinics = Table(
     Column("slug", String(255), unique=True, index=True),  # URL-friendly identifier
     Column("description", Text),
     Column("logo_url", Text),
-    # Contact Information (JSON for flexibility)
-    Column("contacts", JSON),
+    # Contact Information (JSONB for flexibility)
+    Column("contacts", JSONB),
     # Example: {"email": "clinic@example.com", "phone_primary": "+91...", "phone_secondary": "...", "website": "https://..."}
     # Address (simplified to essential fields)
     Column("address", Text, nullable=False),  # Full address as text
     Column("latitude", Numeric(10, 8)),
     Column("longitude", Numeric(11, 8)),
+    # location GEOGRAPHY(Point, 4326) is generated from latitude/longitude; see DDL below
     # Opening Hours
-    Column("opening_hours", JSON),
+    Column("opening_hours", JSONB),
     # Example: {"monday": {"open": "09:00", "close": "18:00"}, "tuesday": {...}, "sunday": null}
     # Ratings
     Column("rating", Numeric(3, 2)),  # Average rating 0.00-5.00
@@ -81,3 +86,33 @@ Index(
     postgresql_ops={"name": "gin_trgm_ops"},
 )
 # Note: The trigram index requires pg_trgm extension, add in migration
+
+# Every read filters out soft-deleted clinics; listings are ordered and keyset
+# paginated by (name, id)
+Index(
+    "ix_clinics_live_name_id",
+    clinics.c.name,
+    clinics.c.id,
+    postgresql_where=clinics.c.deleted_at.is_(None),
+)
+
+# PostGIS geography is not a Core type, so location is emitted as DDL after the
+# table (mirrors migration 025); the GiST index serves ST_DWithin in nearby search
+event.listen(
+    clinics,
+    "after_create",
+    DDL(
+        "ALTER TABLE clinics ADD COLUMN location GEOGRAPHY(Point, 4326) "
+        "GENERATED ALWAYS AS "
+        "(ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)::geography) STORED"
+    ),
+)
+event.listen(
+    clinics,
+    "after_create",
+    DDL("CREATE INDEX idx_clinics_location ON clinics USING GIST (location)"),
+)
+
+# location is not declared on the Table, so queries reference it through this
+# column expression; rows without coordinates have a NULL location
+clinic_location: ColumnClause[Any] = literal_column("clinics.location")
@@ -9,7 +9,6 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
-    MetaData,
     Numeric,
     String,
     Table,
@@ -17,7 +16,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.dialects.postgresql import UUID
 
-metadata = MetaData()
+from app.models._base import metadata
 
 doctor_clinics = Table(
     "doctor_clinics",
@@ -99,3 +98,17 @@ Index(
     doctor_clinics.c.clinic_id,
     postgresql_where=text("end_date IS NULL AND status = 'active'"),
 )
+
+# Current associations of a clinic / of a doctor, primary association first
+Index(
+    "ix_doctor_clinics_clinic_current",
+    doctor_clinics.c.clinic_id,
+    doctor_clinics.c.is_primary.desc(),
+    postgresql_where=text("end_date IS NULL AND status = 'active'"),
+)
+Index(
+    "ix_doctor_clinics_doctor_current",
+    doctor_clinics.c.doctor_id,
+    doctor_clinics.c.is_primary.desc(),
+    postgresql_where=text("end_date IS NULL AND status = 'active'"),
+)
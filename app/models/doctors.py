@@ -5,17 +5,17 @@ from sqlalchemy import (
     Boolean,
     Column,
     DateTime,
+    Index,
     Integer,
-    MetaData,
     Numeric,
     String,
     Table,
     Text,
     text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 
-metadata = MetaData()
+from app.models._base import metadata
 
 doctors = Table(
     "doctors",
@@ -37,7 +37,7 @@ doctors = Table(
     Column("consultation_duration_minutes", Integer, server_default=text("30")),
     # Professional details
     Column("bio", Text),
-    Column("languages_spoken", JSON),
+    Column("languages_spoken", JSONB),  # JSON array of language names
     Column("medical_council_registration", String(100)),
     # Verification and ratings
     Column("is_verified", Boolean, nullable=False, server_default=text("false"), index=True),
@@ -51,3 +51,20 @@ doctors = Table(
     Column("created_at", DateTime(timezone=True), nullable=False, server_default=text("NOW()")),
     Column("updated_at", DateTime(timezone=True), nullable=False, server_default=text("NOW()")),
 )
+
+# Language filter: languages_spoken ?| array[...] (has any of the languages)
+Index("ix_doctors_languages_spoken", doctors.c.languages_spoken, postgresql_using="gin")
+
+# Substring specialization search (ILIKE '%term%'); requires pg_trgm
+Index(
+    "ix_doctors_specialization_trgm",
+    doctors.c.specialization,
+    postgresql_using="gin",
+    postgresql_ops={"specialization": "gin_trgm_ops"},
+)
+Index(
+    "ix_doctors_sub_specialization_trgm",
+    doctors.c.sub_specialization,
+    postgresql_using="gin",
+    postgresql_ops={"sub_specialization": "gin_trgm_ops"},
+)
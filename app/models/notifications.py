@@ -6,7 +6,6 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
-    MetaData,
     String,
     Table,
     Text,
@@ -15,7 +14,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP, UUID
 
-metadata = MetaData()
+from app.models._base import metadata
 
 notifications = Table(
     "notifications",
@@ -64,6 +63,7 @@ notifications = Table(
     Index("idx_notifications_status", "status"),
     Index("idx_notifications_created_at", "created_at", postgresql_ops={"created_at": "DESC"}),
     Index("idx_notifications_user_status", "user_id", "status"),
+    Index("idx_notifications_user_created_at", "user_id", "created_at"),
     Index("idx_notifications_type", "notification_type"),
     Index(
         "idx_notifications_scheduled",
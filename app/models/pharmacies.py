@@ -1,23 +1,24 @@
 """Pharmacy models definition using SQLAlchemy Core."""
 
 from sqlalchemy import (
+    DDL,
     Boolean,
+    CheckConstraint,
     Column,
     Double,
     ForeignKey,
+    Index,
     Integer,
-    MetaData,
-    Numeric,
     SmallInteger,
     Table,
     Text,
-    Time,
     UniqueConstraint,
+    event,
     text,
 )
 from sqlalchemy.dialects.postgresql import TIMESTAMP, UUID
 
-metadata = MetaData()
+from app.models._base import metadata
 
 # Pharmacies table
 pharmacies = Table(
@@ -27,7 +28,7 @@ pharmacies = Table(
         "id",
         UUID(as_uuid=True),
         primary_key=True,
-        server_default=text("gen_random_uuid()"),
+        server_default=text("uuid_generate_v7()"),
     ),
     Column("name", Text, nullable=False),
     Column("description", Text, nullable=True),
@@ -35,7 +36,8 @@ pharmacies = Table(
     Column("email", Text, nullable=True),
     Column("is_verified", Boolean, nullable=False, server_default=text("false")),
     Column("is_active", Boolean, nullable=False, server_default=text("true")),
-    Column("rating", Numeric(precision=2, scale=1), nullable=True, server_default=text("0.0")),
+    # Fixed-point rating in tenths of a star (45 == 4.5)
+    Column("rating_x10", SmallInteger, nullable=False, server_default=text("0")),
     Column("rating_count", Integer, nullable=True, server_default=text("0")),
     Column("supports_delivery", Boolean, nullable=False, server_default=text("false")),
     Column("supports_pickup", Boolean, nullable=False, server_default=text("true")),
@@ -51,6 +53,7 @@ pharmacies = Table(
         nullable=False,
         server_default=text("NOW()"),
     ),
+    CheckConstraint("rating_x10 BETWEEN 0 AND 100", name="pharmacies_rating_x10_check"),
 )
 
 # Pharmacy locations table
@@ -61,7 +64,7 @@ pharmacy_locations = Table(
         "id",
         UUID(as_uuid=True),
         primary_key=True,
-        server_default=text("gen_random_uuid()"),
+        server_default=text("uuid_generate_v7()"),
     ),
     Column(
         "pharmacy_id",
@@ -76,8 +79,7 @@ pharmacy_locations = Table(
     Column("pincode", Text, nullable=True),
     Column("latitude", Double, nullable=False),
     Column("longitude", Double, nullable=False),
-    # Note: The geo column (Geography type) is added via migration
-    # as it requires PostGIS and is not directly supported by SQLAlchemy Core
+    # geo GEOGRAPHY(Point, 4326) is generated from latitude/longitude; see DDL below
     Column(
         "created_at",
         TIMESTAMP(timezone=True),
@@ -94,7 +96,7 @@ pharmacy_hours = Table(
         "id",
         UUID(as_uuid=True),
         primary_key=True,
-        server_default=text("gen_random_uuid()"),
+        server_default=text("uuid_generate_v7()"),
     ),
     Column(
         "pharmacy_id",
@@ -103,8 +105,51 @@ pharmacy_hours = Table(
         nullable=False,
     ),
     Column("day_of_week", SmallInteger, nullable=False),  # 1=Monday, 7=Sunday
-    Column("open_time", Time, nullable=False),
-    Column("close_time", Time, nullable=False),
+    # Minutes since midnight (0-1439): 2 bytes each and plain integer comparisons
+    Column("open_min", SmallInteger, nullable=False),
+    Column("close_min", SmallInteger, nullable=False),
     Column("is_closed", Boolean, nullable=False, server_default=text("false")),
     UniqueConstraint("pharmacy_id", "day_of_week", name="unique_day_per_pharmacy"),
+    CheckConstraint("open_min BETWEEN 0 AND 1439", name="pharmacy_hours_open_min_check"),
+    CheckConstraint("close_min BETWEEN 0 AND 1439", name="pharmacy_hours_close_min_check"),
+)
+
+# "Open now" lookup: day + minute-of-day range, skipping closed days
+Index(
+    "ix_pharmacy_hours_open_lookup",
+    pharmacy_hours.c.pharmacy_id,
+    pharmacy_hours.c.day_of_week,
+    pharmacy_hours.c.open_min,
+    pharmacy_hours.c.close_min,
+    postgresql_where=~pharmacy_hours.c.is_closed,
+)
+
+# Active/verified pharmacy counts (partial: only the rows the filters select)
+Index("ix_pharmacies_active_part", pharmacies.c.id, postgresql_where=pharmacies.c.is_active)
+Index("ix_pharmacies_verified_part", pharmacies.c.id, postgresql_where=pharmacies.c.is_verified)
+
+# Admin listing: filter by verification/active status, newest first
+Index(
+    "ix_pharmacies_verified_active_created",
+    pharmacies.c.is_verified,
+    pharmacies.c.is_active,
+    pharmacies.c.created_at,
+)
+
+# PostGIS geography is not a Core type, so geo is emitted as DDL after the table
+# (mirrors migration 023). Generated from latitude/longitude so writes never need
+# a follow-up UPDATE and the two can't drift; the GiST index serves ST_DWithin.
+event.listen(
+    pharmacy_locations,
+    "after_create",
+    DDL(
+        "ALTER TABLE pharmacy_locations ADD COLUMN geo GEOGRAPHY(Point, 4326) "
+        "GENERATED ALWAYS AS "
+        "(ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)::geography) STORED"
+    ),
+)
+event.listen(
+    pharmacy_locations,
+    "after_create",
+    DDL("CREATE INDEX idx_pharmacy_geo ON pharmacy_locations USING GIST (geo)"),
 )
@@ -1,25 +1,24 @@
 """Pharmacy staff model definition using SQLAlchemy Core."""
 
 from sqlalchemy import (
-    JSON,
     Boolean,
     Column,
     Date,
     DateTime,
     ForeignKey,
-    MetaData,
+    Index,
     String,
     Table,
     text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 
-metadata = MetaData()
+from app.models._base import metadata
 
 pharmacy_staff = Table(
     "pharmacy_staff",
     metadata,
-    Column("id", UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")),
+    Column("id", UUID(as_uuid=True), primary_key=True, server_default=text("uuid_generate_v7()")),
     Column(
         "user_id",
         UUID(as_uuid=True),
@@ -44,9 +43,12 @@ pharmacy_staff = Table(
     Column("employment_type", String(50)),  # full-time, part-time, contract
     Column("date_joined", Date),
     Column("date_left", Date),
-    # Permissions (JSON for flexible access control)
-    Column("permissions", JSON),
+    # Permissions (JSONB for flexible, indexable access control)
+    Column("permissions", JSONB, server_default=text("'{}'::jsonb")),
     # Metadata
     Column("created_at", DateTime(timezone=True), nullable=False, server_default=text("NOW()")),
     Column("updated_at", DateTime(timezone=True), nullable=False, server_default=text("NOW()")),
 )
+
+# Permission lookups (permissions ? 'dispense', permissions @> '{...}')
+Index("ix_pharmacy_staff_permissions_gin", pharmacy_staff.c.permissions, postgresql_using="gin")
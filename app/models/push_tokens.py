@@ -5,15 +5,16 @@ from sqlalchemy import (
     CheckConstraint,
     Column,
     ForeignKey,
-    MetaData,
+    Index,
     String,
     Table,
     Text,
+    UniqueConstraint,
     text,
 )
 from sqlalchemy.dialects.postgresql import TIMESTAMP, UUID
 
-metadata = MetaData()
+from app.models._base import metadata
 
 push_tokens = Table(
     "push_tokens",
@@ -22,7 +23,7 @@ push_tokens = Table(
         "id",
         UUID(as_uuid=True),
         primary_key=True,
-        server_default=text("gen_random_uuid()"),
+        server_default=text("uuid_generate_v7()"),
     ),
     Column(
         "user_id",
@@ -33,7 +34,7 @@ push_tokens = Table(
     ),
     Column("fcm_token", Text, nullable=False),
     Column("platform", String(10), nullable=False),
-    Column("is_active", Boolean, nullable=False, server_default=text("true"), index=True),
+    Column("is_active", Boolean, nullable=False, server_default=text("true")),
     Column("last_used_at", TIMESTAMP(timezone=True), nullable=True),
     Column(
         "created_at",
@@ -45,4 +46,13 @@ push_tokens = Table(
         "platform IN ('android', 'ios', 'web')",
         name="push_tokens_platform_check",
     ),
+    # Conflict target of the register_token upsert (created in migration 004)
+    UniqueConstraint("user_id", "fcm_token", name="unique_user_fcm_token"),
+)
+
+# Active tokens for a user (partial: inactive tokens are never looked up by user)
+Index(
+    "ix_push_tokens_user_active",
+    push_tokens.c.user_id,
+    postgresql_where=push_tokens.c.is_active,
 )
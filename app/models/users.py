@@ -4,25 +4,26 @@ from sqlalchemy import (
     Boolean,
     Column,
     DateTime,
-    MetaData,
+    Index,
     String,
     Table,
     Text,
+    cast,
     text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import CITEXT, UUID
 
-metadata = MetaData()
+from app.models._base import metadata
 
 users = Table(
     "users",
     metadata,
     # Internal ID (for joins & performance)
-    Column("id", UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")),
+    Column("id", UUID(as_uuid=True), primary_key=True, server_default=text("uuid_generate_v7()")),
     # Firebase identity (SOURCE OF TRUTH)
     Column("firebase_uid", Text, nullable=False, unique=True, index=True),
     # Auth-related info (mirrored from Firebase)
-    Column("email", Text, nullable=False, index=True),
+    Column("email", CITEXT, nullable=False, index=True),
     Column("email_verified", Boolean, nullable=False, server_default=text("false")),
     Column("auth_provider", Text, nullable=False, server_default=text("'google'")),
     # Profile info (mutable)
@@ -41,3 +42,24 @@ users = Table(
     Column("updated_at", DateTime(timezone=True), nullable=False, server_default=text("NOW()")),
     Column("last_login_at", DateTime(timezone=True)),
 )
+
+# Admin listing: filter by role/active status, newest first
+Index("ix_users_role_active_created", users.c.role, users.c.is_active, users.c.created_at)
+
+# Active user counts/role breakdowns (partial: inactive accounts are excluded)
+Index("ix_users_active_role", users.c.role, postgresql_where=users.c.is_active)
+
+# Admin substring search on email/name (ILIKE '%term%'); requires pg_trgm.
+# Email is CITEXT, so the index is on its text cast to match the query's operator
+Index(
+    "ix_users_email_trgm",
+    cast(users.c.email, Text).label("email_text"),
+    postgresql_using="gin",
+    postgresql_ops={"email_text": "gin_trgm_ops"},
+)
+Index(
+    "ix_users_full_name_trgm",
+    users.c.full_name,
+    postgresql_using="gin",
+    postgresql_ops={"full_name": "gin_trgm_ops"},
+)
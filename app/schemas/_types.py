@@ -0,0 +1,48 @@
+"""Shared annotated field types for schemas."""
+
+from decimal import Decimal
+from functools import lru_cache
+from typing import Annotated, Any
+
+from pydantic import (
+    BeforeValidator,
+    EmailStr,
+    PlainSerializer,
+    TypeAdapter,
+    ValidationError,
+    WithJsonSchema,
+)
+
+# Decimal that keeps full precision in Python but is emitted as a JSON number.
+# The serializer is part of the type's core schema, so it runs inside pydantic-core
+# instead of calling back into a per-model field_serializer method.
+FloatDecimal = Annotated[Decimal, PlainSerializer(float, return_type=float, when_used="json")]
+
+_EMAIL_ADAPTER = TypeAdapter(EmailStr)
+
+
+@lru_cache(maxsize=4096)
+def _validate_email_str(value: str) -> str:
+    """Run email-validator once per distinct address (failures are not cached)."""
+    try:
+        return _EMAIL_ADAPTER.validate_python(value)
+    except ValidationError as e:
+        raise ValueError(e.errors()[0]["msg"]) from None
+
+
+def _validate_email(value: Any) -> str:
+    """Validate and normalize an email address, memoizing successful results."""
+    # Validators must raise ValueError (not TypeError) to produce a 422
+    if not isinstance(value, str):
+        raise ValueError("Input should be a valid string")  # noqa: TRY004
+    return _validate_email_str(value)
+
+
+# EmailStr behaviour (same normalization, same OpenAPI format) with the
+# email-validator parse cached: the same addresses are re-validated on every
+# profile read and login.
+CachedEmail = Annotated[
+    str,
+    BeforeValidator(_validate_email),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
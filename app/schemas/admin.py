@@ -6,6 +6,12 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
+# OpenAPI examples for AdminMetricsResponse, built once at import time
+_EX_USERS = {"total": 1000, "active": 850}
+_EX_APPOINTMENTS = {"total": 5000, "pending": 120, "confirmed": 200}
+_EX_PHARMACIES = {"total": 150, "verified": 120, "active": 145}
+_EX_NOTIFICATIONS = {"sent_today": 320}
+
 
 class DashboardStatsResponse(BaseModel):
     """Response schema for dashboard statistics."""
@@ -17,10 +23,33 @@ class DashboardStatsResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class AdminUserRow(BaseModel):
+    """User row as returned by admin listings."""
+
+    id: UUID
+    firebase_uid: str
+    email: str
+    email_verified: bool
+    auth_provider: str
+    full_name: str | None = None
+    given_name: str | None = None
+    family_name: str | None = None
+    photo_url: str | None = None
+    phone: str | None = None
+    role: str
+    is_active: bool
+    is_onboarded: bool
+    created_at: datetime
+    updated_at: datetime
+    last_login_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
 class AdminUserListResponse(BaseModel):
     """Response schema for admin user listing."""
 
-    users: list[dict[str, Any]]
+    users: list[AdminUserRow]
     total: int
     page: int
     page_size: int
@@ -29,10 +58,35 @@ class AdminUserListResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class AdminAppointmentRow(BaseModel):
+    """Appointment row as returned by admin listings."""
+
+    id: UUID
+    patient_id: UUID
+    doctor_id: UUID | None = None
+    clinic_id: UUID | None = None
+    doctor_clinic_id: UUID | None = None
+    clinic_name: str | None = None
+    doctor_name: str
+    appointment_at: datetime
+    appointment_end_at: datetime | None = None
+    reason: str
+    contact_phone: str
+    status: str
+    notes: str | None = None
+    source: str | None = None
+    created_at: datetime
+    updated_at: datetime
+    cancelled_at: datetime | None = None
+    deleted_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
 class AdminAppointmentListResponse(BaseModel):
     """Response schema for admin appointment listing."""
 
-    appointments: list[dict[str, Any]]
+    appointments: list[AdminAppointmentRow]
     total: int
     page: int
     page_size: int
@@ -44,28 +98,52 @@ class AdminAppointmentListResponse(BaseModel):
 class AdminMetricsResponse(BaseModel):
     """Response schema for admin metrics."""
 
-    users: dict[str, int] = Field(
-        description="User metrics (total, active)", examples=[{"total": 1000, "active": 850}]
-    )
+    users: dict[str, int] = Field(description="User metrics (total, active)", examples=[_EX_USERS])
     appointments: dict[str, int] = Field(
         description="Appointment metrics (total, pending, confirmed)",
-        examples=[{"total": 5000, "pending": 120, "confirmed": 200}],
+        examples=[_EX_APPOINTMENTS],
     )
     pharmacies: dict[str, int] = Field(
         description="Pharmacy metrics (total, verified, active)",
-        examples=[{"total": 150, "verified": 120, "active": 145}],
+        examples=[_EX_PHARMACIES],
     )
     notifications: dict[str, int] = Field(
-        description="Notification metrics (sent_today)", examples=[{"sent_today": 320}]
+        description="Notification metrics (sent_today)", examples=[_EX_NOTIFICATIONS]
     )
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class NotificationLogRow(BaseModel):
+    """Notification row as returned by the admin audit log."""
+
+    id: UUID
+    user_id: UUID
+    title: str
+    body: str
+    notification_type: str
+    priority: str
+    data: dict[str, Any] | None = None
+    status: str
+    sent_at: datetime | None = None
+    delivered_at: datetime | None = None
+    read_at: datetime | None = None
+    failure_reason: str | None = None
+    retry_count: int
+    max_retries: int
+    scheduled_for: datetime | None = None
+    expires_at: datetime | None = None
+    metadata: dict[str, Any] | None = None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
 class NotificationLogListResponse(BaseModel):
     """Response schema for notification logs."""
 
-    logs: list[dict[str, Any]]
+    logs: list[NotificationLogRow]
     total: int
     page: int
     page_size: int
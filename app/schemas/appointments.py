@@ -4,9 +4,12 @@ from datetime import datetime
 from enum import StrEnum
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from pydantic_core.core_schema import ValidationInfo
 
+# Separators stripped from phone numbers before digit validation
+_PHONE_SEPARATORS = str.maketrans("", "", "-+() ")
+
 
 class AppointmentStatus(StrEnum):
     """Appointment status enumeration."""
@@ -44,9 +47,7 @@ class AppointmentBase(BaseModel):
     def validate_phone(cls, v: str) -> str:
         """Validate phone number format."""
         # Remove common separators
-        cleaned = (
-            v.replace("-", "").replace(" ", "").replace("(", "").replace(")", "").replace("+", "")
-        )
+        cleaned = v.translate(_PHONE_SEPARATORS)
         if not cleaned.isdigit():
             raise ValueError("Phone number must contain only digits and separators")
         if len(cleaned) < 7:
@@ -107,7 +108,7 @@ class AppointmentResponse(AppointmentBase):
     cancelled_at: datetime | None = None
     deleted_at: datetime | None = None
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class AppointmentListResponse(BaseModel):
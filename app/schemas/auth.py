@@ -1,6 +1,8 @@
 """Authentication schemas."""
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas._types import CachedEmail
 
 
 class Token(BaseModel):
@@ -27,7 +29,7 @@ class GoogleUserInfo(BaseModel):
     """Google user information."""
 
     id: str
-    email: EmailStr
+    email: CachedEmail
     name: str
     picture: str | None = None
     verified_email: bool = False
@@ -37,12 +39,12 @@ class UserResponse(BaseModel):
     """User response schema."""
 
     id: str
-    email: EmailStr
+    email: CachedEmail
     name: str
     picture: str | None = None
     is_active: bool = True
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class LoginResponse(BaseModel):
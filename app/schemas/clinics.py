@@ -1,10 +1,16 @@
 """Clinic schemas for request/response validation."""
 
+import re
 from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_serializer, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+
+from app.schemas._types import FloatDecimal
+
+# Runs of whitespace/underscores collapsed into a single hyphen when generating slugs
+_SLUG_SEPARATORS = re.compile(r"[\s_]+")
 
 # ============================================================================
 # Clinic Base Schemas
@@ -23,8 +29,8 @@ class ClinicBase(BaseModel):
         description="Contact information: email, phone_primary, phone_secondary, website",
     )
     address: str = Field(..., min_length=1, description="Full address")
-    latitude: Decimal | None = Field(None, ge=-90, le=90)
-    longitude: Decimal | None = Field(None, ge=-180, le=180)
+    latitude: FloatDecimal | None = Field(None, ge=-90, le=90)
+    longitude: FloatDecimal | None = Field(None, ge=-180, le=180)
     opening_hours: dict | None = Field(
         None, description="Opening hours by day: {day: {open: time, close: time}}"
     )
@@ -39,7 +45,7 @@ class ClinicCreate(ClinicBase):
         """Generate slug from name if not provided."""
         if v is None and "name" in info.data:
             name = info.data["name"]
-            return name.lower().replace(" ", "-").replace("_", "-")
+            return _SLUG_SEPARATORS.sub("-", name.lower().strip())
         return v or ""
 
 
@@ -64,7 +70,7 @@ class ClinicResponse(ClinicBase):
     """Clinic response schema."""
 
     id: UUID
-    rating: Decimal | None = None
+    rating: FloatDecimal | None = None
     rating_count: int = 0
     status: str
     is_active: bool
@@ -72,12 +78,7 @@ class ClinicResponse(ClinicBase):
     updated_at: datetime
     deleted_at: datetime | None = None
 
-    model_config = {"from_attributes": True}
-
-    @field_serializer("latitude", "longitude", "rating", when_used="json")
-    def serialize_decimal(self, value: Decimal | None) -> float | None:
-        """Serialize Decimal to float for JSON."""
-        return float(value) if value is not None else None
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ClinicListResponse(BaseModel):
@@ -89,9 +90,9 @@ class ClinicListResponse(BaseModel):
     description: str | None
     logo_url: str | None
     address: str
-    latitude: Decimal | None
-    longitude: Decimal | None
-    rating: Decimal | None
+    latitude: FloatDecimal | None
+    longitude: FloatDecimal | None
+    rating: FloatDecimal | None
     rating_count: int
     status: str
     is_active: bool
@@ -99,39 +100,11 @@ class ClinicListResponse(BaseModel):
         None, description="Distance in kilometers (if location search)"
     )
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
-    @field_serializer("latitude", "longitude", "rating", when_used="json")
-    def serialize_decimal(self, value: Decimal | None) -> float | None:
-        """Serialize Decimal to float for JSON."""
-        return float(value) if value is not None else None
 
-
-class ClinicItemResponse(BaseModel):
-    """Individual clinic item (deprecated - use ClinicListResponse)."""
-
-    id: UUID
-    name: str
-    slug: str | None
-    description: str | None
-    logo_url: str | None
-    address: str
-    latitude: Decimal | None
-    longitude: Decimal | None
-    rating: Decimal | None
-    rating_count: int
-    status: str
-    is_active: bool
-    distance_km: float | None = Field(
-        None, description="Distance in kilometers (if location search)"
-    )
-
-    model_config = {"from_attributes": True}
-
-    @field_serializer("latitude", "longitude", "rating", when_used="json")
-    def serialize_decimal(self, value: Decimal | None) -> float | None:
-        """Serialize Decimal to float for JSON."""
-        return float(value) if value is not None else None
+# Deprecated alias kept for backwards compatibility
+ClinicItemResponse = ClinicListResponse
 
 
 # ============================================================================
@@ -159,3 +132,7 @@ class ClinicNearbySearch(BaseModel):
     radius_km: float = Field(10.0, gt=0, le=100, description="Search radius in kilometers")
     is_active: bool = True
     min_rating: Decimal | None = Field(None, ge=0, le=5)
+
+
+# Module-level adapter for list responses (schema compiled once at import)
+CLINIC_LIST_ADAPTER = TypeAdapter(list[ClinicListResponse])
@@ -4,7 +4,9 @@ from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from app.schemas._types import FloatDecimal
 
 # ============================================================================
 # Doctor-Clinic Association Schemas
@@ -15,7 +17,7 @@ class DoctorClinicBase(BaseModel):
     """Base schema for doctor-clinic association."""
 
     is_primary: bool = False
-    consultation_fee: Decimal | None = Field(
+    consultation_fee: FloatDecimal | None = Field(
         None, ge=0, description="Clinic-specific consultation fee"
     )
     consultation_duration_minutes: int | None = Field(None, ge=5, le=180)
@@ -66,18 +68,13 @@ class DoctorClinicResponse(DoctorClinicBase):
     end_date: datetime | None = None
     total_appointments: int = 0
     completed_appointments: int = 0
-    rating_at_clinic: Decimal | None = None
+    rating_at_clinic: FloatDecimal | None = None
     rating_count_at_clinic: int = 0
     status: str
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
-
-    @field_serializer("consultation_fee", "rating_at_clinic", when_used="json")
-    def serialize_decimal(self, value: Decimal | None) -> float | None:
-        """Serialize Decimal to float for JSON."""
-        return float(value) if value is not None else None
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class DoctorAtClinicResponse(BaseModel):
@@ -88,23 +85,18 @@ class DoctorAtClinicResponse(BaseModel):
     specialization: str | None
     license_number: str | None
     experience_years: int | None
-    consultation_fee: Decimal | None
+    consultation_fee: FloatDecimal | None
     consultation_duration_minutes: int | None
     department: str | None
     designation: str | None
     available_days: list[str] | None
     available_time_slots: list[dict] | None
-    rating_at_clinic: Decimal | None
+    rating_at_clinic: FloatDecimal | None
     rating_count_at_clinic: int
     is_primary: bool
     status: str
 
-    model_config = {"from_attributes": True}
-
-    @field_serializer("consultation_fee", "rating_at_clinic", when_used="json")
-    def serialize_decimal(self, value: Decimal | None) -> float | None:
-        """Serialize Decimal to float for JSON."""
-        return float(value) if value is not None else None
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ClinicForDoctorResponse(BaseModel):
@@ -113,21 +105,16 @@ class ClinicForDoctorResponse(BaseModel):
     clinic_id: UUID
     clinic_name: str
     clinic_address: str
-    clinic_latitude: Decimal | None
-    clinic_longitude: Decimal | None
-    consultation_fee: Decimal | None
+    clinic_latitude: FloatDecimal | None
+    clinic_longitude: FloatDecimal | None
+    consultation_fee: FloatDecimal | None
     department: str | None
     designation: str | None
     available_days: list[str] | None
     is_primary: bool
     status: str
 
-    model_config = {"from_attributes": True}
-
-    @field_serializer("clinic_latitude", "clinic_longitude", "consultation_fee", when_used="json")
-    def serialize_decimal(self, value: Decimal | None) -> float | None:
-        """Serialize Decimal to float for JSON."""
-        return float(value) if value is not None else None
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class EndAssociationRequest(BaseModel):
@@ -136,3 +123,7 @@ class EndAssociationRequest(BaseModel):
     end_date: datetime | None = Field(
         None, description="End date for the association. Defaults to current time if not provided."
     )
+
+
+# Module-level adapter for list responses (schema compiled once at import)
+DOCTOR_AT_CLINIC_LIST_ADAPTER = TypeAdapter(list[DoctorAtClinicResponse])
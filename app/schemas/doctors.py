@@ -4,7 +4,9 @@ from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from app.schemas._types import FloatDecimal
 
 # ============================================================================
 # Doctor Base Schemas
@@ -23,7 +25,7 @@ class DoctorBase(BaseModel):
     sub_specialization: str | None = Field(None, max_length=200)
     qualification: str | None = None
     experience_years: int | None = Field(None, ge=0)
-    consultation_fee: Decimal | None = Field(None, ge=0, decimal_places=2)
+    consultation_fee: FloatDecimal | None = Field(None, ge=0, decimal_places=2)
     consultation_duration_minutes: int | None = Field(None, ge=15, le=180)
     bio: str | None = None
     languages_spoken: list[str] | None = None
@@ -56,18 +58,13 @@ class DoctorResponse(DoctorBase):
     verification_documents: dict | None = None
     verified_at: datetime | None = None
     verified_by: UUID | None = None
-    rating: Decimal | None = None
+    rating: FloatDecimal | None = None
     rating_count: int = 0
     total_patients_treated: int = 0
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
-
-    @field_serializer("consultation_fee", "rating", when_used="json")
-    def serialize_decimal(self, value: Decimal | None) -> float | None:
-        """Serialize Decimal to float for JSON."""
-        return float(value) if value is not None else None
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class DoctorListResponse(BaseModel):
@@ -82,17 +79,12 @@ class DoctorListResponse(BaseModel):
     specialization: str
     sub_specialization: str | None
     experience_years: int | None
-    consultation_fee: Decimal | None
+    consultation_fee: FloatDecimal | None
     is_verified: bool
-    rating: Decimal | None
+    rating: FloatDecimal | None
     rating_count: int
 
-    model_config = {"from_attributes": True}
-
-    @field_serializer("consultation_fee", "rating", when_used="json")
-    def serialize_decimal(self, value: Decimal | None) -> float | None:
-        """Serialize Decimal to float for JSON."""
-        return float(value) if value is not None else None
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class DoctorDetailResponse(DoctorResponse):
@@ -101,7 +93,7 @@ class DoctorDetailResponse(DoctorResponse):
     # Clinic associations
     clinics: list[dict] = Field(default_factory=list)
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ============================================================================
@@ -124,7 +116,7 @@ class DoctorVerificationResponse(BaseModel):
     verified_at: datetime | None
     verified_by: UUID | None
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ============================================================================
@@ -157,3 +149,7 @@ class DoctorNearbySearch(BaseModel):
     min_rating: Decimal | None = Field(None, ge=0, le=5)
     skip: int = Field(0, ge=0)
     limit: int = Field(20, ge=1, le=100)
+
+
+# Module-level adapter for list responses (schema compiled once at import)
+DOCTOR_LIST_ADAPTER = TypeAdapter(list[DoctorListResponse])
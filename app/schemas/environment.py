@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class EnvironmentalConditionsResponse(BaseModel):
@@ -9,7 +9,4 @@ class EnvironmentalConditionsResponse(BaseModel):
     temperature: float = Field(..., description="Temperature in Celsius")
     condition: str = Field(..., description="Weather description")
 
-    class Config:
-        """Pydantic configuration for the response model."""
-
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
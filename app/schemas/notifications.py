@@ -4,18 +4,26 @@ from datetime import datetime
 from typing import Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Shared by the send-notification request schemas (one definition, one schema)
+NotificationType = Literal[
+    "appointment_reminder",
+    "appointment_confirmation",
+    "appointment_cancelled",
+    "prescription_ready",
+    "pharmacy_update",
+    "system_announcement",
+    "other",
+]
+NotificationPriority = Literal["low", "normal", "high", "urgent"]
 
 
 class PushTokenRegister(BaseModel):
     """Schema for registering FCM token."""
 
     fcm_token: str = Field(..., description="Firebase Cloud Messaging token")
-    platform: str = Field(
-        ...,
-        description="Platform type",
-        pattern="^(android|ios|web)$",
-    )
+    platform: Literal["android", "ios", "web"] = Field(..., description="Platform type")
 
 
 class PushTokenResponse(BaseModel):
@@ -29,10 +37,7 @@ class PushTokenResponse(BaseModel):
     last_used_at: datetime | None
     created_at: datetime
 
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class SendNotificationRequest(BaseModel):
@@ -42,18 +47,8 @@ class SendNotificationRequest(BaseModel):
     title: str = Field(..., min_length=1, max_length=100)
     body: str = Field(..., min_length=1, max_length=500)
     data: dict[str, str] | None = Field(default=None, description="Optional data payload")
-    notification_type: Literal[
-        "appointment_reminder",
-        "appointment_confirmation",
-        "appointment_cancelled",
-        "prescription_ready",
-        "pharmacy_update",
-        "system_announcement",
-        "other",
-    ] = Field(default="other", description="Type of notification")
-    priority: Literal["low", "normal", "high", "urgent"] = Field(
-        default="normal", description="Notification priority"
-    )
+    notification_type: NotificationType = Field(default="other", description="Type of notification")
+    priority: NotificationPriority = Field(default="normal", description="Notification priority")
 
 
 class NotificationResponse(BaseModel):
@@ -71,18 +66,8 @@ class AdminNotificationRequest(BaseModel):
     title: str = Field(..., min_length=1, max_length=100)
     body: str = Field(..., min_length=1, max_length=500)
     data: dict[str, str] | None = Field(default=None, description="Optional data payload")
-    notification_type: Literal[
-        "appointment_reminder",
-        "appointment_confirmation",
-        "appointment_cancelled",
-        "prescription_ready",
-        "pharmacy_update",
-        "system_announcement",
-        "other",
-    ] = Field(default="other", description="Type of notification")
-    priority: Literal["low", "normal", "high", "urgent"] = Field(
-        default="normal", description="Notification priority"
-    )
+    notification_type: NotificationType = Field(default="other", description="Type of notification")
+    priority: NotificationPriority = Field(default="normal", description="Notification priority")
 
 
 class NotificationRecord(BaseModel):
@@ -108,10 +93,7 @@ class NotificationRecord(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class NotificationDeliveryRecord(BaseModel):
@@ -126,10 +108,7 @@ class NotificationDeliveryRecord(BaseModel):
     failure_reason: str | None
     created_at: datetime
 
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class NotificationHistoryResponse(BaseModel):
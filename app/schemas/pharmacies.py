@@ -1,10 +1,21 @@
 """Pharmacy schemas for request/response validation."""
 
+from collections.abc import Mapping
 from datetime import datetime, time
-from decimal import Decimal
+from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field, field_serializer, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    computed_field,
+    field_validator,
+    model_validator,
+)
+
+from app.schemas._types import CachedEmail
 
 # ============================================================================
 # Pharmacy Hours Schemas
@@ -19,14 +30,6 @@ class PharmacyHoursBase(BaseModel):
     close_time: time
     is_closed: bool = False
 
-    @field_validator("day_of_week")
-    @classmethod
-    def validate_day_of_week(cls, v: int) -> int:
-        """Validate day_of_week is between 1 and 7."""
-        if not 1 <= v <= 7:
-            raise ValueError("day_of_week must be between 1 (Monday) and 7 (Sunday)")
-        return v
-
 
 class PharmacyHoursCreate(PharmacyHoursBase):
     """Schema for creating pharmacy hours."""
@@ -46,7 +49,25 @@ class PharmacyHoursInDB(PharmacyHoursBase):
     id: UUID
     pharmacy_id: UUID
 
-    model_config = {"from_attributes": True}
+    @model_validator(mode="before")
+    @classmethod
+    def minute_columns(cls, data: Any) -> Any:
+        """Read the open_min/close_min columns of DB rows as open_time/close_time."""
+        if isinstance(data, Mapping) and "open_min" in data:
+            data = dict(data)
+            data["open_time"] = data.pop("open_min")
+            data["close_time"] = data.pop("close_min")
+        return data
+
+    @field_validator("open_time", "close_time", mode="before")
+    @classmethod
+    def minutes_to_time(cls, v: int | time | str) -> time | str:
+        """Convert minute-of-day column values (0-1439) to time."""
+        if isinstance(v, int):
+            return time(v // 60, v % 60)
+        return v
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ============================================================================
@@ -89,7 +110,7 @@ class PharmacyLocationInDB(PharmacyLocationBase):
     pharmacy_id: UUID
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ============================================================================
@@ -103,7 +124,7 @@ class PharmacyBase(BaseModel):
     name: str
     description: str | None = None
     phone: str | None = None
-    email: EmailStr | None = None
+    email: CachedEmail | None = None
     supports_delivery: bool = False
     supports_pickup: bool = True
 
@@ -121,7 +142,7 @@ class PharmacyUpdate(BaseModel):
     name: str | None = None
     description: str | None = None
     phone: str | None = None
-    email: EmailStr | None = None
+    email: CachedEmail | None = None
     supports_delivery: bool | None = None
     supports_pickup: bool | None = None
     is_active: bool | None = None
@@ -133,17 +154,18 @@ class PharmacyInDB(PharmacyBase):
     id: UUID
     is_verified: bool
     is_active: bool
-    rating: Decimal
+    rating_x10: int = Field(0, exclude=True)
     rating_count: int
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
-    @field_serializer("rating", when_used="json")
-    def serialize_decimal(self, value: Decimal | None) -> float | None:
-        """Serialize Decimal to float for JSON."""
-        return float(value) if value is not None else None
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def rating(self) -> float:
+        """Rating in stars, derived from the fixed-point rating_x10 column."""
+        return self.rating_x10 / 10
 
 
 class PharmacyResponse(PharmacyInDB):
@@ -177,3 +199,8 @@ class PharmacySearchParams(BaseModel):
     supports_pickup: bool | None = None
     skip: int = Field(0, ge=0)
     limit: int = Field(20, ge=1, le=100)
+
+
+# Module-level adapters for list responses (schema compiled once at import)
+PHARMACY_LIST_ADAPTER = TypeAdapter(list[PharmacyListResponse])
+PHARMACY_HOURS_LIST_ADAPTER = TypeAdapter(list[PharmacyHoursInDB])
@@ -3,13 +3,15 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas._types import CachedEmail
 
 
 class UserBase(BaseModel):
     """Base user schema with common fields."""
 
-    email: EmailStr
+    email: CachedEmail
     full_name: str | None = None
     given_name: str | None = None
     family_name: str | None = None
@@ -49,10 +51,7 @@ class UserInDB(UserBase):
     updated_at: datetime
     last_login_at: datetime | None = None
 
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class UserResponse(UserInDB):
@@ -68,7 +67,4 @@ class UserProfile(BaseModel):
     role: str
     is_onboarded: bool
 
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
@@ -0,0 +1,88 @@
+"""Admin metrics service for the materialized dashboard counters."""
+
+import asyncio
+
+import structlog
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.models.admin_metrics import admin_metrics
+from app.schemas.admin import AdminMetricsResponse
+
+logger = structlog.get_logger()
+
+# Transaction-level advisory lock key held while refreshing: every worker runs the
+# refresh loop, but only one of them refreshes per tick
+ADMIN_METRICS_REFRESH_LOCK_ID = 2_024_022
+
+
+class AdminMetricsService:
+    """Service reading and refreshing the admin_metrics materialized view."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_metrics(self) -> AdminMetricsResponse:
+        """
+        Read the latest metrics snapshot.
+
+        Returns:
+            Admin metrics as of the last view refresh
+        """
+        result = await self.db.execute(select(admin_metrics))
+        row = result.mappings().one()
+
+        return AdminMetricsResponse(
+            users={"total": row["users_total"], "active": row["users_active"]},
+            appointments={
+                "total": row["appointments_total"],
+                "pending": row["appointments_pending"],
+                "confirmed": row["appointments_confirmed"],
+            },
+            pharmacies={
+                "total": row["pharmacies_total"],
+                "verified": row["pharmacies_verified"],
+                "active": row["pharmacies_active"],
+            },
+            notifications={"sent_today": row["notifications_sent_today"]},
+        )
+
+    @staticmethod
+    async def refresh(engine: AsyncEngine) -> bool:
+        """
+        Recompute the admin_metrics view without blocking readers.
+
+        Skipped when another process holds the refresh lock, i.e. is already
+        refreshing the view.
+
+        Args:
+            engine: Database engine to run the refresh on
+
+        Returns:
+            True if this call refreshed the view
+        """
+        async with engine.begin() as conn:
+            locked = await conn.scalar(
+                select(func.pg_try_advisory_xact_lock(ADMIN_METRICS_REFRESH_LOCK_ID))
+            )
+            if not locked:
+                return False
+            await conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY admin_metrics"))
+        return True
+
+    @staticmethod
+    async def run_refresh_loop(engine: AsyncEngine, interval: float) -> None:
+        """
+        Refresh the admin_metrics view every ``interval`` seconds until cancelled.
+
+        Args:
+            engine: Database engine to run the refreshes on
+            interval: Seconds to wait between refreshes
+        """
+        while True:
+            try:
+                await AdminMetricsService.refresh(engine)
+            except Exception as e:
+                # Keep the loop alive; the dashboard serves the previous snapshot
+                logger.error("admin_metrics_refresh_failed", error=str(e))
+            await asyncio.sleep(interval)
@@ -1,13 +1,30 @@
 """Appointment service for business logic."""
 
-from datetime import datetime
-from typing import Any
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any, NoReturn, get_args
 from uuid import UUID
 
-from sqlalchemy import and_, delete, func, insert, select, update
+import structlog
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Row,
+    Select,
+    and_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import ForbiddenException, NotFoundException
+from app.core.redis_client import AsyncCacheManager, get_async_redis_client
 from app.models.appointments import appointments
 from app.schemas.appointments import (
     AppointmentCreate,
@@ -20,6 +37,154 @@ from app.schemas.appointments import (
 )
 from app.services.notification_service import NotificationService
 
+logger = structlog.get_logger(__name__)
+
+# Strong references to in-flight notification tasks (the event loop keeps only weak ones)
+_background_tasks: set[asyncio.Task[None]] = set()
+
+# Background sends running at once; each holds a pooled DB connection while it works
+NOTIFY_MAX_CONCURRENT = 8
+_notify_semaphore = asyncio.Semaphore(NOTIFY_MAX_CONCURRENT)
+
+# How long shutdown waits for in-flight notification sends before cancelling them
+NOTIFY_DRAIN_GRACE_PERIOD = 10.0
+
+
+async def drain_background_tasks(grace_period: float | None = NOTIFY_DRAIN_GRACE_PERIOD) -> None:
+    """
+    Wait for in-flight notification tasks to finish.
+
+    Called on application shutdown, before the engine is disposed, so sends
+    started by recent requests still get written. Tasks still running after
+    the grace period are cancelled and logged.
+
+    Args:
+        grace_period: Seconds to wait, or None to wait indefinitely
+    """
+    if not _background_tasks:
+        return
+
+    _, pending = await asyncio.wait(set(_background_tasks), timeout=grace_period)
+    if pending:
+        logger.warning("background_notifications_cancelled", count=len(pending))
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+_OPTIONAL_LIST_FILTERS = ("status", "doctor_id", "clinic_id", "from_date", "to_date")
+
+
+@lru_cache(maxsize=32)
+def _list_appointments_stmts(
+    has_status: bool,
+    has_doctor_id: bool,
+    has_clinic_id: bool,
+    has_from_date: bool,
+    has_to_date: bool,
+) -> tuple[Select, Select]:
+    """
+    Build the list_appointments page and count statements for one filter shape.
+
+    Filter values are bind parameters, so each of the 32 shapes is built once
+    and its compiled form is reused from SQLAlchemy's statement cache.
+
+    Args:
+        has_status: Filter by status
+        has_doctor_id: Filter by doctor
+        has_clinic_id: Filter by clinic
+        has_from_date: Filter by earliest appointment time
+        has_to_date: Filter by latest appointment time
+
+    Returns:
+        Tuple of (paginated select with a COUNT(*) OVER () "_total" column, count select)
+    """
+    conditions = [
+        appointments.c.patient_id == bindparam("patient_id"),
+        appointments.c.deleted_at.is_(None),
+    ]
+
+    if has_status:
+        conditions.append(appointments.c.status == bindparam("status"))
+
+    if has_doctor_id:
+        conditions.append(appointments.c.doctor_id == bindparam("doctor_id"))
+
+    if has_clinic_id:
+        conditions.append(appointments.c.clinic_id == bindparam("clinic_id"))
+
+    if has_from_date:
+        conditions.append(appointments.c.appointment_at >= bindparam("from_date"))
+
+    if has_to_date:
+        conditions.append(appointments.c.appointment_at <= bindparam("to_date"))
+
+    where = and_(*conditions)
+
+    page_stmt = (
+        select(appointments, func.count().over().label("_total"))
+        .where(where)
+        .order_by(appointments.c.appointment_at.desc())
+        .limit(bindparam("limit", type_=Integer))
+        .offset(bindparam("offset", type_=Integer))
+    )
+    count_stmt = select(func.count()).select_from(appointments).where(where)
+
+    return page_stmt, count_stmt
+
+
+# AppointmentResponse field names, resolved once for _row_to_response
+_RESPONSE_FIELDS = tuple(AppointmentResponse.model_fields)
+
+# Response fields that may not be None although their column allows NULL (source)
+_NOT_NONE_FIELDS = tuple(
+    name
+    for name, field in AppointmentResponse.model_fields.items()
+    if appointments.c[name].nullable and type(None) not in get_args(field.annotation)
+)
+
+
+def _owned_appointment(appointment_id: UUID, user_id: str) -> tuple[ColumnElement[bool], ...]:
+    """
+    WHERE conditions matching a live appointment owned by the user.
+
+    Args:
+        appointment_id: Appointment ID
+        user_id: ID of requesting user
+
+    Returns:
+        Conditions for ``.where(*...)``
+    """
+    return (
+        appointments.c.id == appointment_id,
+        appointments.c.patient_id == UUID(user_id),
+        appointments.c.deleted_at.is_(None),
+    )
+
+
+def _row_to_response(row: Row) -> AppointmentResponse:
+    """
+    Build an AppointmentResponse from an appointments row without validation.
+
+    Rows come straight from the appointments table, whose column types and enum
+    already enforce the schema, so the validator chain is skipped. Only status is
+    converted, so it serializes as the enum (an unknown value raises ValueError),
+    and NULLs in columns the schema requires raise ValueError too.
+
+    Args:
+        row: Row selected or returned from the appointments table
+
+    Returns:
+        Appointment response
+    """
+    mapping = row._mapping
+    values = {name: mapping[name] for name in _RESPONSE_FIELDS}
+    values["status"] = AppointmentStatus(values["status"])
+    for name in _NOT_NONE_FIELDS:
+        if values[name] is None:
+            raise ValueError(f"Appointment {values['id']} has no {name}")
+    return AppointmentResponse.model_construct(**values)
+
 
 class AppointmentService:
     """Service for managing appointments."""
@@ -28,6 +193,41 @@ class AppointmentService:
         """Initialize service with database session."""
         self.db = db
 
+    def _notify_in_background(
+        self,
+        send: Callable[..., Awaitable[None]],
+        failure_event: str,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Schedule a notification send after the response-side work is done.
+
+        The task gets its own session on the same engine: the request session is
+        closed once the response is returned. A semaphore keeps bursts of sends
+        from draining the connection pool. Failures are logged, never raised;
+        shutdown waits for pending tasks via ``drain_background_tasks``.
+
+        Args:
+            send: NotificationService coroutine function taking ``db``, ``cache`` and
+                kwargs
+            failure_event: Log event name used if sending fails
+            **kwargs: Arguments passed to ``send``
+        """
+
+        async def run() -> None:
+            try:
+                async with (
+                    _notify_semaphore,
+                    AsyncSession(self.db.bind, expire_on_commit=False) as db,
+                ):
+                    await send(db=db, cache=AsyncCacheManager(get_async_redis_client()), **kwargs)
+            except Exception as e:
+                logger.warning(failure_event, error=str(e))
+
+        task = asyncio.create_task(run())
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
     async def create_appointment(
         self,
         patient_id: str,
@@ -63,21 +263,15 @@ class AppointmentService:
         await self.db.commit()
 
         row = result.fetchone()
-        appointment_response = AppointmentResponse.model_validate(dict(row._mapping))
-
-        # Send push notification (async, non-blocking)
-        try:
-            await NotificationService.send_appointment_created_notification(
-                db=self.db,
-                user_id=patient_id,
-                appointment_data=dict(row._mapping),
-            )
-        except Exception as e:
-            # Log error but don't fail the request
-            import structlog
-
-            logger = structlog.get_logger()
-            logger.warning("failed_to_send_appointment_notification", error=str(e))
+        appointment_response = _row_to_response(row)
+
+        # Send push notification without holding up the response
+        self._notify_in_background(
+            NotificationService.send_appointment_created_notification,
+            "failed_to_send_appointment_notification",
+            user_id=patient_id,
+            appointment_data=row._mapping,
+        )
 
         return appointment_response
 
@@ -117,7 +311,26 @@ class AppointmentService:
         if str(row.patient_id) != user_id:
             raise ForbiddenException("Access denied to this appointment")
 
-        return AppointmentResponse.model_validate(dict(row._mapping))
+        return _row_to_response(row)
+
+    async def _raise_not_updatable(self, appointment_id: UUID, user_id: str) -> NoReturn:
+        """
+        Raise the error for a write that matched no owned appointment.
+
+        Only reached on the failure path, so the extra lookup is off the hot path.
+
+        Args:
+            appointment_id: Appointment ID
+            user_id: ID of requesting user
+
+        Raises:
+            NotFoundException: If appointment not found
+            ForbiddenException: If user doesn't have access
+        """
+        await self.db.rollback()
+        await self.get_appointment(appointment_id, user_id)
+        # Visible and owned now, so it changed between the two statements
+        raise NotFoundException("Appointment not found")
 
     async def list_appointments(
         self,
@@ -134,47 +347,35 @@ class AppointmentService:
         Returns:
             Paginated list of appointments
         """
-        # Build where conditions
-        conditions = [
-            appointments.c.patient_id == UUID(user_id),
-            appointments.c.deleted_at.is_(None),
-        ]
-
-        if filters.status:
-            conditions.append(appointments.c.status == filters.status.value)
-
-        if filters.doctor_id:
-            conditions.append(appointments.c.doctor_id == filters.doctor_id)
-
-        if filters.clinic_id:
-            conditions.append(appointments.c.clinic_id == filters.clinic_id)
-
-        if filters.from_date:
-            conditions.append(appointments.c.appointment_at >= filters.from_date)
-
-        if filters.to_date:
-            conditions.append(appointments.c.appointment_at <= filters.to_date)
-
-        # Count total
-        count_stmt = select(func.count()).select_from(appointments).where(and_(*conditions))
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar() or 0
+        # Only the filters that are set become conditions; the statement for each
+        # combination is built once and reused with fresh bind parameters
+        params: dict[str, Any] = {
+            "patient_id": UUID(user_id),
+            "status": filters.status.value if filters.status else None,
+            "doctor_id": filters.doctor_id,
+            "clinic_id": filters.clinic_id,
+            "from_date": filters.from_date,
+            "to_date": filters.to_date,
+        }
+        page_stmt, count_stmt = _list_appointments_stmts(
+            *(params[name] is not None for name in _OPTIONAL_LIST_FILTERS)
+        )
 
-        # Get paginated results
         offset = (filters.page - 1) * filters.page_size
-
-        stmt = (
-            select(appointments)
-            .where(and_(*conditions))
-            .order_by(appointments.c.appointment_at.desc())
-            .limit(filters.page_size)
-            .offset(offset)
+        result = await self.db.execute(
+            page_stmt, {**params, "limit": filters.page_size, "offset": offset}
         )
-
-        result = await self.db.execute(stmt)
         rows = result.fetchall()
 
-        items = [AppointmentResponse.model_validate(dict(row._mapping)) for row in rows]
+        if rows:
+            total = rows[0]._total
+        elif offset:
+            # Page past the end: no row carries the window count, fall back to COUNT
+            total = (await self.db.execute(count_stmt, params)).scalar_one()
+        else:
+            total = 0
+
+        items = [_row_to_response(row) for row in rows]
 
         return AppointmentListResponse(
             total=total,
@@ -204,9 +405,6 @@ class AppointmentService:
             NotFoundException: If appointment not found
             ForbiddenException: If user doesn't have access
         """
-        # Check access
-        await self.get_appointment(appointment_id, user_id)
-
         # Build update values
         update_values: dict[str, Any] = {}
         for field, value in data.model_dump(exclude_unset=True).items():
@@ -220,20 +418,23 @@ class AppointmentService:
             # No changes, return current state
             return await self.get_appointment(appointment_id, user_id)
 
-        update_values["updated_at"] = datetime.utcnow()
+        update_values["updated_at"] = datetime.now(UTC)
 
+        # Access check is part of the WHERE clause: no row means not found or forbidden
         stmt = (
             update(appointments)
-            .where(appointments.c.id == appointment_id)
+            .where(*_owned_appointment(appointment_id, user_id))
             .values(**update_values)
             .returning(appointments)
         )
 
         result = await self.db.execute(stmt)
-        await self.db.commit()
-
         row = result.fetchone()
-        return AppointmentResponse.model_validate(dict(row._mapping))
+        if row is None:
+            await self._raise_not_updatable(appointment_id, user_id)
+
+        await self.db.commit()
+        return _row_to_response(row)
 
     async def update_appointment_status(
         self,
@@ -252,49 +453,50 @@ class AppointmentService:
         Returns:
             Updated appointment
         """
-        # Check access and get current state
-        current_appointment = await self.get_appointment(appointment_id, user_id)
-        old_status = current_appointment.status
-
+        now = datetime.now(UTC)
         update_values = {
             "status": data.status.value,
-            "updated_at": datetime.utcnow(),
+            "updated_at": now,
         }
 
         if data.notes:
             update_values["notes"] = data.notes
 
         if data.status == AppointmentStatus.CANCELLED:
-            update_values["cancelled_at"] = datetime.utcnow()
-
+            update_values["cancelled_at"] = now
+
+        # Lock the owned row and capture its current status in the same statement
+        old = (
+            select(appointments.c.id, appointments.c.status)
+            .where(*_owned_appointment(appointment_id, user_id))
+            .with_for_update()
+            .cte("old")
+        )
         stmt = (
             update(appointments)
-            .where(appointments.c.id == appointment_id)
+            .where(appointments.c.id == old.c.id)
             .values(**update_values)
-            .returning(appointments)
+            .returning(appointments, old.c.status.label("old_status"))
         )
 
         result = await self.db.execute(stmt)
-        await self.db.commit()
-
         row = result.fetchone()
-        appointment_response = AppointmentResponse.model_validate(dict(row._mapping))
+        if row is None:
+            await self._raise_not_updatable(appointment_id, user_id)
 
-        # Send push notification if status changed (async, non-blocking)
-        if old_status != data.status.value:
-            try:
-                await NotificationService.send_appointment_status_notification(
-                    db=self.db,
-                    user_id=user_id,
-                    appointment_data=dict(row._mapping),
-                    old_status=old_status,
-                )
-            except Exception as e:
-                # Log error but don't fail the request
-                import structlog
+        await self.db.commit()
+        old_status = row.old_status
+        appointment_response = _row_to_response(row)
 
-                logger = structlog.get_logger()
-                logger.warning("failed_to_send_status_notification", error=str(e))
+        # Send push notification if status changed, without holding up the response
+        if old_status != data.status.value:
+            self._notify_in_background(
+                NotificationService.send_appointment_status_notification,
+                "failed_to_send_status_notification",
+                user_id=user_id,
+                appointment_data=row._mapping,
+                old_status=old_status,
+            )
 
         return appointment_response
 
@@ -316,20 +518,18 @@ class AppointmentService:
             NotFoundException: If appointment not found
             ForbiddenException: If user doesn't have access
         """
-        # Check access
-        await self.get_appointment(appointment_id, user_id)
-
         if hard_delete:
-            stmt = delete(appointments).where(appointments.c.id == appointment_id)
+            stmt = delete(appointments).where(*_owned_appointment(appointment_id, user_id))
         else:
+            now = datetime.now(UTC)
             stmt = (
                 update(appointments)  # type: ignore[assignment]
-                .where(appointments.c.id == appointment_id)
-                .values(
-                    deleted_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
-                )
+                .where(*_owned_appointment(appointment_id, user_id))
+                .values(deleted_at=now, updated_at=now)
             )
 
-        await self.db.execute(stmt)
+        result = await self.db.execute(stmt)
+        if result.rowcount == 0:  # type: ignore[attr-defined]
+            await self._raise_not_updatable(appointment_id, user_id)
+
         await self.db.commit()
@@ -1,5 +1,6 @@
 """Authentication service for Firebase and JWT."""
 
+import time
 from datetime import timedelta
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,6 +12,7 @@ from app.core.redis_client import CacheManager
 from app.core.security import (
     create_access_token,
     create_refresh_token,
+    decode_access_token,
     decode_refresh_token,
 )
 from app.schemas.auth import Token
@@ -162,14 +164,23 @@ class AuthService:
 
         return self.create_tokens(user_id)
 
-    def revoke_token(self, token: str, ttl: int = 86400 * 365) -> None:
+    def revoke_token(self, token: str, ttl: int | None = None) -> None:
         """
         Revoke a refresh token by adding it to blacklist.
 
+        Tokens that are already invalid or expired are skipped, since
+        refresh_access_token rejects them anyway.
+
         Args:
             token: Token to revoke
-            ttl: Time to live for blacklist entry (default: 365 days)
+            ttl: Time to live for blacklist entry (default: until the token expires)
         """
+        if ttl is None:
+            payload = decode_refresh_token(token)
+            if payload is None:
+                return
+            ttl = max(int(payload["exp"] - time.time()), 1)
+
         self.cache.set(f"blacklist:{token}", "1", ttl=ttl)
 
     def validate_access_token(self, token: str) -> str | None:
@@ -182,8 +193,6 @@ class AuthService:
         Returns:
             User ID if valid, None otherwise
         """
-        from app.core.security import decode_access_token
-
         payload = decode_access_token(token)
         if payload is None:
             return None
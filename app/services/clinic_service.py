@@ -1,19 +1,38 @@
 """Clinic service for business logic."""
 
+from collections.abc import Mapping, Sequence
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, func, select, update
+from sqlalchemy import (
+    Double,
+    RowMapping,
+    and_,
+    bindparam,
+    func,
+    literal,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.redis_client import CacheManager
-from app.models.clinics import clinics
+from app.core.redis_client import AsyncCacheManager
+from app.models.clinics import clinic_location, clinics
 from app.models.doctor_clinics import doctor_clinics
 from app.models.doctors import doctors
 from app.schemas.clinics import ClinicCreate, ClinicUpdate
 from app.schemas.doctor_clinics import DoctorClinicCreate, DoctorClinicUpdate
 
+# Point lookups are built once at import; each call only binds its parameter
+_CLINIC_BY_ID = select(clinics).where(
+    clinics.c.id == bindparam("clinic_id"), clinics.c.deleted_at.is_(None)
+)
+_CLINIC_BY_SLUG = select(clinics).where(
+    clinics.c.slug == bindparam("slug"), clinics.c.deleted_at.is_(None)
+)
+
 
 class ClinicService:
     """Service for clinic operations."""
@@ -21,8 +40,13 @@ class ClinicService:
     # Cache TTL in seconds
     CLINIC_CACHE_TTL = 900  # 15 minutes for individual clinics
     CLINIC_LIST_CACHE_TTL = 300  # 5 minutes for lists
+    CLINIC_NEARBY_CACHE_TTL = 60  # 1 minute for nearby searches
+    CLINIC_MISSING_CACHE_TTL = 30  # 30 seconds for "not found" tombstones
+
+    # Stored under a slug key in place of a clinic ID when the slug doesn't exist
+    MISSING_SLUG = "__missing__"
 
-    def __init__(self, cache_manager: CacheManager | None = None):
+    def __init__(self, cache_manager: AsyncCacheManager | None = None):
         """Initialize service with optional cache manager."""
         self.cache = cache_manager
 
@@ -32,11 +56,33 @@ class ClinicService:
         return f"clinic:{clinic_id}"
 
     @staticmethod
-    def _get_clinic_list_cache_key(
-        skip: int, limit: int, is_active: bool, status: str | None
+    def _get_clinic_missing_cache_key(clinic_id: UUID) -> str:
+        """Generate cache key of the tombstone for a clinic ID that doesn't exist."""
+        return f"clinic:{clinic_id}:missing"
+
+    @staticmethod
+    def _get_clinic_slug_cache_key(slug: str) -> str:
+        """Generate cache key mapping a clinic slug to its ID."""
+        return f"clinic:slug:{slug}"
+
+    @staticmethod
+    def _get_nearby_cache_key(
+        generation: int,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        skip: int,
+        limit: int,
+        is_active: bool,
+        min_rating: float | None,
+        after_distance_km: float | None,
+        after_id: UUID | None,
     ) -> str:
-        """Generate cache key for clinic list."""
-        return f"clinic:list:{skip}:{limit}:{is_active}:{status}"
+        """Generate cache key for a nearby search under the current list generation."""
+        return (
+            f"clinic:list:{generation}:nearby:{latitude:.3f}:{longitude:.3f}:{radius_km}:"
+            f"{skip}:{limit}:{is_active}:{min_rating}:{after_distance_km}:{after_id}"
+        )
 
     async def create_clinic(self, db: AsyncSession, clinic_data: ClinicCreate) -> dict:
         """Create a new clinic."""
@@ -64,47 +110,92 @@ class ClinicService:
 
         await db.commit()
 
-        # Invalidate cache
+        # Invalidate cache, including tombstones left by lookups of the new slug/ID
         if self.cache:
-            self.cache.delete_pattern("clinic:list:*")
+            await self.cache.invalidate(
+                keys=[
+                    self._get_clinic_slug_cache_key(clinic["slug"]),
+                    self._get_clinic_missing_cache_key(clinic["id"]),
+                ],
+                generations=["clinic:list"],
+            )
 
         return dict(clinic)
 
     async def get_clinic_by_id(self, db: AsyncSession, clinic_id: UUID) -> dict | None:
         """Get clinic by ID with caching."""
-        # Try cache first
+        cache_key = self._get_clinic_cache_key(clinic_id)
+
+        # Try cache first; hits extend the TTL so popular clinics stay cached
         if self.cache:
-            cache_key = self._get_clinic_cache_key(clinic_id)
-            cached = self.cache.get_json(cache_key)
+            cached = await self.cache.get_json(cache_key, refresh_ttl=self.CLINIC_CACHE_TTL)
             if cached:
                 return cached
 
-        # Query database
-        query = select(clinics).where(clinics.c.id == clinic_id, clinics.c.deleted_at.is_(None))
+            # Tombstones live under their own key so the sliding TTL above never
+            # stretches them
+            if await self.cache.get_json(self._get_clinic_missing_cache_key(clinic_id)):
+                return None
 
-        result = await db.execute(query)
+        # Query database
+        result = await db.execute(_CLINIC_BY_ID, {"clinic_id": clinic_id})
         clinic = result.mappings().first()
 
         if not clinic:
+            if self.cache:
+                await self.cache.set_json(
+                    self._get_clinic_missing_cache_key(clinic_id),
+                    True,
+                    ttl=self.CLINIC_MISSING_CACHE_TTL,
+                )
             return None
 
         clinic_dict = dict(clinic)
 
         # Cache result
         if self.cache:
-            cache_key = self._get_clinic_cache_key(clinic_id)
-            self.cache.set_json(cache_key, clinic_dict, ttl=self.CLINIC_CACHE_TTL)
+            await self.cache.set_json(cache_key, clinic_dict, ttl=self.CLINIC_CACHE_TTL)
 
         return clinic_dict
 
     async def get_clinic_by_slug(self, db: AsyncSession, slug: str) -> dict | None:
-        """Get clinic by slug."""
-        query = select(clinics).where(clinics.c.slug == slug, clinics.c.deleted_at.is_(None))
+        """Get clinic by slug, sharing the cached clinic entry of get_clinic_by_id."""
+        # The slug key only stores the ID, so invalidating the clinic entry covers
+        # both lookups; a renamed slug is caught by comparing it to the entry
+        if self.cache:
+            slug_cache_key = self._get_clinic_slug_cache_key(slug)
+            clinic_id = await self.cache.get_json(slug_cache_key)
+            if clinic_id == self.MISSING_SLUG:
+                return None
+            if clinic_id:
+                clinic = await self.get_clinic_by_id(db, UUID(clinic_id))
+                if clinic and clinic["slug"] == slug:
+                    return clinic
+
+        result = await db.execute(_CLINIC_BY_SLUG, {"slug": slug})
+        row = result.mappings().first()
+
+        if not row:
+            if self.cache:
+                await self.cache.set_json(
+                    slug_cache_key, self.MISSING_SLUG, ttl=self.CLINIC_MISSING_CACHE_TTL
+                )
+            return None
 
-        result = await db.execute(query)
-        clinic = result.mappings().first()
+        clinic_dict = dict(row)
 
-        return dict(clinic) if clinic else None
+        # Cache the slug mapping and the clinic entry it points to
+        if self.cache:
+            await self.cache.set_json(
+                slug_cache_key, str(clinic_dict["id"]), ttl=self.CLINIC_CACHE_TTL
+            )
+            await self.cache.set_json(
+                self._get_clinic_cache_key(clinic_dict["id"]),
+                clinic_dict,
+                ttl=self.CLINIC_CACHE_TTL,
+            )
+
+        return clinic_dict
 
     async def get_clinics(
         self,
@@ -115,11 +206,26 @@ class ClinicService:
         status: str | None = None,
         name_search: str | None = None,
         min_rating: float | None = None,
-    ) -> list[dict]:
-        """Get list of clinics with filtering."""
+        after_name: str | None = None,
+        after_id: UUID | None = None,
+    ) -> Sequence[RowMapping]:
+        """
+        Get list of clinics with filtering.
+
+        Pages either by skip or, when after_name/after_id (the last clinic of the
+        previous page) are given, by seeking past that clinic in (name, id) order.
+        """
         # Build query
         conditions: list = [clinics.c.deleted_at.is_(None)]
 
+        if after_name is not None and after_id is not None:
+            conditions.append(
+                tuple_(clinics.c.name, clinics.c.id)
+                > tuple_(
+                    literal(after_name, clinics.c.name.type), literal(after_id, clinics.c.id.type)
+                )
+            )
+
         if is_active is not None:
             conditions.append(clinics.c.is_active == is_active)
 
@@ -135,15 +241,13 @@ class ClinicService:
         query = (
             select(clinics)
             .where(and_(*conditions))
-            .order_by(clinics.c.name)
+            .order_by(clinics.c.name, clinics.c.id)
             .offset(skip)
             .limit(limit)
         )
 
         result = await db.execute(query)
-        clinic_list = result.mappings().all()
-
-        return [dict(c) for c in clinic_list]
+        return result.mappings().all()
 
     async def search_clinics_nearby(
         self,
@@ -155,16 +259,40 @@ class ClinicService:
         limit: int = 20,
         is_active: bool = True,
         min_rating: float | None = None,
-    ) -> list[dict]:
-        """Search clinics near a location (simplified without PostGIS)."""
-        # Note: This is a simplified version using Haversine formula
-        # For production, use PostGIS ST_DWithin for better performance
+        after_distance_km: float | None = None,
+        after_id: UUID | None = None,
+    ) -> Sequence[Mapping[str, Any]]:
+        """
+        Search clinics near a location using the GiST-indexed location column.
+
+        Pages either by skip or, when after_distance_km/after_id (the last clinic of
+        the previous page) are given, by seeking past it in (distance, id) order.
+        """
+        # Snap to a ~110 m grid so searches from nearby points share a cache entry;
+        # the query uses the snapped point too, so cached and fresh results agree
+        latitude = round(latitude, 3)
+        longitude = round(longitude, 3)
+
+        cache_key = None
+        if self.cache:
+            generation = await self.cache.get_generation("clinic:list")
+            cache_key = self._get_nearby_cache_key(
+                generation,
+                latitude,
+                longitude,
+                radius_km,
+                skip,
+                limit,
+                is_active,
+                min_rating,
+                after_distance_km,
+                after_id,
+            )
+            cached = await self.cache.get_json(cache_key)
+            if cached is not None:
+                return cached
 
-        conditions: list = [
-            clinics.c.deleted_at.is_(None),
-            clinics.c.latitude.isnot(None),
-            clinics.c.longitude.isnot(None),
-        ]
+        conditions: list = [clinics.c.deleted_at.is_(None)]
 
         if is_active is not None:
             conditions.append(clinics.c.is_active == is_active)
@@ -172,40 +300,39 @@ class ClinicService:
         if min_rating is not None:
             conditions.append(clinics.c.rating >= min_rating)
 
-        # Haversine formula for distance calculation
-        distance_formula = (
-            func.acos(
-                func.cos(func.radians(latitude))
-                * func.cos(func.radians(clinics.c.latitude))
-                * func.cos(func.radians(clinics.c.longitude) - func.radians(longitude))
-                + func.sin(func.radians(latitude)) * func.sin(func.radians(clinics.c.latitude))
+        point = func.geography(func.ST_SetSRID(func.ST_MakePoint(longitude, latitude), 4326))
+        # KNN distance (metres, on the sphere): ordering by it walks the GiST index
+        # in distance order instead of sorting every match. It is also what gets
+        # returned and sought on, so distance_km, order and cursor always agree
+        distance_m = clinic_location.op("<->", return_type=Double)(point)
+        distance_km = distance_m / 1000
+
+        if after_distance_km is not None and after_id is not None:
+            conditions.append(
+                tuple_(distance_km, clinics.c.id)
+                > tuple_(literal(after_distance_km, Double), literal(after_id, clinics.c.id.type))
             )
-            * 6371
-        )  # Earth's radius in km
 
         query = (
-            select(clinics, distance_formula.label("distance_km"))
-            .where(and_(*conditions))
-            .having(distance_formula <= radius_km)
-            .order_by(distance_formula)
+            select(clinics, distance_km.label("distance_km"))
+            .where(and_(*conditions), func.ST_DWithin(clinic_location, point, radius_km * 1000))
+            .order_by(distance_m, clinics.c.id)
             .offset(skip)
             .limit(limit)
         )
 
         result = await db.execute(query)
-        rows = result.mappings().all()
+        rows = [dict(row) for row in result.mappings().all()]
 
-        return [dict(row) for row in rows]
+        if self.cache and cache_key:
+            await self.cache.set_json(cache_key, rows, ttl=self.CLINIC_NEARBY_CACHE_TTL)
+
+        return rows
 
     async def update_clinic(  # noqa: C901, PLR0912
         self, db: AsyncSession, clinic_id: UUID, clinic_data: ClinicUpdate
     ) -> dict | None:
         """Update clinic information."""
-        # Check if clinic exists
-        existing = await self.get_clinic_by_id(db, clinic_id)
-        if not existing:
-            return None
-
         # Build update values
         update_values: dict[str, Any] = {}
         if clinic_data.name is not None:
@@ -230,12 +357,12 @@ class ClinicService:
             update_values["status"] = clinic_data.status
 
         if not update_values:
-            return existing
+            return await self.get_clinic_by_id(db, clinic_id)
 
-        # Update clinic
+        # Update clinic; no returned row means it doesn't exist or is soft-deleted
         query = (
             update(clinics)
-            .where(clinics.c.id == clinic_id)
+            .where(clinics.c.id == clinic_id, clinics.c.deleted_at.is_(None))
             .values(**update_values)
             .returning(clinics)
         )
@@ -245,13 +372,21 @@ class ClinicService:
 
         await db.commit()
 
+        if not updated_clinic:
+            return None
+
         # Invalidate cache
         if self.cache:
-            cache_key = self._get_clinic_cache_key(clinic_id)
-            self.cache.delete(cache_key)
-            self.cache.delete_pattern("clinic:list:*")
+            await self.cache.invalidate(
+                keys=[
+                    self._get_clinic_cache_key(clinic_id),
+                    # A renamed slug may have a tombstone from earlier lookups
+                    self._get_clinic_slug_cache_key(updated_clinic["slug"]),
+                ],
+                generations=["clinic:list"],
+            )
 
-        return dict(updated_clinic) if updated_clinic else None
+        return dict(updated_clinic)
 
     async def soft_delete_clinic(self, db: AsyncSession, clinic_id: UUID) -> bool:
         """Soft delete a clinic."""
@@ -266,9 +401,9 @@ class ClinicService:
 
         # Invalidate cache
         if self.cache:
-            cache_key = self._get_clinic_cache_key(clinic_id)
-            self.cache.delete(cache_key)
-            self.cache.delete_pattern("clinic:list:*")
+            await self.cache.invalidate(
+                keys=[self._get_clinic_cache_key(clinic_id)], generations=["clinic:list"]
+            )
 
         return True
 
@@ -305,16 +440,11 @@ class ClinicService:
 
         await db.commit()
 
-        # Invalidate cache
-        if self.cache:
-            self.cache.delete_pattern(f"clinic:{association_data.clinic_id}:doctors:*")
-            self.cache.delete_pattern(f"doctor:{association_data.doctor_id}:clinics:*")
-
         return dict(association)
 
     async def get_clinic_doctors(
         self, db: AsyncSession, clinic_id: UUID, active_only: bool = True
-    ) -> list[dict]:
+    ) -> Sequence[RowMapping]:
         """Get all doctors at a clinic."""
         conditions: list = [doctor_clinics.c.clinic_id == clinic_id]
 
@@ -324,11 +454,22 @@ class ClinicService:
 
         query = (
             select(
-                doctor_clinics,
-                doctors.c.license_number,
+                # Only the DoctorAtClinicResponse fields
+                doctor_clinics.c.doctor_id,
+                doctors.c.full_name.label("doctor_name"),
                 doctors.c.specialization,
+                doctors.c.license_number,
                 doctors.c.experience_years,
-                doctors.c.full_name.label("doctor_name"),
+                doctor_clinics.c.consultation_fee,
+                doctor_clinics.c.consultation_duration_minutes,
+                doctor_clinics.c.department,
+                doctor_clinics.c.designation,
+                doctor_clinics.c.available_days,
+                doctor_clinics.c.available_time_slots,
+                doctor_clinics.c.rating_at_clinic,
+                doctor_clinics.c.rating_count_at_clinic,
+                doctor_clinics.c.is_primary,
+                doctor_clinics.c.status,
             )
             .join(doctors, doctor_clinics.c.doctor_id == doctors.c.id)
             .where(and_(*conditions))
@@ -336,13 +477,11 @@ class ClinicService:
         )
 
         result = await db.execute(query)
-        rows = result.mappings().all()
-
-        return [dict(row) for row in rows]
+        return result.mappings().all()
 
     async def get_doctor_clinics(
         self, db: AsyncSession, doctor_id: UUID, active_only: bool = True
-    ) -> list[dict]:
+    ) -> Sequence[RowMapping]:
         """Get all clinics where a doctor works."""
         conditions: list = [doctor_clinics.c.doctor_id == doctor_id]
 
@@ -352,11 +491,18 @@ class ClinicService:
 
         query = (
             select(
-                doctor_clinics,
+                # Only the ClinicForDoctorResponse fields
+                doctor_clinics.c.clinic_id,
                 clinics.c.name.label("clinic_name"),
                 clinics.c.address.label("clinic_address"),
                 clinics.c.latitude.label("clinic_latitude"),
                 clinics.c.longitude.label("clinic_longitude"),
+                doctor_clinics.c.consultation_fee,
+                doctor_clinics.c.department,
+                doctor_clinics.c.designation,
+                doctor_clinics.c.available_days,
+                doctor_clinics.c.is_primary,
+                doctor_clinics.c.status,
             )
             .join(clinics, doctor_clinics.c.clinic_id == clinics.c.id)
             .where(and_(*conditions))
@@ -364,9 +510,7 @@ class ClinicService:
         )
 
         result = await db.execute(query)
-        rows = result.mappings().all()
-
-        return [dict(row) for row in rows]
+        return result.mappings().all()
 
     async def update_doctor_clinic_association(  # noqa: C901
         self, db: AsyncSession, association_id: UUID, update_data: DoctorClinicUpdate
@@ -410,11 +554,6 @@ class ClinicService:
 
         await db.commit()
 
-        # Invalidate cache
-        if self.cache and updated:
-            self.cache.delete_pattern(f"clinic:{updated['clinic_id']}:doctors:*")
-            self.cache.delete_pattern(f"doctor:{updated['doctor_id']}:clinics:*")
-
         return dict(updated) if updated else None
 
     async def end_doctor_clinic_association(
@@ -436,17 +575,12 @@ class ClinicService:
 
         await db.commit()
 
-        # Invalidate cache
-        if self.cache and updated:
-            self.cache.delete_pattern(f"clinic:{updated['clinic_id']}:doctors:*")
-            self.cache.delete_pattern(f"doctor:{updated['doctor_id']}:clinics:*")
-
         return dict(updated) if updated else None
 
     async def remove_doctor_from_clinic(
         self, db: AsyncSession, doctor_id: UUID, clinic_id: UUID
     ) -> bool:
-        """Remove a doctor from a clinic (end active association)."""
+        """Remove a doctor from a clinic (end active association), False if none was active."""
         query = (
             update(doctor_clinics)
             .where(
@@ -455,14 +589,11 @@ class ClinicService:
                 doctor_clinics.c.end_date.is_(None),
             )
             .values(end_date=datetime.now(UTC), status="inactive")
+            .returning(doctor_clinics.c.id)
         )
 
-        await db.execute(query)
+        result = await db.execute(query)
+        ended_ids = result.scalars().all()
         await db.commit()
 
-        # Invalidate cache
-        if self.cache:
-            self.cache.delete_pattern(f"clinic:{clinic_id}:doctors:*")
-            self.cache.delete_pattern(f"doctor:{doctor_id}:clinics:*")
-
-        return True
+        return bool(ended_ids)
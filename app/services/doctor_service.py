@@ -1,17 +1,52 @@
 """Doctor service for business logic."""
 
+import hashlib
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, func, select, text
+import orjson
+from sqlalchemy import (
+    Double,
+    RowMapping,
+    Text,
+    and_,
+    func,
+    literal,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.redis_client import CacheManager
-from app.models.clinics import clinics
+from app.models.clinics import clinic_location, clinics
 from app.models.doctor_clinics import doctor_clinics
 from app.models.doctors import doctors
-from app.schemas.doctors import DoctorCreate, DoctorUpdate
+from app.schemas.doctors import DoctorCreate, DoctorListResponse, DoctorUpdate
+
+# Only the DoctorListResponse fields: list pages never render bio, qualification
+# or verification documents
+_LIST_COLUMNS = tuple(doctors.c[name] for name in DoctorListResponse.model_fields)
+
+# Association columns fetched alongside the doctor in get_doctor_with_details
+_DETAIL_CLINIC_COLUMNS = (
+    *doctor_clinics.c,
+    clinics.c.name.label("clinic_name"),
+    clinics.c.address.label("clinic_address"),
+    clinics.c.latitude,
+    clinics.c.longitude,
+)
+_DOCTOR_KEYS = tuple(doctors.c.keys())
+_DETAIL_CLINIC_KEYS = (
+    *doctor_clinics.c.keys(),
+    "clinic_name",
+    "clinic_address",
+    "latitude",
+    "longitude",
+)
 
 
 class DoctorService:
@@ -30,6 +65,14 @@ class DoctorService:
         """Generate cache key for doctor."""
         return f"doctor:{doctor_id}"
 
+    @staticmethod
+    def _get_doctor_list_cache_key(generation: int, **params: Any) -> str:
+        """Generate cache key for a doctor list under the current list generation."""
+        digest = hashlib.blake2b(
+            orjson.dumps(params, option=orjson.OPT_SORT_KEYS), digest_size=16
+        ).hexdigest()
+        return f"doctor:list:{generation}:{digest}"
+
     async def create_doctor(self, db: AsyncSession, doctor_data: DoctorCreate) -> dict:
         """Create a new doctor profile."""
         query = (
@@ -63,7 +106,7 @@ class DoctorService:
 
         # Invalidate cache
         if self.cache:
-            self.cache.delete_pattern("doctor:list:*")
+            self.cache.bump_generation("doctor:list")
 
         return dict(doctor)
 
@@ -94,36 +137,42 @@ class DoctorService:
         return doctor_dict
 
     async def get_doctor_with_details(self, db: AsyncSession, doctor_id: UUID) -> dict | None:
-        """Get doctor with clinic associations."""
-        # Get doctor
-        doctor = await self.get_doctor_by_id(db, doctor_id)
-        if not doctor:
-            return None
-
-        # Get clinic associations
-        clinics_query = (
-            select(
-                doctor_clinics,
-                clinics.c.name.label("clinic_name"),
-                clinics.c.address.label("clinic_address"),
-                clinics.c.latitude,
-                clinics.c.longitude,
-            )
-            .join(clinics, doctor_clinics.c.clinic_id == clinics.c.id)
-            .where(
-                doctor_clinics.c.doctor_id == doctor_id,
-                doctor_clinics.c.status == "active",
-                doctor_clinics.c.end_date.is_(None),
+        """Get doctor with clinic associations in a single query."""
+        # One row per active association (or a single row with NULL association
+        # columns); rows are split positionally into the doctor and its clinics
+        query = (
+            select(doctors, *_DETAIL_CLINIC_COLUMNS)
+            .select_from(
+                doctors.outerjoin(
+                    doctor_clinics,
+                    and_(
+                        doctor_clinics.c.doctor_id == doctors.c.id,
+                        doctor_clinics.c.status == "active",
+                        doctor_clinics.c.end_date.is_(None),
+                    ),
+                ).outerjoin(clinics, doctor_clinics.c.clinic_id == clinics.c.id)
             )
+            .where(doctors.c.id == doctor_id)
             .order_by(doctor_clinics.c.is_primary.desc())
         )
 
-        clinics_result = await db.execute(clinics_query)
-        doctor["clinics"] = [dict(row) for row in clinics_result.mappings().all()]
+        result = await db.execute(query)
+        rows = result.all()
+
+        if not rows:
+            return None
+
+        split = len(_DOCTOR_KEYS)
+        doctor = dict(zip(_DOCTOR_KEYS, rows[0][:split], strict=True))
+        doctor["clinics"] = [
+            dict(zip(_DETAIL_CLINIC_KEYS, row[split:], strict=True))
+            for row in rows
+            if row[split] is not None  # association id; NULL when there is none
+        ]
 
         return doctor
 
-    async def get_doctors(
+    async def get_doctors(  # noqa: C901
         self,
         db: AsyncSession,
         skip: int = 0,
@@ -136,8 +185,25 @@ class DoctorService:
         min_rating: float | None = None,
         languages: list[str] | None = None,
     ) -> list[dict]:
-        """Get list of doctors with filtering."""
-        # Build query with user join for name
+        """Get list of doctors with filtering (with caching)."""
+        # Try cache first
+        if self.cache:
+            cache_key = self._get_doctor_list_cache_key(
+                self.cache.get_generation("doctor:list"),
+                skip=skip,
+                limit=limit,
+                specialization=specialization,
+                sub_specialization=sub_specialization,
+                min_experience=min_experience,
+                max_experience=max_experience,
+                is_verified=is_verified,
+                min_rating=min_rating,
+                languages=languages,
+            )
+            cached_list = self.cache.get_json(cache_key)
+            if cached_list is not None:
+                return cached_list
+
         conditions: list = []
 
         if specialization:
@@ -159,13 +225,12 @@ class DoctorService:
             conditions.append(doctors.c.rating >= min_rating)
 
         if languages:
-            # Check if any of the specified languages are in the languages_spoken array
-            for lang in languages:
-                conditions.append(doctors.c.languages_spoken.contains([lang]))
+            # Any of the specified languages is in the languages_spoken array (GIN-indexed)
+            conditions.append(doctors.c.languages_spoken.has_any(literal(languages, ARRAY(Text))))
 
         # Query doctors
         query = (
-            select(doctors)
+            select(*_LIST_COLUMNS)
             .where(and_(*conditions) if conditions else text("1=1"))  # type: ignore[arg-type]
             .order_by(doctors.c.rating.desc().nullslast(), doctors.c.experience_years.desc())
             .offset(skip)
@@ -173,9 +238,12 @@ class DoctorService:
         )
 
         result = await db.execute(query)
-        doctor_list = result.mappings().all()
+        doctor_list = [dict(d) for d in result.mappings().all()]
 
-        return [dict(d) for d in doctor_list]
+        if self.cache:
+            self.cache.set_json(cache_key, doctor_list, ttl=self.DOCTOR_LIST_CACHE_TTL)
+
+        return doctor_list
 
     async def search_doctors_nearby(
         self,
@@ -188,12 +256,15 @@ class DoctorService:
         limit: int = 20,
         is_verified: bool = True,
         min_rating: float | None = None,
-    ) -> list[dict]:
-        """Search doctors near a location (through their clinic associations)."""
+    ) -> Sequence[RowMapping]:
+        """
+        Search doctors near a location (through their clinic associations).
+
+        Rows are returned as-is rather than copied into dicts; the endpoint
+        validates them straight into the list response.
+        """
         conditions: list = [
             clinics.c.deleted_at.is_(None),
-            clinics.c.latitude.isnot(None),
-            clinics.c.longitude.isnot(None),
             doctor_clinics.c.status == "active",
             doctor_clinics.c.end_date.is_(None),
             doctor_clinics.c.appointment_booking_enabled == True,  # noqa: E712
@@ -208,48 +279,33 @@ class DoctorService:
         if min_rating is not None:
             conditions.append(doctors.c.rating >= min_rating)
 
-        # Haversine formula for distance calculation
-        distance_formula = (
-            func.acos(
-                func.cos(func.radians(latitude))
-                * func.cos(func.radians(clinics.c.latitude))
-                * func.cos(func.radians(clinics.c.longitude) - func.radians(longitude))
-                + func.sin(func.radians(latitude)) * func.sin(func.radians(clinics.c.latitude))
-            )
-            * 6371
-        )  # Earth's radius in km
+        # Same GiST-indexed geography column as the clinic nearby search
+        point = func.geography(func.ST_SetSRID(func.ST_MakePoint(longitude, latitude), 4326))
+        distance_m = clinic_location.op("<->", return_type=Double)(point)
 
         query = (
             select(
-                doctors,
+                *_LIST_COLUMNS,
                 clinics.c.name.label("clinic_name"),
                 clinics.c.address.label("clinic_address"),
                 doctor_clinics.c.consultation_fee.label("clinic_consultation_fee"),
-                distance_formula.label("distance_km"),
+                (distance_m / 1000).label("distance_km"),
             )
             .join(doctor_clinics, doctors.c.id == doctor_clinics.c.doctor_id)
             .join(clinics, doctor_clinics.c.clinic_id == clinics.c.id)
-            .where(and_(*conditions))
-            .having(distance_formula <= radius_km)
-            .order_by(distance_formula, doctors.c.rating.desc().nullslast())
+            .where(and_(*conditions), func.ST_DWithin(clinic_location, point, radius_km * 1000))
+            .order_by(distance_m, doctors.c.rating.desc().nullslast())
             .offset(skip)
             .limit(limit)
         )
 
         result = await db.execute(query)
-        rows = result.mappings().all()
-
-        return [dict(row) for row in rows]
+        return result.mappings().all()
 
     async def update_doctor(  # noqa: C901
         self, db: AsyncSession, doctor_id: UUID, doctor_data: DoctorUpdate
     ) -> dict | None:
         """Update doctor information."""
-        # Check if doctor exists
-        existing = await self.get_doctor_by_id(db, doctor_id)
-        if not existing:
-            return None
-
         # Build update values
         update_values: dict[str, Any] = {}
         if doctor_data.specialization is not None:
@@ -273,12 +329,11 @@ class DoctorService:
         if doctor_data.medical_council_registration is not None:
             update_values["medical_council_registration"] = doctor_data.medical_council_registration
 
+        # Nothing to update: existence check and current row in one lookup
         if not update_values:
-            return existing
-
-        # Update doctor
-        from sqlalchemy import update
+            return await self.get_doctor_by_id(db, doctor_id)
 
+        # Update doctor; RETURNING no row means the doctor does not exist
         query = (
             update(doctors)
             .where(doctors.c.id == doctor_id)
@@ -291,13 +346,16 @@ class DoctorService:
 
         await db.commit()
 
+        if not updated_doctor:
+            return None
+
         # Invalidate cache
         if self.cache:
-            cache_key = self._get_doctor_cache_key(doctor_id)
-            self.cache.delete(cache_key)
-            self.cache.delete_pattern("doctor:list:*")
+            self.cache.invalidate(
+                keys=[self._get_doctor_cache_key(doctor_id)], generations=["doctor:list"]
+            )
 
-        return dict(updated_doctor) if updated_doctor else None
+        return dict(updated_doctor)
 
     async def verify_doctor(
         self,
@@ -307,8 +365,6 @@ class DoctorService:
         verification_docs: dict | None = None,
     ) -> dict | None:
         """Verify a doctor."""
-        from sqlalchemy import update
-
         update_values = {
             "is_verified": True,
             "verified_at": datetime.now(UTC),
@@ -330,17 +386,16 @@ class DoctorService:
 
         await db.commit()
 
-        # Invalidate cache
+        # Invalidate cache (lists filter on is_verified)
         if self.cache:
-            cache_key = self._get_doctor_cache_key(doctor_id)
-            self.cache.delete(cache_key)
+            self.cache.invalidate(
+                keys=[self._get_doctor_cache_key(doctor_id)], generations=["doctor:list"]
+            )
 
         return dict(updated_doctor) if updated_doctor else None
 
     async def unverify_doctor(self, db: AsyncSession, doctor_id: UUID) -> dict | None:
         """Unverify a doctor."""
-        from sqlalchemy import update
-
         query = (
             update(doctors)
             .where(doctors.c.id == doctor_id)
@@ -353,9 +408,10 @@ class DoctorService:
 
         await db.commit()
 
-        # Invalidate cache
+        # Invalidate cache (lists filter on is_verified)
         if self.cache:
-            cache_key = self._get_doctor_cache_key(doctor_id)
-            self.cache.delete(cache_key)
+            self.cache.invalidate(
+                keys=[self._get_doctor_cache_key(doctor_id)], generations=["doctor:list"]
+            )
 
         return dict(updated_doctor) if updated_doctor else None
@@ -1,11 +1,13 @@
 """Environment service for weather and air quality logic."""
 
 import asyncio
+from collections.abc import Awaitable
+from typing import Any
 
-import httpx
 from fastapi import HTTPException, status
 
 from app.config import settings
+from app.core.http_client import get_http_client
 from app.core.redis_client import CacheManager
 from app.schemas.environment import EnvironmentalConditionsResponse
 
@@ -16,72 +18,87 @@ class EnvironmentService:
     AQI_URL = "https://airquality.googleapis.com/v1/currentConditions:lookup"
     WEATHER_URL = "https://weather.googleapis.com/v1/currentConditions:lookup"
 
-    # Environment data is stable for ~15-30 mins
-    CACHE_TTL = 1200  # 20 minutes
+    # Each half is cached on its own, at roughly the cadence its API updates at,
+    # so a stale half never forces a refetch of the other
+    AQI_CACHE_TTL = 3600  # 1 hour
+    WEATHER_CACHE_TTL = 900  # 15 minutes
 
     def __init__(self, cache_manager: CacheManager | None = None):
         self.cache = cache_manager
 
-    def _get_cache_key(self, lat: float, lng: float) -> str:
+    def _get_cache_keys(self, lat: float, lng: float) -> tuple[str, str]:
         # Rounding to 3 decimal places (~110m - 500m precision)
         # improves cache hit rates for nearby users.
-        return f"env:data:{round(lat, 3)}:{round(lng, 3)}"
+        location = f"{round(lat, 3)}:{round(lng, 3)}"
+        return f"env:aqi:{location}", f"env:weather:{location}"
 
     def _raise_api_error(self) -> None:
         """Raise an exception for API fetch failures."""
         raise ValueError("Failed to fetch data from Google Environment APIs")
 
+    async def _fetch_aqi(self, lat: float, lng: float) -> dict[str, Any]:
+        """Fetch the current AQI fields from the Air Quality API."""
+        res = await get_http_client().post(
+            EnvironmentService.AQI_URL,
+            params={"key": settings.google_maps_api_key},
+            json={"location": {"latitude": lat, "longitude": lng}},
+        )
+        if res.status_code != 200:
+            self._raise_api_error()
+
+        index = res.json()["indexes"][0]
+        return {"aqi": index["aqi"], "aqi_category": index["category"]}
+
+    async def _fetch_weather(self, lat: float, lng: float) -> dict[str, Any]:
+        """Fetch the current temperature fields from the Weather API."""
+        res = await get_http_client().get(
+            EnvironmentService.WEATHER_URL,
+            params={
+                "key": settings.google_maps_api_key,
+                "location.latitude": lat,
+                "location.longitude": lng,
+            },
+        )
+        if res.status_code != 200:
+            self._raise_api_error()
+
+        weather_data = res.json()
+        return {
+            "temperature": weather_data["temperature"]["degrees"],
+            "condition": weather_data["weatherCondition"]["description"]["text"],
+        }
+
     async def get_local_conditions(self, lat: float, lng: float) -> EnvironmentalConditionsResponse:
         """Fetch AQI and Temperature using Google APIs, checking cache first."""
-        cache_key = self._get_cache_key(lat, lng)
+        aqi_key, weather_key = self._get_cache_keys(lat, lng)
 
+        aqi_data = weather_data = None
         if self.cache:
-            cached = self.cache.get_json(cache_key)
-            if cached:
-                return EnvironmentalConditionsResponse(**cached)
-
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            try:
-                # Concurrent calls to Google APIs
-                aqi_task = client.post(
-                    EnvironmentService.AQI_URL,
-                    params={"key": settings.google_maps_api_key},
-                    json={"location": {"latitude": lat, "longitude": lng}},
-                )
-
-                weather_task = client.get(
-                    EnvironmentService.WEATHER_URL,
-                    params={
-                        "key": settings.google_maps_api_key,
-                        "location.latitude": lat,
-                        "location.longitude": lng,
-                    },
-                )
-
-                aqi_res, weather_res = await asyncio.gather(aqi_task, weather_task)
-
-                # Validate responses
-                if aqi_res.status_code != 200 or weather_res.status_code != 200:
-                    self._raise_api_error()
-
-                aqi_data = aqi_res.json()
-                weather_data = weather_res.json()
-
-                env_data = {
-                    "aqi": aqi_data["indexes"][0]["aqi"],
-                    "aqi_category": aqi_data["indexes"][0]["category"],
-                    "temperature": weather_data["temperature"]["degrees"],
-                    "condition": weather_data["weatherCondition"]["description"]["text"],
-                }
-
-                if self.cache:
-                    self.cache.set_json(cache_key, env_data, ttl=self.CACHE_TTL)
-
-                return EnvironmentalConditionsResponse(**env_data)
-
-            except Exception as e:
-                # Logging here via your structlog setup would be ideal
-                raise HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    detail=f"Environmental data currently unavailable: {e!s}",
-                )
+            aqi_data, weather_data = self.cache.mget_json([aqi_key, weather_key])
+
+        try:
+            # Concurrent calls to Google APIs, only for the halves not cached
+            fetches: dict[str, Awaitable[dict[str, Any]]] = {}
+            if aqi_data is None:
+                fetches["aqi"] = self._fetch_aqi(lat, lng)
+            if weather_data is None:
+                fetches["weather"] = self._fetch_weather(lat, lng)
+            fetched = dict(zip(fetches, await asyncio.gather(*fetches.values()), strict=True))
+
+        except Exception as e:
+            # Logging here via your structlog setup would be ideal
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"Environmental data currently unavailable: {e!s}",
+            )
+
+        if "aqi" in fetched:
+            aqi_data = fetched["aqi"]
+            if self.cache:
+                self.cache.set_json(aqi_key, aqi_data, ttl=self.AQI_CACHE_TTL)
+        if "weather" in fetched:
+            weather_data = fetched["weather"]
+            if self.cache:
+                self.cache.set_json(weather_key, weather_data, ttl=self.WEATHER_CACHE_TTL)
+
+        return EnvironmentalConditionsResponse(**aqi_data, **weather_data)
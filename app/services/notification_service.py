@@ -1,23 +1,290 @@
 """Notification service for sending push notifications via FCM."""
 
-from datetime import UTC, datetime
-from typing import Any
+import asyncio
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from typing import Any, NamedTuple
 from uuid import UUID
 
 import structlog
 from firebase_admin import messaging  # type: ignore[import-untyped]
-from sqlalchemy import delete, desc, func, insert, select, update
+from sqlalchemy import (
+    ColumnElement,
+    any_,
+    delete,
+    desc,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.redis_client import AsyncCacheManager
 from app.models.notifications import notification_deliveries, notifications
 from app.models.push_tokens import push_tokens
 
 logger = structlog.get_logger(__name__)
 
+# FCM accepts at most this many tokens per multicast message
+FCM_MULTICAST_LIMIT = 500
+
+# Upper bound on multicast batches in flight (each fans out to one HTTP/2 stream per token)
+FCM_MAX_CONCURRENT_SENDS = 8
+_fcm_semaphore = asyncio.Semaphore(FCM_MAX_CONCURRENT_SENDS)
+
+# Platform options are identical for every message, so they are built once and
+# shared by all multicasts (firebase-admin copies references into each token's message)
+_APNS_CONFIG = messaging.APNSConfig(
+    payload=messaging.APNSPayload(
+        aps=messaging.Aps(
+            sound="default",
+            badge=1,
+        ),
+    ),
+)
+_ANDROID_CONFIG = messaging.AndroidConfig(
+    priority="high",
+    notification=messaging.AndroidNotification(
+        sound="default",
+        priority="high",
+    ),
+)
+
+# Delivery batches at least this large are written with COPY instead of INSERT
+DELIVERY_COPY_THRESHOLD = 100
+
+# Active token lists are cached per user; token writes delete the entry
+PUSH_TOKEN_CACHE_TTL = 300  # 5 minutes
+
+
+class _PushToken(NamedTuple):
+    """Active push token of a user."""
+
+    id: UUID
+    fcm_token: str
+
+
+@lru_cache(maxsize=1024)
+def _format_appointment_time(appointment_time: Any, fmt: str) -> str:
+    """
+    Format an appointment time for notification text.
+
+    Cached because reminder sweeps format the same slot times over and over.
+
+    Args:
+        appointment_time: Appointment datetime (anything else is stringified)
+        fmt: strftime format
+
+    Returns:
+        Formatted time
+    """
+    if isinstance(appointment_time, datetime):
+        return appointment_time.strftime(fmt)
+    return str(appointment_time)
+
+
+# ID lists are bound as one array parameter (= ANY / unnest) rather than one bind
+# per ID: asyncpg rejects statements with more than 32767 parameters
+_UUID_ARRAY = ARRAY(PG_UUID(as_uuid=True))
+
+
+def _uuid_in(column: ColumnElement[Any], ids: Iterable[UUID]) -> ColumnElement[bool]:
+    """
+    Match a UUID column against any number of IDs with a single parameter.
+
+    Args:
+        column: UUID column
+        ids: IDs to match
+
+    Returns:
+        ``column = ANY(:ids)`` condition
+    """
+    return column == any_(literal(list(ids), _UUID_ARRAY))
+
+
+def _delivery_in(pairs: Sequence[tuple[UUID, UUID]]) -> ColumnElement[bool]:
+    """
+    Match delivery rows by (notification_id, push_token_id) with two parameters.
+
+    Args:
+        pairs: (notification_id, push_token_id) pairs
+
+    Returns:
+        ``(notification_id, push_token_id) IN (SELECT * FROM unnest(...))`` condition
+    """
+    pairs_table = (
+        func.unnest(
+            literal([notification_id for notification_id, _ in pairs], _UUID_ARRAY),
+            literal([push_token_id for _, push_token_id in pairs], _UUID_ARRAY),
+        )
+        .table_valued("notification_id", "push_token_id")
+        .render_derived(name="pairs")
+    )
+    return tuple_(
+        notification_deliveries.c.notification_id, notification_deliveries.c.push_token_id
+    ).in_(select(pairs_table.c.notification_id, pairs_table.c.push_token_id))
+
 
 class NotificationService:
     """Service for managing push notifications."""
 
+    @staticmethod
+    def _build_multicast_message(
+        tokens: list[str],
+        title: str,
+        body: str,
+        data: dict[str, str] | None = None,
+    ) -> messaging.MulticastMessage:
+        """
+        Build the FCM multicast message shared by single and bulk sends.
+
+        Args:
+            tokens: FCM tokens (at most FCM_MULTICAST_LIMIT)
+            title: Notification title
+            body: Notification body
+            data: Optional data payload
+
+        Returns:
+            Multicast message ready to send
+        """
+        return messaging.MulticastMessage(
+            notification=messaging.Notification(
+                title=title,
+                body=body,
+            ),
+            data=data or {},
+            tokens=tokens,
+            apns=_APNS_CONFIG,
+            android=_ANDROID_CONFIG,
+        )
+
+    @staticmethod
+    async def _send_multicast(message: messaging.MulticastMessage) -> messaging.BatchResponse:
+        """
+        Send a multicast message without blocking the event loop.
+
+        Uses firebase-admin's async FCM v1 client, which multiplexes one request
+        per token over a shared HTTP/2 connection and caches the OAuth2 token;
+        the semaphore caps how many batches run at once.
+
+        Args:
+            message: Multicast message to send
+
+        Returns:
+            FCM batch response
+        """
+        async with _fcm_semaphore:
+            return await messaging.send_each_for_multicast_async(message)
+
+    @staticmethod
+    def _get_push_tokens_cache_key(user_id: str | UUID) -> str:
+        """Generate cache key for a user's active push tokens."""
+        return f"push_tokens:{user_id}"
+
+    @staticmethod
+    async def _get_active_tokens(
+        db: AsyncSession,
+        user_ids: Sequence[UUID],
+        cache: AsyncCacheManager | None = None,
+    ) -> dict[UUID, list[_PushToken]]:
+        """
+        Get the active push tokens of several users, cache first.
+
+        Cached users are read with one MGET; the rest come from one query and are
+        written back in one pipeline (users without tokens are cached as empty).
+
+        Args:
+            db: Database session
+            user_ids: User IDs
+            cache: Optional cache manager
+
+        Returns:
+            Active tokens by user ID, with an entry for every requested user
+        """
+        tokens: dict[UUID, list[_PushToken]] = {}
+        missing = list(user_ids)
+
+        if cache:
+            cached = await cache.mget_json(
+                [NotificationService._get_push_tokens_cache_key(user_id) for user_id in missing]
+            )
+            missing = []
+            for user_id, value in zip(user_ids, cached, strict=True):
+                if value is None:
+                    missing.append(user_id)
+                else:
+                    tokens[user_id] = [_PushToken(UUID(token_id), fcm) for token_id, fcm in value]
+
+        if missing:
+            fetched: dict[UUID, list[_PushToken]] = {user_id: [] for user_id in missing}
+            result = await db.execute(
+                select(push_tokens.c.id, push_tokens.c.user_id, push_tokens.c.fcm_token).where(
+                    _uuid_in(push_tokens.c.user_id, missing),
+                    push_tokens.c.is_active == True,  # noqa: E712
+                )
+            )
+            for row in result:
+                fetched[row.user_id].append(_PushToken(row.id, row.fcm_token))
+            tokens.update(fetched)
+
+            if cache:
+                await cache.mset_json(
+                    {
+                        # orjson does not serialize NamedTuples as arrays
+                        NotificationService._get_push_tokens_cache_key(user_id): [
+                            [str(token.id), token.fcm_token] for token in user_tokens
+                        ]
+                        for user_id, user_tokens in fetched.items()
+                    },
+                    ttl=PUSH_TOKEN_CACHE_TTL,
+                )
+
+        return tokens
+
+    @staticmethod
+    async def _insert_deliveries(db: AsyncSession, rows: Sequence[tuple[UUID, UUID]]) -> None:
+        """
+        Create pending delivery records inside the session's transaction.
+
+        Large fan-outs go through asyncpg's COPY, which checks the table once
+        instead of per row; small batches use a regular INSERT.
+
+        Args:
+            db: Database session
+            rows: (notification_id, push_token_id) pairs
+        """
+        if len(rows) < DELIVERY_COPY_THRESHOLD:
+            await db.execute(
+                insert(notification_deliveries),
+                [
+                    {
+                        "notification_id": notification_id,
+                        "push_token_id": push_token_id,
+                        "delivery_status": "pending",
+                    }
+                    for notification_id, push_token_id in rows
+                ],
+            )
+            return
+
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            notification_deliveries.name,
+            records=[
+                (notification_id, push_token_id, "pending")
+                for notification_id, push_token_id in rows
+            ],
+            columns=["notification_id", "push_token_id", "delivery_status"],
+        )
+
     @staticmethod
     async def send_push_notification(
         tokens: list[str],
@@ -42,31 +309,9 @@ class NotificationService:
             return 0, 0
 
         try:
-            message = messaging.MulticastMessage(
-                notification=messaging.Notification(
-                    title=title,
-                    body=body,
-                ),
-                data=data or {},
-                tokens=tokens,
-                apns=messaging.APNSConfig(
-                    payload=messaging.APNSPayload(
-                        aps=messaging.Aps(
-                            sound="default",
-                            badge=1,
-                        ),
-                    ),
-                ),
-                android=messaging.AndroidConfig(
-                    priority="high",
-                    notification=messaging.AndroidNotification(
-                        sound="default",
-                        priority="high",
-                    ),
-                ),
-            )
-
-            response = messaging.send_each_for_multicast(message)
+            message = NotificationService._build_multicast_message(tokens, title, body, data)
+
+            response = await NotificationService._send_multicast(message)
 
             logger.info(
                 "push_notification_sent",
@@ -90,6 +335,7 @@ class NotificationService:
         data: dict[str, str] | None = None,
         notification_type: str = "other",
         priority: str = "normal",
+        cache: AsyncCacheManager | None = None,
     ) -> tuple[int, int]:
         """
         Send notification to all active devices of a user.
@@ -102,6 +348,7 @@ class NotificationService:
             data: Optional data payload
             notification_type: Type of notification (appointment_reminder, etc.)
             priority: Priority level (low, normal, high, urgent)
+            cache: Optional cache manager for the user's token list
 
         Returns:
             Tuple of (success_count, failure_count)
@@ -110,7 +357,12 @@ class NotificationService:
         if isinstance(user_id, str):
             user_id = UUID(user_id)
 
-        # Create notification record
+        # Get all active tokens for user with their IDs
+        token_records = (await NotificationService._get_active_tokens(db, [user_id], cache))[
+            user_id
+        ]
+
+        # Create the notification record already in its post-dispatch state
         notification_insert = notifications.insert().values(
             user_id=user_id,
             title=title,
@@ -118,30 +370,12 @@ class NotificationService:
             notification_type=notification_type,
             priority=priority,
             data=data,
-            status="pending",
         )
-        result = await db.execute(notification_insert)
-        notification_id = result.inserted_primary_key[0]  # type: ignore[attr-defined]
-
-        # Get all active tokens for user with their IDs
-        query = select(
-            push_tokens.c.id,
-            push_tokens.c.fcm_token,
-        ).where(
-            push_tokens.c.user_id == user_id,
-            push_tokens.c.is_active == True,  # noqa: E712
-        )
-
-        result = await db.execute(query)
-        token_records = result.fetchall()
 
         if not token_records:
             logger.warning("no_active_tokens_for_user", user_id=str(user_id))
-            # Update notification status to failed
             await db.execute(
-                update(notifications)
-                .where(notifications.c.id == notification_id)
-                .values(
+                notification_insert.values(
                     status="failed",
                     failure_reason="No active tokens for user",
                 )
@@ -149,26 +383,20 @@ class NotificationService:
             await db.commit()
             return 0, 0
 
+        result = await db.execute(
+            notification_insert.values(status="sent", sent_at=datetime.now(UTC)).returning(
+                notifications.c.id
+            )
+        )
+        notification_id = result.scalar_one()
+
         # Extract tokens and create token mapping
         token_map = {record.fcm_token: record.id for record in token_records}
         fcm_tokens = list(token_map.keys())
 
         # Create delivery records for each token
-        delivery_inserts = [
-            {
-                "notification_id": notification_id,
-                "push_token_id": token_id,
-                "delivery_status": "pending",
-            }
-            for token_id in token_map.values()
-        ]
-        await db.execute(insert(notification_deliveries).values(delivery_inserts))
-
-        # Update notification status to sent
-        await db.execute(
-            update(notifications)
-            .where(notifications.c.id == notification_id)
-            .values(status="sent", sent_at=datetime.now(UTC))
+        await NotificationService._insert_deliveries(
+            db, [(notification_id, token_id) for token_id in token_map.values()]
         )
         await db.commit()
 
@@ -239,12 +467,217 @@ class NotificationService:
             await db.commit()
             return 0, len(fcm_tokens)
 
+    @staticmethod
+    async def send_bulk(
+        db: AsyncSession,
+        user_ids: Iterable[str | UUID],
+        title: str,
+        body: str,
+        data: dict[str, str] | None = None,
+        notification_type: str = "other",
+        priority: str = "normal",
+        cache: AsyncCacheManager | None = None,
+    ) -> tuple[int, int]:
+        """
+        Send the same notification to many users.
+
+        Args:
+            db: Database session
+            user_ids: Recipient user IDs
+            title: Notification title
+            body: Notification body
+            data: Optional data payload
+            notification_type: Type of notification (system_announcement, etc.)
+            priority: Priority level (low, normal, high, urgent)
+            cache: Optional cache manager for the users' token lists
+
+        Returns:
+            Tuple of (success_count, failure_count) over all devices
+        """
+        unique_ids = dict.fromkeys(UUID(u) if isinstance(u, str) else u for u in user_ids)
+        return await NotificationService._send_batch(
+            db,
+            [(user_id, title, body, data) for user_id in unique_ids],
+            notification_type=notification_type,
+            priority=priority,
+            cache=cache,
+        )
+
+    @staticmethod
+    async def _send_batch(  # noqa: C901, PLR0912
+        db: AsyncSession,
+        recipients: Sequence[tuple[UUID, str, str, dict[str, str] | None]],
+        notification_type: str,
+        priority: str,
+        cache: AsyncCacheManager | None = None,
+    ) -> tuple[int, int]:
+        """
+        Send one notification per (user_id, title, body, data) recipient.
+
+        Records notifications and deliveries like ``send_to_user``, but with a
+        fixed number of statements regardless of the batch size: all recipients'
+        tokens come from one cache read plus at most one query, and ID lists are
+        bound as array parameters so no statement grows with the batch. Tokens
+        sharing the same content are packed into multicast messages of up to
+        FCM_MULTICAST_LIMIT tokens, sent concurrently.
+
+        Args:
+            db: Database session
+            recipients: (user_id, title, body, data) per notification
+            notification_type: Type of notification
+            priority: Priority level
+            cache: Optional cache manager for the recipients' token lists
+
+        Returns:
+            Tuple of (success_count, failure_count) over all devices
+        """
+        if not recipients:
+            return 0, 0
+
+        # One notification record per recipient, IDs in recipient order
+        result = await db.execute(
+            insert(notifications).returning(notifications.c.id, sort_by_parameter_order=True),
+            [
+                {
+                    "user_id": user_id,
+                    "title": title,
+                    "body": body,
+                    "notification_type": notification_type,
+                    "priority": priority,
+                    "data": data,
+                    "status": "pending",
+                }
+                for user_id, title, body, data in recipients
+            ],
+        )
+        notification_ids = result.scalars().all()
+
+        tokens_by_user = await NotificationService._get_active_tokens(
+            db, list(dict.fromkeys(user_id for user_id, *_ in recipients)), cache
+        )
+
+        # Deliveries grouped by message content, so each group can be multicast
+        groups: dict[tuple, list[tuple[UUID, Any]]] = {}
+        untargeted: list[UUID] = []
+        for notification_id, (user_id, title, body, data) in zip(
+            notification_ids, recipients, strict=True
+        ):
+            user_tokens = tokens_by_user.get(user_id)
+            if not user_tokens:
+                untargeted.append(notification_id)
+                continue
+            content = (title, body, tuple(sorted((data or {}).items())))
+            groups.setdefault(content, []).extend(
+                (notification_id, record) for record in user_tokens
+            )
+
+        if untargeted:
+            logger.warning("no_active_tokens_for_users", notification_count=len(untargeted))
+            await db.execute(
+                update(notifications)
+                .where(_uuid_in(notifications.c.id, untargeted))
+                .values(status="failed", failure_reason="No active tokens for user")
+            )
+
+        if not groups:
+            await db.commit()
+            return 0, 0
+
+        await NotificationService._insert_deliveries(
+            db,
+            [
+                (notification_id, record.id)
+                for deliveries in groups.values()
+                for notification_id, record in deliveries
+            ],
+        )
+        targeted = {
+            notification_id for deliveries in groups.values() for notification_id, _ in deliveries
+        }
+        await db.execute(
+            update(notifications)
+            .where(_uuid_in(notifications.c.id, targeted))
+            .values(status="sent", sent_at=datetime.now(UTC))
+        )
+        await db.commit()
+
+        chunks = [
+            (content, deliveries[i : i + FCM_MULTICAST_LIMIT])
+            for content, deliveries in groups.items()
+            for i in range(0, len(deliveries), FCM_MULTICAST_LIMIT)
+        ]
+        responses = await asyncio.gather(
+            *(
+                NotificationService._send_multicast(
+                    NotificationService._build_multicast_message(
+                        [record.fcm_token for _, record in chunk], title, body, dict(data)
+                    )
+                )
+                for (title, body, data), chunk in chunks
+            ),
+            return_exceptions=True,
+        )
+
+        sent: list[tuple[UUID, UUID]] = []
+        failed: list[tuple[UUID, UUID]] = []
+        delivered: set[UUID] = set()
+        for (_, chunk), response in zip(chunks, responses, strict=True):
+            if isinstance(response, BaseException):
+                logger.error("push_notification_failed", error=str(response))
+                failed.extend((notification_id, record.id) for notification_id, record in chunk)
+                continue
+            for (notification_id, record), send_response in zip(
+                chunk, response.responses, strict=True
+            ):
+                if send_response.success:
+                    sent.append((notification_id, record.id))
+                    delivered.add(notification_id)
+                else:
+                    failed.append((notification_id, record.id))
+
+        now = datetime.now(UTC)
+        if sent:
+            await db.execute(
+                update(notification_deliveries)
+                .where(_delivery_in(sent))
+                .values(delivery_status="sent", delivered_at=now)
+            )
+            await db.execute(
+                update(notifications)
+                .where(_uuid_in(notifications.c.id, delivered))
+                .values(status="delivered", delivered_at=now)
+            )
+        if failed:
+            await db.execute(
+                update(notification_deliveries)
+                .where(_delivery_in(failed))
+                .values(delivery_status="failed")
+            )
+            if targeted - delivered:
+                await db.execute(
+                    update(notifications)
+                    .where(_uuid_in(notifications.c.id, targeted - delivered))
+                    .values(status="failed", failure_reason="All device deliveries failed")
+                )
+        await db.commit()
+
+        logger.info(
+            "bulk_notification_sent",
+            notification_type=notification_type,
+            notification_count=len(recipients),
+            success_count=len(sent),
+            failure_count=len(failed),
+        )
+
+        return len(sent), len(failed)
+
     @staticmethod
     async def register_token(
         db: AsyncSession,
         user_id: str,
         fcm_token: str,
         platform: str,
+        cache: AsyncCacheManager | None = None,
     ) -> dict[str, Any]:
         """
         Register or update FCM token for a user.
@@ -254,12 +687,11 @@ class NotificationService:
             user_id: User ID
             fcm_token: FCM token
             platform: Platform (android, ios, web)
+            cache: Optional cache manager holding the user's token list
 
         Returns:
             Created/updated token record
         """
-        from datetime import datetime
-
         # Deactivate old tokens for this user on the same platform
         await db.execute(
             update(push_tokens)
@@ -271,54 +703,38 @@ class NotificationService:
             .values(is_active=False)
         )
 
-        # Check if token already exists
-        query = select(push_tokens).where(
-            push_tokens.c.user_id == user_id,
-            push_tokens.c.fcm_token == fcm_token,
-        )
-        result = await db.execute(query)
-        existing_token = result.first()
-
-        if existing_token:
-            # Update existing token
-            await db.execute(
-                update(push_tokens)
-                .where(push_tokens.c.id == existing_token.id)
-                .values(
-                    is_active=True,
-                    last_used_at=datetime.now(UTC),
-                    platform=platform,
-                )
+        # Insert the token, or reactivate it if this user already registered it
+        now = datetime.now(UTC)
+        stmt = (
+            pg_insert(push_tokens)
+            .values(
+                user_id=user_id,
+                fcm_token=fcm_token,
+                platform=platform,
+                is_active=True,
+                last_used_at=now,
             )
-            await db.commit()
-
-            # Fetch updated record
-            result = await db.execute(
-                select(push_tokens).where(push_tokens.c.id == existing_token.id)
+            .on_conflict_do_update(
+                constraint="unique_user_fcm_token",
+                set_={"is_active": True, "last_used_at": now, "platform": platform},
             )
-            return dict(result.first()._mapping)
-
-        # Insert new token
-        insert_stmt = push_tokens.insert().values(
-            user_id=user_id,
-            fcm_token=fcm_token,
-            platform=platform,
-            is_active=True,
-            last_used_at=datetime.now(UTC),
+            .returning(*push_tokens.c)
         )
-        result = await db.execute(insert_stmt)
+        result = await db.execute(stmt)
+        token = dict(result.mappings().one())
         await db.commit()
 
-        # Fetch created record
-        new_id = result.inserted_primary_key[0]  # type: ignore[attr-defined]
-        result = await db.execute(select(push_tokens).where(push_tokens.c.id == new_id))
-        return dict(result.first()._mapping)
+        if cache:
+            await cache.delete(NotificationService._get_push_tokens_cache_key(user_id))
+
+        return token
 
     @staticmethod
     async def deactivate_token(
         db: AsyncSession,
         user_id: str,
         fcm_token: str,
+        cache: AsyncCacheManager | None = None,
     ) -> bool:
         """
         Deactivate a specific FCM token.
@@ -327,6 +743,7 @@ class NotificationService:
             db: Database session
             user_id: User ID
             fcm_token: FCM token to deactivate
+            cache: Optional cache manager holding the user's token list
 
         Returns:
             True if token was deactivated
@@ -340,12 +757,17 @@ class NotificationService:
             .values(is_active=False)
         )
         await db.commit()
+
+        if cache:
+            await cache.delete(NotificationService._get_push_tokens_cache_key(user_id))
+
         return result.rowcount > 0  # type: ignore[attr-defined]
 
     @staticmethod
     async def deactivate_all_user_tokens(
         db: AsyncSession,
         user_id: str,
+        cache: AsyncCacheManager | None = None,
     ) -> int:
         """
         Deactivate all tokens for a user (logout).
@@ -353,6 +775,7 @@ class NotificationService:
         Args:
             db: Database session
             user_id: User ID
+            cache: Optional cache manager holding the user's token list
 
         Returns:
             Number of tokens deactivated
@@ -361,13 +784,56 @@ class NotificationService:
             update(push_tokens).where(push_tokens.c.user_id == user_id).values(is_active=False)
         )
         await db.commit()
+
+        if cache:
+            await cache.delete(NotificationService._get_push_tokens_cache_key(user_id))
+
+        return result.rowcount  # type: ignore[attr-defined]
+
+    @staticmethod
+    async def deactivate_for_users(
+        db: AsyncSession,
+        user_ids: Iterable[str | UUID],
+        cache: AsyncCacheManager | None = None,
+    ) -> int:
+        """
+        Deactivate all tokens of many users at once (e.g. a forced logout).
+
+        Args:
+            db: Database session
+            user_ids: User IDs
+            cache: Optional cache manager holding the users' token lists
+
+        Returns:
+            Number of tokens deactivated
+        """
+        ids = list(dict.fromkeys(UUID(u) if isinstance(u, str) else u for u in user_ids))
+        if not ids:
+            return 0
+
+        result = await db.execute(
+            update(push_tokens)
+            .where(
+                _uuid_in(push_tokens.c.user_id, ids),
+                push_tokens.c.is_active == True,  # noqa: E712
+            )
+            .values(is_active=False)
+        )
+        await db.commit()
+
+        if cache:
+            await cache.invalidate(
+                keys=[NotificationService._get_push_tokens_cache_key(user_id) for user_id in ids]
+            )
+
         return result.rowcount  # type: ignore[attr-defined]
 
     @staticmethod
     async def send_appointment_created_notification(
         db: AsyncSession,
         user_id: str,
-        appointment_data: dict[str, Any],
+        appointment_data: Mapping[str, Any],
+        cache: AsyncCacheManager | None = None,
     ) -> None:
         """
         Send notification when appointment is created.
@@ -376,14 +842,11 @@ class NotificationService:
             db: Database session
             user_id: Patient user ID
             appointment_data: Appointment details
+            cache: Optional cache manager for the patient's token list
         """
-        from datetime import datetime
-
-        appointment_time = appointment_data.get("appointment_at")
-        if isinstance(appointment_time, datetime):
-            appointment_time_str = appointment_time.strftime("%b %d, %I:%M %p")
-        else:
-            appointment_time_str = str(appointment_time)
+        appointment_time_str = _format_appointment_time(
+            appointment_data.get("appointment_at"), "%b %d, %I:%M %p"
+        )
 
         await NotificationService.send_to_user(
             db=db,
@@ -397,14 +860,16 @@ class NotificationService:
             },
             notification_type="appointment_confirmation",
             priority="normal",
+            cache=cache,
         )
 
     @staticmethod
     async def send_appointment_status_notification(
         db: AsyncSession,
         user_id: str,
-        appointment_data: dict[str, Any],
+        appointment_data: Mapping[str, Any],
         old_status: str,
+        cache: AsyncCacheManager | None = None,
     ) -> None:
         """
         Send notification when appointment status changes.
@@ -414,6 +879,7 @@ class NotificationService:
             user_id: Patient user ID
             appointment_data: Appointment details
             old_status: Previous status
+            cache: Optional cache manager for the patient's token list
         """
         new_status = appointment_data.get("status")
         doctor_name = appointment_data.get("doctor_name")
@@ -455,14 +921,51 @@ class NotificationService:
             },
             notification_type=notification_type,
             priority=priority,
+            cache=cache,
         )
 
+    @staticmethod
+    def _reminder_content(
+        appointment_data: Mapping[str, Any], hours_before: int
+    ) -> tuple[str, str, dict[str, str], str]:
+        """
+        Build the title, body, data payload and priority of an appointment reminder.
+
+        Args:
+            appointment_data: Appointment details
+            hours_before: Hours before appointment (24 or 1)
+
+        Returns:
+            Tuple of (title, body, data, priority)
+        """
+        doctor_name = appointment_data.get("doctor_name")
+        if hours_before == 24:
+            appointment_time_str = _format_appointment_time(
+                appointment_data.get("appointment_at"), "%b %d at %I:%M %p"
+            )
+            title = "Appointment Tomorrow"
+            body = f"Reminder: Appointment with {doctor_name} tomorrow at {appointment_time_str}"
+            priority = "normal"
+        else:
+            title = "Appointment Soon"
+            body = f"Reminder: Appointment with {doctor_name} in 1 hour"
+            priority = "high"
+
+        data = {
+            "type": "appointment_reminder",
+            "appointment_id": str(appointment_data.get("id")),
+            "hours_before": str(hours_before),
+            "screen": f"/appointments/{appointment_data.get('id')}",
+        }
+        return title, body, data, priority
+
     @staticmethod
     async def send_appointment_reminder(
         db: AsyncSession,
         user_id: str,
-        appointment_data: dict[str, Any],
+        appointment_data: Mapping[str, Any],
         hours_before: int,
+        cache: AsyncCacheManager | None = None,
     ) -> None:
         """
         Send appointment reminder notification.
@@ -472,37 +975,58 @@ class NotificationService:
             user_id: Patient user ID
             appointment_data: Appointment details
             hours_before: Hours before appointment (24 or 1)
+            cache: Optional cache manager for the patient's token list
         """
-        from datetime import datetime
-
-        appointment_time = appointment_data.get("appointment_at")
-        if isinstance(appointment_time, datetime):
-            appointment_time_str = appointment_time.strftime("%b %d at %I:%M %p")
-        else:
-            appointment_time_str = str(appointment_time)
-
-        if hours_before == 24:
-            title = "Appointment Tomorrow"
-            body = f"Reminder: Appointment with {appointment_data.get('doctor_name')} tomorrow at {appointment_time_str}"
-            priority = "normal"
-        else:
-            title = "Appointment Soon"
-            body = f"Reminder: Appointment with {appointment_data.get('doctor_name')} in 1 hour"
-            priority = "high"
+        title, body, data, priority = NotificationService._reminder_content(
+            appointment_data, hours_before
+        )
 
         await NotificationService.send_to_user(
             db=db,
             user_id=user_id,
             title=title,
             body=body,
-            data={
-                "type": "appointment_reminder",
-                "appointment_id": str(appointment_data.get("id")),
-                "hours_before": str(hours_before),
-                "screen": f"/appointments/{appointment_data.get('id')}",
-            },
+            data=data,
+            notification_type="appointment_reminder",
+            priority=priority,
+            cache=cache,
+        )
+
+    @staticmethod
+    async def send_appointment_reminders(
+        db: AsyncSession,
+        items: Iterable[tuple[str | UUID, Mapping[str, Any]]],
+        hours_before: int,
+        cache: AsyncCacheManager | None = None,
+    ) -> tuple[int, int]:
+        """
+        Send reminders for a batch of appointments (e.g. a scheduled sweep).
+
+        Args:
+            db: Database session
+            items: (patient user ID, appointment details) per appointment
+            hours_before: Hours before appointment (24 or 1)
+            cache: Optional cache manager for the patients' token lists
+
+        Returns:
+            Tuple of (success_count, failure_count) over all devices
+        """
+        recipients = []
+        priority = "normal" if hours_before == 24 else "high"
+        for user_id, appointment_data in items:
+            title, body, data, _ = NotificationService._reminder_content(
+                appointment_data, hours_before
+            )
+            recipients.append(
+                (UUID(user_id) if isinstance(user_id, str) else user_id, title, body, data)
+            )
+
+        return await NotificationService._send_batch(
+            db,
+            recipients,
             notification_type="appointment_reminder",
             priority=priority,
+            cache=cache,
         )
 
     @staticmethod
@@ -540,20 +1064,26 @@ class NotificationService:
         if notification_type_filter:
             query = query.where(notifications.c.notification_type == notification_type_filter)
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar_one()
-
-        # Apply pagination and ordering
-        query = (
-            query.order_by(desc(notifications.c.created_at))
+        # Page and total in one query; the window count rides along on every row
+        offset = (page - 1) * page_size
+        paged = (
+            query.add_columns(func.count().over().label("_total"))
+            .order_by(desc(notifications.c.created_at))
             .limit(page_size)
-            .offset((page - 1) * page_size)
+            .offset(offset)
         )
+        rows = (await db.execute(paged)).mappings().all()
+
+        if rows:
+            total = rows[0]["_total"]
+        elif offset:
+            # Page past the end: no row carries the window count, fall back to COUNT
+            count_query = select(func.count()).select_from(query.subquery())
+            total = (await db.execute(count_query)).scalar_one()
+        else:
+            total = 0
 
-        result = await db.execute(query)
-        notification_records = [dict(row._mapping) for row in result.fetchall()]
+        notification_records = [{k: v for k, v in row.items() if k != "_total"} for row in rows]
 
         return {
             "notifications": notification_records,
@@ -567,14 +1097,19 @@ class NotificationService:
         db: AsyncSession,
         notification_id: str | UUID,
         user_id: str | UUID | None = None,
+        include_deliveries: bool = True,
     ) -> dict[str, Any] | None:
         """
         Get notification details by ID with delivery information.
 
+        Delivery counts are aggregated in the same query as the notification;
+        the delivery rows themselves are a second query, skipped when not needed.
+
         Args:
             db: Database session
             notification_id: Notification ID
             user_id: Optional user ID for access control
+            include_deliveries: Also return the individual delivery records
 
         Returns:
             Notification with delivery details or None if not found
@@ -584,41 +1119,54 @@ class NotificationService:
         if isinstance(user_id, str):
             user_id = UUID(user_id)
 
-        # Get notification
-        query = select(notifications).where(notifications.c.id == notification_id)
+        delivery_status = notification_deliveries.c.delivery_status
+
+        # Notification plus its delivery counts
+        query = (
+            select(
+                notifications,
+                func.count(notification_deliveries.c.id).label("_total_devices"),
+                func.count()
+                .filter(delivery_status.in_(["sent", "delivered"]))
+                .label("_successful_deliveries"),
+                func.count()
+                .filter(delivery_status.in_(["failed", "invalid_token"]))
+                .label("_failed_deliveries"),
+            )
+            .select_from(
+                notifications.outerjoin(
+                    notification_deliveries,
+                    notification_deliveries.c.notification_id == notifications.c.id,
+                )
+            )
+            .where(notifications.c.id == notification_id)
+            .group_by(notifications.c.id)
+        )
         if user_id:
             query = query.where(notifications.c.user_id == user_id)
 
         result = await db.execute(query)
-        notification = result.fetchone()
+        row = result.mappings().one_or_none()
 
-        if not notification:
+        if not row:
             return None
 
-        notification_dict = dict(notification._mapping)
+        notification_dict = {k: v for k, v in row.items() if not k.startswith("_")}
 
-        # Get delivery information
-        delivery_query = select(notification_deliveries).where(
-            notification_deliveries.c.notification_id == notification_id
-        )
-        delivery_result = await db.execute(delivery_query)
-        deliveries = [dict(row._mapping) for row in delivery_result.fetchall()]
-
-        # Calculate stats
-        total_devices = len(deliveries)
-        successful_deliveries = sum(
-            1 for d in deliveries if d["delivery_status"] in ["sent", "delivered"]
-        )
-        failed_deliveries = sum(
-            1 for d in deliveries if d["delivery_status"] in ["failed", "invalid_token"]
-        )
+        deliveries: list[dict[str, Any]] = []
+        if include_deliveries and row["_total_devices"]:
+            delivery_query = select(notification_deliveries).where(
+                notification_deliveries.c.notification_id == notification_id
+            )
+            delivery_result = await db.execute(delivery_query)
+            deliveries = [dict(delivery._mapping) for delivery in delivery_result.fetchall()]
 
         return {
             "notification": notification_dict,
             "deliveries": deliveries,
-            "total_devices": total_devices,
-            "successful_deliveries": successful_deliveries,
-            "failed_deliveries": failed_deliveries,
+            "total_devices": row["_total_devices"],
+            "successful_deliveries": row["_successful_deliveries"],
+            "failed_deliveries": row["_failed_deliveries"],
         }
 
     @staticmethod
@@ -708,31 +1256,43 @@ class NotificationService:
         if isinstance(user_id, str):
             user_id = UUID(user_id)
 
-        from datetime import timedelta
-
         cutoff_date = datetime.now(UTC) - timedelta(days=days)
 
-        # Base query
-        query = select(notifications).where(notifications.c.created_at >= cutoff_date)
+        # One pass, grouped by each dimension; the other two columns are NULL per row
+        query = (
+            select(
+                notifications.c.status,
+                notifications.c.notification_type,
+                notifications.c.priority,
+                func.count().label("notification_count"),
+            )
+            .where(notifications.c.created_at >= cutoff_date)
+            .group_by(
+                func.grouping_sets(
+                    tuple_(notifications.c.status),
+                    tuple_(notifications.c.notification_type),
+                    tuple_(notifications.c.priority),
+                )
+            )
+        )
         if user_id:
             query = query.where(notifications.c.user_id == user_id)
 
         result = await db.execute(query)
-        all_notifications = result.fetchall()
 
-        total = len(all_notifications)
         by_status: dict[str, int] = {}
         by_type: dict[str, int] = {}
         by_priority: dict[str, int] = {}
 
-        for notif in all_notifications:
-            status = notif.status
-            ntype = notif.notification_type
-            priority = notif.priority
+        for row in result:
+            if row.status is not None:
+                by_status[row.status] = row.notification_count
+            elif row.notification_type is not None:
+                by_type[row.notification_type] = row.notification_count
+            else:
+                by_priority[row.priority] = row.notification_count
 
-            by_status[status] = by_status.get(status, 0) + 1
-            by_type[ntype] = by_type.get(ntype, 0) + 1
-            by_priority[priority] = by_priority.get(priority, 0) + 1
+        total = sum(by_status.values())
 
         return {
             "total_count": total,
@@ -1,6 +1,6 @@
 """Pharmacy service for business logic."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, time
 from typing import Any
 from uuid import UUID
 
@@ -87,30 +87,14 @@ class PharmacyService:
 
         await db.execute(location_query)
 
-        # Update geo column using PostGIS
-        await db.execute(
-            text(
-                """
-                UPDATE pharmacy_locations
-                SET geo = ST_MakePoint(:longitude, :latitude)
-                WHERE pharmacy_id = :pharmacy_id
-                """
-            ),
-            {
-                "longitude": pharmacy_data.location.longitude,
-                "latitude": pharmacy_data.location.latitude,
-                "pharmacy_id": pharmacy_id,
-            },
-        )
-
         # Create hours if provided
         if pharmacy_data.hours:
             hours_values = [
                 {
                     "pharmacy_id": pharmacy_id,
                     "day_of_week": hour.day_of_week,
-                    "open_time": hour.open_time,
-                    "close_time": hour.close_time,
+                    "open_min": PharmacyService._minute_of_day(hour.open_time),
+                    "close_min": PharmacyService._minute_of_day(hour.close_time),
                     "is_closed": hour.is_closed,
                 }
                 for hour in pharmacy_data.hours
@@ -206,7 +190,7 @@ class PharmacyService:
             .where(and_(*conditions))
             .offset(skip)
             .limit(limit)
-            .order_by(pharmacies.c.rating.desc(), pharmacies.c.created_at.desc())
+            .order_by(pharmacies.c.rating_x10.desc(), pharmacies.c.created_at.desc())
         )
 
         result = await db.execute(query)
@@ -268,14 +252,14 @@ class PharmacyService:
                 pl.longitude,
                 pl.created_at as location_created_at,
                 ST_Distance(
-                    pl.geo::geography,
+                    pl.geo,
                     ST_MakePoint(:longitude, :latitude)::geography
                 ) / 1000 as distance_km
             FROM pharmacies p
             INNER JOIN pharmacy_locations pl ON p.id = pl.pharmacy_id
             WHERE
                 ST_DWithin(
-                    pl.geo::geography,
+                    pl.geo,
                     ST_MakePoint(:longitude, :latitude)::geography,
                     :radius_m
                 )
@@ -333,7 +317,7 @@ class PharmacyService:
                 "email": row["email"],
                 "is_verified": row["is_verified"],
                 "is_active": row["is_active"],
-                "rating": row["rating"],
+                "rating_x10": row["rating_x10"],
                 "rating_count": row["rating_count"],
                 "supports_delivery": row["supports_delivery"],
                 "supports_pickup": row["supports_pickup"],
@@ -445,37 +429,6 @@ class PharmacyService:
             if getattr(location_data, field) is not None
         }
 
-    @staticmethod
-    async def _update_geo_column(
-        db: AsyncSession, pharmacy_id: UUID, location_data: PharmacyLocationUpdate
-    ) -> None:
-        """Update geo column if latitude or longitude changed."""
-        if location_data.latitude is None and location_data.longitude is None:
-            return
-
-        # Get current location to get coordinates
-        location_select = select(pharmacy_locations).where(
-            pharmacy_locations.c.pharmacy_id == pharmacy_id
-        )
-        loc_result = await db.execute(location_select)
-        location = loc_result.mappings().first()
-
-        if location:
-            await db.execute(
-                text(
-                    """
-                    UPDATE pharmacy_locations
-                    SET geo = ST_MakePoint(:longitude, :latitude)
-                    WHERE pharmacy_id = :pharmacy_id
-                    """
-                ),
-                {
-                    "longitude": location["longitude"],
-                    "latitude": location["latitude"],
-                    "pharmacy_id": pharmacy_id,
-                },
-            )
-
     async def update_pharmacy_location(
         self, db: AsyncSession, pharmacy_id: UUID, location_data: PharmacyLocationUpdate
     ) -> dict | None:
@@ -493,7 +446,6 @@ class PharmacyService:
         )
 
         await db.execute(query)
-        await PharmacyService._update_geo_column(db, pharmacy_id, location_data)
         await db.commit()
 
         # Invalidate cache
@@ -504,6 +456,11 @@ class PharmacyService:
 
         return await self.get_pharmacy_by_id(db, pharmacy_id)
 
+    @staticmethod
+    def _minute_of_day(value: time) -> int:
+        """Convert a time of day to the minute-of-day stored in pharmacy_hours."""
+        return value.hour * 60 + value.minute
+
     async def add_pharmacy_hours(
         self, db: AsyncSession, pharmacy_id: UUID, hours_data: PharmacyHoursCreate
     ) -> dict | None:
@@ -524,8 +481,8 @@ class PharmacyService:
                 update(pharmacy_hours)
                 .where(pharmacy_hours.c.id == existing["id"])
                 .values(
-                    open_time=hours_data.open_time,
-                    close_time=hours_data.close_time,
+                    open_min=PharmacyService._minute_of_day(hours_data.open_time),
+                    close_min=PharmacyService._minute_of_day(hours_data.close_time),
                     is_closed=hours_data.is_closed,
                 )
                 .returning(pharmacy_hours)
@@ -537,8 +494,8 @@ class PharmacyService:
                 .values(
                     pharmacy_id=pharmacy_id,
                     day_of_week=hours_data.day_of_week,
-                    open_time=hours_data.open_time,
-                    close_time=hours_data.close_time,
+                    open_min=PharmacyService._minute_of_day(hours_data.open_time),
+                    close_min=PharmacyService._minute_of_day(hours_data.close_time),
                     is_closed=hours_data.is_closed,
                 )
                 .returning(pharmacy_hours)
@@ -3,7 +3,7 @@
 import asyncio
 
 from app.database import engine
-from app.models.appointments import metadata
+from app.models import metadata
 
 
 async def init_db() -> None:
@@ -1,57 +1,26 @@
 import os
 import sys
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Generator
 from datetime import timedelta
 
 import pytest
 import pytest_asyncio
 from dotenv import load_dotenv
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import NullPool
 
 # Load environment variables from .env file
 load_dotenv()
 
-# Combine all metadata
-from sqlalchemy import MetaData
-
 from app.config import settings
 from app.core.security import create_access_token
 from app.database import get_db
 from app.main import app
-from app.models.admins import metadata as admins_metadata
-from app.models.appointments import metadata as appointments_metadata
-from app.models.clinics import metadata as clinics_metadata
-from app.models.doctor_clinics import metadata as doctor_clinics_metadata
-from app.models.doctors import metadata as doctors_metadata
-from app.models.notifications import metadata as notifications_metadata
-from app.models.patients import metadata as patients_metadata
-from app.models.pharmacies import metadata as pharmacies_metadata
-from app.models.push_tokens import metadata as push_tokens_metadata
-from app.models.users import metadata as users_metadata
-
-metadata = MetaData()
-for table in appointments_metadata.tables.values():
-    table.to_metadata(metadata)
-for table in users_metadata.tables.values():
-    table.to_metadata(metadata)
-for table in patients_metadata.tables.values():
-    table.to_metadata(metadata)
-for table in doctors_metadata.tables.values():
-    table.to_metadata(metadata)
-for table in clinics_metadata.tables.values():
-    table.to_metadata(metadata)
-for table in doctor_clinics_metadata.tables.values():
-    table.to_metadata(metadata)
-for table in admins_metadata.tables.values():
-    table.to_metadata(metadata)
-for table in pharmacies_metadata.tables.values():
-    table.to_metadata(metadata)
-for table in push_tokens_metadata.tables.values():
-    table.to_metadata(metadata)
-for table in notifications_metadata.tables.values():
-    table.to_metadata(metadata)
+from app.models import metadata
+from app.models._base import UUID_GENERATE_V7_SQL
+from app.services.appointment_service import drain_background_tasks
 
 # Test database URL - MUST be different from production
 # Set TEST_DATABASE_URL in .env or use environment variable
@@ -108,43 +77,47 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
     """Create a test database session."""
     # Create tables
     async with test_engine.begin() as conn:
-        await conn.run_sync(metadata.drop_all)
-        await conn.run_sync(metadata.create_all)
         from sqlalchemy import text
 
-        await conn.execute(text('CREATE EXTENSION IF NOT EXISTS "pgcrypto"'))
+        await conn.run_sync(metadata.drop_all)
+
+        # Extensions required by column types and trigram indexes
+        await conn.execute(text('CREATE EXTENSION IF NOT EXISTS "citext"'))
+        await conn.execute(text('CREATE EXTENSION IF NOT EXISTS "pg_trgm"'))
         await conn.execute(text('CREATE EXTENSION IF NOT EXISTS "postgis"'))
 
-        # Add geo column to pharmacy_locations (requires PostGIS)
-        await conn.execute(
-            text(
-                """
-            ALTER TABLE pharmacy_locations
-            ADD COLUMN IF NOT EXISTS geo GEOGRAPHY(Point, 4326)
-        """
-            )
-        )
-
-        # Create spatial index
-        await conn.execute(
-            text(
-                """
-            CREATE INDEX IF NOT EXISTS idx_pharmacy_geo
-            ON pharmacy_locations
-            USING GIST (geo)
-        """
-            )
-        )
+        # UUIDv7 generator used as primary key default (created by migration 015)
+        await conn.execute(text(UUID_GENERATE_V7_SQL))
+
+        await conn.run_sync(metadata.create_all)
+
+        await conn.execute(text('CREATE EXTENSION IF NOT EXISTS "pgcrypto"'))
 
     # Create session
     async with TestSessionLocal() as session:
         yield session
 
+    # Background notification sends write to these tables; let them finish first
+    await drain_background_tasks(grace_period=None)
+
     # Drop tables after test
     async with test_engine.begin() as conn:
         await conn.run_sync(metadata.drop_all)
 
 
+@pytest.fixture
+def query_counter() -> Generator[list[str], None, None]:
+    """Record SQL statements executed on the test engine (N+1 guardrail)."""
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(test_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
 @pytest_asyncio.fixture
 async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     """Create a test HTTP client."""
@@ -318,7 +291,7 @@ async def test_pharmacy_id(db_session):
         "supports_pickup": True,
         "is_verified": False,
         "is_active": True,
-        "rating": 4.5,
+        "rating_x10": 45,
         "rating_count": 10,
     }
     await db_session.execute(insert(pharmacies).values(**pharmacy_data))
@@ -76,6 +76,37 @@ class TestAdminUserEndpoints:
         assert data["page_size"] == 5
 
 
+@pytest.mark.asyncio
+class TestAdminListQueryCount:
+    """Guard admin list endpoints against N+1 query patterns."""
+
+    @pytest.mark.parametrize(
+        "endpoint",
+        [
+            "/api/v1/admin/users",
+            "/api/v1/admin/appointments",
+            "/api/v1/admin/notifications/logs",
+        ],
+    )
+    async def test_list_endpoint_query_count(
+        self,
+        client: AsyncClient,
+        admin_token: str,
+        query_counter: list[str],
+        endpoint: str,
+    ):
+        """Test list endpoints run at most the auth lookup plus one page query."""
+        query_counter.clear()
+
+        response = await client.get(
+            endpoint,
+            headers={"Authorization": f"Bearer {admin_token}"},
+        )
+
+        assert response.status_code == 200
+        assert len(query_counter) <= 2, query_counter
+
+
 @pytest.mark.asyncio
 class TestAdminAppointmentEndpoints:
     """Tests for admin appointment management endpoints."""
@@ -164,6 +195,61 @@ class TestAdminMetricsEndpoint:
         # Check notifications metrics structure
         assert "sent_today" in data["notifications"]
 
+    async def test_get_metrics_reflects_refresh(
+        self,
+        client: AsyncClient,
+        admin_token: str,
+        test_user: dict,
+        test_pharmacy_id: str,
+        db_session: AsyncSession,
+    ):
+        """Test metrics show rows inserted before the last view refresh."""
+        from app.services.admin_metrics_service import AdminMetricsService
+
+        assert await AdminMetricsService.refresh(db_session.bind)
+
+        response = await client.get(
+            "/api/v1/admin/metrics",
+            headers={"Authorization": f"Bearer {admin_token}"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        # The patient from test_user plus the admin behind admin_token
+        assert data["users"] == {"total": 2, "active": 2}
+        assert data["pharmacies"]["total"] == 1
+        assert data["pharmacies"]["active"] == 1
+        assert data["pharmacies"]["verified"] == 0
+
+    async def test_get_metrics_counts_scheduled_as_pending(
+        self,
+        client: AsyncClient,
+        admin_token: str,
+        auth_headers: dict,
+        sample_appointment_data: dict,
+        db_session: AsyncSession,
+    ):
+        """Test scheduled appointments are reported as pending after a refresh."""
+        from app.services.admin_metrics_service import AdminMetricsService
+
+        response = await client.post(
+            "/api/v1/appointments/",
+            json=sample_appointment_data,
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+        assert response.json()["status"] == "scheduled"
+
+        assert await AdminMetricsService.refresh(db_session.bind)
+
+        response = await client.get(
+            "/api/v1/admin/metrics",
+            headers={"Authorization": f"Bearer {admin_token}"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["appointments"] == {"total": 1, "pending": 1, "confirmed": 0}
+
     async def test_get_metrics_unauthorized(
         self,
         client: AsyncClient,
@@ -33,6 +33,40 @@ async def test_create_appointment(
     assert "id" in data
 
 
+@pytest.mark.asyncio
+async def test_create_appointment_notifies_in_background(
+    client: AsyncClient,
+    auth_headers: dict,
+    test_user: dict,
+    sample_appointment_data: dict,
+    db_session,
+) -> None:
+    """Creating an appointment records its notification once background sends drain."""
+    from sqlalchemy import select
+
+    from app.models.notifications import notifications
+    from app.services.appointment_service import drain_background_tasks
+
+    response = await client.post(
+        "/api/v1/appointments/",
+        json=sample_appointment_data,
+        headers=auth_headers,
+    )
+    assert response.status_code == 201
+
+    await drain_background_tasks(grace_period=None)
+
+    result = await db_session.execute(
+        select(notifications.c.notification_type, notifications.c.data).where(
+            notifications.c.user_id == test_user["id"]
+        )
+    )
+    rows = result.all()
+    assert len(rows) == 1
+    assert rows[0].notification_type == "appointment_confirmation"
+    assert rows[0].data["appointment_id"] == response.json()["id"]
+
+
 @pytest.mark.asyncio
 async def test_list_appointments(
     client: AsyncClient,
@@ -1,11 +1,16 @@
 """Tests for Redis caching implementation."""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
 
 import pytest
 from httpx import AsyncClient
 
-from app.core.redis_client import CacheManager
+from app.core import security
+from app.core.redis_client import AsyncCacheManager, CacheManager
+from app.services.doctor_service import DoctorService
+from app.services.environment_service import EnvironmentService
+from app.services.notification_service import PUSH_TOKEN_CACHE_TTL, NotificationService
 
 
 def test_cache_manager_get_json():
@@ -27,6 +32,23 @@ def test_cache_manager_get_json():
     mock_redis.get.assert_called_once_with("test_key")
 
 
+def test_cache_manager_mget_json():
+    """Test CacheManager mget_json reads all keys with one MGET."""
+    mock_redis = MagicMock()
+    cache_manager = CacheManager(redis_client=mock_redis)
+
+    mock_redis.mget.return_value = ['{"name": "Test"}', None]
+    result = cache_manager.mget_json(["doctor:1", "doctor:2"])
+
+    assert result == [{"name": "Test"}, None]
+    mock_redis.mget.assert_called_once_with(["doctor:1", "doctor:2"])
+    mock_redis.get.assert_not_called()
+
+    # Redis failures degrade to misses
+    mock_redis.mget.side_effect = ConnectionError
+    assert cache_manager.mget_json(["doctor:1", "doctor:2"]) == [None, None]
+
+
 def test_cache_manager_set_json():
     """Test CacheManager set_json method."""
     mock_redis = MagicMock()
@@ -76,6 +98,176 @@ def test_cache_manager_delete_pattern():
     assert result == 3
 
 
+def test_cache_manager_generation():
+    """Test CacheManager generation counters used for namespace invalidation."""
+    mock_redis = MagicMock()
+    cache_manager = CacheManager(redis_client=mock_redis)
+
+    # Never bumped
+    mock_redis.get.return_value = None
+    assert cache_manager.get_generation("clinic:list") == 0
+    mock_redis.get.assert_called_once_with("clinic:list:gen")
+
+    # Bumping is a single INCR, no key scan
+    assert cache_manager.bump_generation("clinic:list") is True
+    mock_redis.incr.assert_called_once_with("clinic:list:gen")
+    mock_redis.keys.assert_not_called()
+
+    mock_redis.get.return_value = "3"
+    assert cache_manager.get_generation("clinic:list") == 3
+
+
+def test_cache_manager_invalidate():
+    """Test CacheManager invalidate batches deletes and bumps into one pipeline."""
+    mock_redis = MagicMock()
+    pipe = mock_redis.pipeline.return_value
+    cache_manager = CacheManager(redis_client=mock_redis)
+
+    result = cache_manager.invalidate(keys=["clinic:1"], generations=["clinic:list"])
+
+    assert result is True
+    mock_redis.pipeline.assert_called_once_with(transaction=False)
+    pipe.delete.assert_called_once_with("clinic:1")
+    pipe.incr.assert_called_once_with("clinic:list:gen")
+    pipe.execute.assert_called_once()
+    # Nothing goes to Redis outside the pipeline
+    mock_redis.delete.assert_not_called()
+    mock_redis.incr.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_cache_manager():
+    """Test AsyncCacheManager awaits the asyncio client and batches invalidation."""
+    mock_redis = MagicMock()
+    mock_redis.get = AsyncMock(return_value='{"name": "Test"}')
+    pipe = mock_redis.pipeline.return_value
+    pipe.execute = AsyncMock()
+    cache_manager = AsyncCacheManager(redis_client=mock_redis)
+
+    assert await cache_manager.get_json("clinic:1") == {"name": "Test"}
+    mock_redis.get.assert_awaited_once_with("clinic:1")
+
+    mock_redis.mget = AsyncMock(return_value=[None, '{"name": "Other"}'])
+    assert await cache_manager.mget_json(["clinic:1", "clinic:2"]) == [None, {"name": "Other"}]
+
+    result = await cache_manager.invalidate(keys=["clinic:1"], generations=["clinic:list"])
+    assert result is True
+    pipe.delete.assert_called_once_with("clinic:1")
+    pipe.incr.assert_called_once_with("clinic:list:gen")
+    pipe.execute.assert_awaited_once()
+
+    # Sliding expiry reads with GETEX
+    mock_redis.getex = AsyncMock(return_value='{"name": "Test"}')
+    assert await cache_manager.get_json("clinic:1", refresh_ttl=900) == {"name": "Test"}
+    mock_redis.getex.assert_awaited_once_with("clinic:1", ex=900)
+
+    # Errors are swallowed like in the sync manager
+    mock_redis.get = AsyncMock(side_effect=ConnectionError)
+    assert await cache_manager.get_json("clinic:1") is None
+
+
+@pytest.mark.asyncio
+async def test_doctor_list_cache_hit_skips_query():
+    """Test get_doctors serves a cached list under a stable hashed key."""
+    cache = MagicMock()
+    cache.get_json.return_value = [{"id": "doctor-1"}]
+    cache.get_generation.return_value = 3
+    db = AsyncMock()
+    service = DoctorService(cache_manager=cache)
+
+    result = await service.get_doctors(db, languages=["en"], min_rating=4.0)
+
+    assert result == [{"id": "doctor-1"}]
+    db.execute.assert_not_called()
+    key = cache.get_json.call_args.args[0]
+    assert key.startswith("doctor:list:3:")
+    cache.get_generation.assert_called_once_with("doctor:list")
+    # Same arguments in any order hash to the same key; different filters do not
+    assert key == DoctorService._get_doctor_list_cache_key(
+        3,
+        limit=20,
+        skip=0,
+        languages=["en"],
+        min_rating=4.0,
+        specialization=None,
+        sub_specialization=None,
+        min_experience=None,
+        max_experience=None,
+        is_verified=None,
+    )
+    assert key != DoctorService._get_doctor_list_cache_key(3, skip=0, limit=20, languages=["fr"])
+
+
+@pytest.mark.asyncio
+async def test_push_token_cache_reads_batch_and_backfills():
+    """Test active token lookups MGET cached users and backfill the rest in one pipeline."""
+    cached_user, missing_user = uuid4(), uuid4()
+    cached_token_id, fetched_token_id = uuid4(), uuid4()
+    cache = MagicMock()
+    cache.mget_json = AsyncMock(return_value=[[[str(cached_token_id), "cached_fcm"]], None])
+    cache.mset_json = AsyncMock()
+    db = AsyncMock()
+    db.execute.return_value = [
+        MagicMock(id=fetched_token_id, user_id=missing_user, fcm_token="fetched_fcm")
+    ]
+
+    tokens = await NotificationService._get_active_tokens(db, [cached_user, missing_user], cache)
+
+    assert tokens == {
+        cached_user: [(cached_token_id, "cached_fcm")],
+        missing_user: [(fetched_token_id, "fetched_fcm")],
+    }
+    db.execute.assert_awaited_once()
+    cache.mset_json.assert_awaited_once_with(
+        {f"push_tokens:{missing_user}": [[str(fetched_token_id), "fetched_fcm"]]},
+        ttl=PUSH_TOKEN_CACHE_TTL,
+    )
+
+
+@pytest.mark.asyncio
+async def test_environment_cache_refetches_only_stale_half():
+    """Test a cached AQI with an expired weather entry only calls the Weather API."""
+    cache = MagicMock()
+    cache.mget_json.return_value = [{"aqi": 42, "aqi_category": "Good"}, None]
+    service = EnvironmentService(cache_manager=cache)
+    service._fetch_aqi = AsyncMock()
+    service._fetch_weather = AsyncMock(return_value={"temperature": 21.5, "condition": "Clear"})
+
+    result = await service.get_local_conditions(12.97, 77.59)
+
+    assert result.aqi == 42
+    assert result.temperature == 21.5
+    cache.mget_json.assert_called_once_with(["env:aqi:12.97:77.59", "env:weather:12.97:77.59"])
+    service._fetch_aqi.assert_not_called()
+    cache.set_json.assert_called_once_with(
+        "env:weather:12.97:77.59",
+        {"temperature": 21.5, "condition": "Clear"},
+        ttl=EnvironmentService.WEATHER_CACHE_TTL,
+    )
+
+
+def test_access_token_cache_hit_and_expiry(monkeypatch):
+    """Test decoded access tokens are cached until they expire."""
+    monkeypatch.setattr(security, "_access_token_cache", security.OrderedDict())
+    token = security.create_access_token({"sub": "user-1"})
+
+    payload = security.decode_access_token(token)
+    assert payload is not None
+    assert payload["sub"] == "user-1"
+    assert len(security._access_token_cache) == 1
+
+    # Cache hit: no second signature verification
+    decode = MagicMock(wraps=security._decode_access_token)
+    monkeypatch.setattr(security, "_decode_access_token", decode)
+    assert security.decode_access_token(token) == payload
+    decode.assert_not_called()
+
+    # Past exp the cached entry is not served; the token is verified again
+    monkeypatch.setattr(security.time, "time", lambda: payload["exp"] + 1)
+    security.decode_access_token(token)
+    decode.assert_called_once_with(token)
+
+
 @pytest.mark.asyncio
 async def test_user_caching(
     client: AsyncClient,
@@ -56,6 +56,33 @@ def admin_headers(admin_user) -> dict:
     return {"Authorization": f"Bearer {token}"}
 
 
+@pytest.fixture
+def fcm_send_all_succeed():
+    """Patch the FCM multicast call so every token in every message succeeds."""
+
+    def send(message):
+        response = MagicMock()
+        response.responses = [MagicMock(success=True) for _ in message.tokens]
+        return response
+
+    with patch(
+        "app.services.notification_service.messaging.send_each_for_multicast_async",
+        side_effect=send,
+    ) as mock_send:
+        yield mock_send
+
+
+@pytest.fixture
+async def patient_push_token(test_user: dict, db_session) -> str:
+    """Register one active Android FCM token for the test patient."""
+    fcm_token = "patient_token"
+    await db_session.execute(
+        insert(push_tokens).values(user_id=test_user["id"], fcm_token=fcm_token, platform="android")
+    )
+    await db_session.commit()
+    return fcm_token
+
+
 @pytest.mark.asyncio
 async def test_register_fcm_token(
     client: AsyncClient,
@@ -339,20 +366,20 @@ async def test_deactivate_all_tokens(
 
 
 @pytest.mark.asyncio
-@patch("app.services.notification_service.messaging.send_each_for_multicast")
+@patch("app.services.notification_service.messaging.send_each_for_multicast_async")
 async def test_send_notification_as_admin(
-    mock_send_each_for_multicast: AsyncMock,
+    mock_send_each_for_multicast_async: AsyncMock,
     client: AsyncClient,
     admin_headers: dict,
     test_user: dict,
     db_session,
 ) -> None:
     """Test sending notification as admin user."""
-    # Mock FCM send_each_for_multicast response
+    # Mock FCM send_each_for_multicast_async response
     mock_response = MagicMock()
     mock_response.success_count = 1
     mock_response.failure_count = 0
-    mock_send_each_for_multicast.return_value = mock_response
+    mock_send_each_for_multicast_async.return_value = mock_response
 
     # Register a token for test user
     token_data = {
@@ -411,9 +438,9 @@ async def test_send_notification_as_non_admin(
 
 
 @pytest.mark.asyncio
-@patch("app.services.notification_service.messaging.send_each_for_multicast")
+@patch("app.services.notification_service.messaging.send_each_for_multicast_async")
 async def test_send_notification_to_user_without_tokens(
-    mock_send_each_for_multicast: AsyncMock,
+    mock_send_each_for_multicast_async: AsyncMock,
     client: AsyncClient,
     admin_headers: dict,
     test_user: dict,
@@ -475,9 +502,9 @@ async def test_missing_fcm_token(
 
 
 @pytest.mark.asyncio
-@patch("app.services.notification_service.messaging.send_each_for_multicast")
+@patch("app.services.notification_service.messaging.send_each_for_multicast_async")
 async def test_fcm_send_failure_handling(
-    mock_send_each_for_multicast: AsyncMock,
+    mock_send_each_for_multicast_async: AsyncMock,
     client: AsyncClient,
     admin_headers: dict,
     test_user: dict,
@@ -485,7 +512,7 @@ async def test_fcm_send_failure_handling(
 ) -> None:
     """Test handling of FCM send failures."""
     # Mock FCM send to raise exception
-    mock_send_each_for_multicast.side_effect = Exception("FCM send failed")
+    mock_send_each_for_multicast_async.side_effect = Exception("FCM send failed")
 
     # Register a token
     await db_session.execute(
@@ -518,20 +545,20 @@ async def test_fcm_send_failure_handling(
 
 
 @pytest.mark.asyncio
-@patch("app.services.notification_service.messaging.send_each_for_multicast")
+@patch("app.services.notification_service.messaging.send_each_for_multicast_async")
 async def test_send_notification_with_custom_data(
-    mock_send_each_for_multicast: AsyncMock,
+    mock_send_each_for_multicast_async: AsyncMock,
     client: AsyncClient,
     admin_headers: dict,
     test_user: dict,
     db_session,
 ) -> None:
     """Test sending notification with custom data payload."""
-    # Mock FCM send_each_for_multicast response
+    # Mock FCM send_each_for_multicast_async response
     mock_response = MagicMock()
     mock_response.success_count = 1
     mock_response.failure_count = 0
-    mock_send_each_for_multicast.return_value = mock_response
+    mock_send_each_for_multicast_async.return_value = mock_response
 
     # Register token
     await db_session.execute(
@@ -569,13 +596,13 @@ async def test_send_notification_with_custom_data(
     assert "message" in data
 
     # Verify the mock was called
-    mock_send_each_for_multicast.assert_called()
+    mock_send_each_for_multicast_async.assert_called()
 
 
 @pytest.mark.asyncio
-@patch("app.services.notification_service.messaging.send_each_for_multicast")
+@patch("app.services.notification_service.messaging.send_each_for_multicast_async")
 async def test_admin_send_with_valid_secret(
-    mock_send_each_for_multicast: AsyncMock,
+    mock_send_each_for_multicast_async: AsyncMock,
     client: AsyncClient,
     test_user: dict,
     db_session,
@@ -583,11 +610,11 @@ async def test_admin_send_with_valid_secret(
     """Test admin send endpoint with valid secret key."""
     from app.config import settings
 
-    # Mock FCM send_each_for_multicast response
+    # Mock FCM send_each_for_multicast_async response
     mock_response = MagicMock()
     mock_response.success_count = 1
     mock_response.failure_count = 0
-    mock_send_each_for_multicast.return_value = mock_response
+    mock_send_each_for_multicast_async.return_value = mock_response
 
     # Register a token for test user
     await db_session.execute(
@@ -1457,3 +1484,164 @@ async def test_get_notification_stats_admin_sees_global(
     assert response.status_code == 200
     admin_data = response.json()
     assert admin_data["total_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_send_bulk_records_per_user_outcome(
+    fcm_send_all_succeed: AsyncMock,
+    patient_push_token: str,
+    test_user: dict,
+    admin_user: dict,
+    db_session,
+) -> None:
+    """send_bulk sends one multicast for all tokens and records each user's outcome."""
+    from app.models.notifications import notifications
+    from app.services.notification_service import NotificationService
+
+    success, failure = await NotificationService.send_bulk(
+        db_session,
+        [test_user["id"], str(admin_user["id"])],
+        title="Announcement",
+        body="Hello",
+    )
+
+    assert (success, failure) == (1, 0)
+    assert fcm_send_all_succeed.call_count == 1
+    result = await db_session.execute(select(notifications.c.user_id, notifications.c.status))
+    statuses = {row.user_id: row.status for row in result}
+    assert statuses == {test_user["id"]: "delivered", admin_user["id"]: "failed"}
+
+
+@pytest.mark.asyncio
+async def test_send_bulk_beyond_bind_parameter_limit(
+    fcm_send_all_succeed: AsyncMock,
+    test_user: dict,
+    db_session,
+) -> None:
+    """A fan-out whose (notification, token) pairs exceed asyncpg's 32767 binds completes."""
+    from app.models.notifications import notification_deliveries, notifications
+    from app.services.notification_service import FCM_MULTICAST_LIMIT, NotificationService
+
+    # Two binds per delivery pair would need 32768 parameters
+    token_count = 32767 // 2 + 1
+    await db_session.execute(
+        insert(push_tokens),
+        [
+            {"user_id": test_user["id"], "fcm_token": f"token_{i}", "platform": "android"}
+            for i in range(token_count)
+        ],
+    )
+    await db_session.commit()
+
+    success, failure = await NotificationService.send_bulk(
+        db_session, [test_user["id"]], title="Announcement", body="Hello"
+    )
+
+    assert (success, failure) == (token_count, 0)
+    assert fcm_send_all_succeed.call_count == -(-token_count // FCM_MULTICAST_LIMIT)
+    result = await db_session.execute(select(notification_deliveries.c.delivery_status))
+    assert set(result.scalars().all()) == {"sent"}
+    result = await db_session.execute(select(notifications.c.status))
+    assert result.scalars().all() == ["delivered"]
+
+
+@pytest.mark.asyncio
+async def test_send_appointment_reminders_batch(
+    fcm_send_all_succeed: AsyncMock,
+    patient_push_token: str,
+    test_user: dict,
+    db_session,
+) -> None:
+    """Batched reminders record one notification per appointment with its own content."""
+    from datetime import UTC, datetime
+
+    from app.models.notifications import notifications
+    from app.services.notification_service import NotificationService
+
+    appointment_at = datetime(2030, 1, 2, 9, 30, tzinfo=UTC)
+    items = [
+        (
+            str(test_user["id"]),
+            {"id": uuid4(), "doctor_name": name, "appointment_at": appointment_at},
+        )
+        for name in ("Dr. A", "Dr. B")
+    ]
+    success, failure = await NotificationService.send_appointment_reminders(
+        db_session, items, hours_before=24
+    )
+
+    assert (success, failure) == (2, 0)
+    assert fcm_send_all_succeed.call_count == 2
+    result = await db_session.execute(
+        select(notifications.c.body, notifications.c.status, notifications.c.priority)
+    )
+    rows = sorted(result.all())
+    assert [row.status for row in rows] == ["delivered", "delivered"]
+    assert rows[0].body == "Reminder: Appointment with Dr. A tomorrow at Jan 02 at 09:30 AM"
+    assert {row.priority for row in rows} == {"normal"}
+
+
+@pytest.mark.asyncio
+async def test_deactivate_for_users(
+    test_user: dict,
+    admin_user: dict,
+    db_session,
+) -> None:
+    """deactivate_for_users deactivates every token of every given user in one statement."""
+    from app.services.notification_service import NotificationService
+
+    await db_session.execute(
+        insert(push_tokens),
+        [
+            {"user_id": test_user["id"], "fcm_token": "patient_android", "platform": "android"},
+            {"user_id": test_user["id"], "fcm_token": "patient_web", "platform": "web"},
+            {"user_id": admin_user["id"], "fcm_token": "admin_ios", "platform": "ios"},
+        ],
+    )
+    await db_session.commit()
+
+    count = await NotificationService.deactivate_for_users(
+        db_session, [str(test_user["id"]), admin_user["id"]]
+    )
+
+    assert count == 3
+    result = await db_session.execute(
+        select(push_tokens).where(push_tokens.c.is_active == True)  # noqa: E712
+    )
+    assert result.fetchall() == []
+
+
+@pytest.mark.asyncio
+@patch("app.services.notification_service.messaging.send_each_for_multicast_async")
+async def test_send_to_user_copies_large_delivery_batch(
+    mock_send_each_for_multicast_async: AsyncMock,
+    test_user: dict,
+    db_session,
+) -> None:
+    """Delivery records above the COPY threshold are all written and updated."""
+    from app.models.notifications import notification_deliveries
+    from app.services.notification_service import DELIVERY_COPY_THRESHOLD, NotificationService
+
+    await db_session.execute(
+        insert(push_tokens),
+        [
+            {"user_id": test_user["id"], "fcm_token": f"token_{i}", "platform": "android"}
+            for i in range(DELIVERY_COPY_THRESHOLD)
+        ],
+    )
+    await db_session.commit()
+
+    mock_response = MagicMock()
+    mock_response.success_count = DELIVERY_COPY_THRESHOLD
+    mock_response.failure_count = 0
+    mock_send_each_for_multicast_async.return_value = mock_response
+
+    success, failure = await NotificationService.send_to_user(
+        db_session, test_user["id"], title="Hello", body="World"
+    )
+
+    assert (success, failure) == (DELIVERY_COPY_THRESHOLD, 0)
+    result = await db_session.execute(select(notification_deliveries.c.delivery_status))
+    statuses = result.scalars().all()
+    assert len(statuses) == DELIVERY_COPY_THRESHOLD
+    assert set(statuses) == {"sent"}